@@ -1,26 +1,42 @@
 import heapq
+import itertools
 from utils.state import PuzzleState
 from utils.moves import get_possible_moves, get_path
-from utils.heuristics import manhattan_distance, misplaced_tiles
+from utils.heuristics import get_heuristic, manhattan_distance
+from utils.packed import manhattan_table
+from utils.tracing import attach_trace
+from utils.solvability import is_solvable, unsolvable_result
 
-def astar_search(start_board, goal_board, heuristic='manhattan'):
+# Blank moves in get_possible_moves order: (name, row change, column change)
+DIRECTIONS = (("Up", -1, 0), ("Down", 1, 0), ("Left", 0, -1), ("Right", 0, 1))
+
+def astar_search(start_board, goal_board, heuristic='manhattan', tracer=None, partial_expansion=False):
     """
     A* Search for 8-Puzzle
     :param start_board: Starting board configuration
     :param goal_board: Goal board configuration
-    :param heuristic: 'manhattan' or 'misplaced'
-    :return: Dictionary with results
+    :param heuristic: 'manhattan', 'misplaced', 'linear_conflict' or 'walking_distance'
+    :param tracer: Optional SearchTracer for event counts and frontier samples
+    :param partial_expansion: Use Enhanced Partial Expansion A* (Manhattan only)
+    :return: Dictionary with results, including nodes_generated and peak_open
     """
+    if not is_solvable(start_board, goal_board):
+        return unsolvable_result()
+    if partial_expansion:
+        if heuristic != 'manhattan':
+            raise ValueError("partial_expansion needs a heuristic whose per-move change is known "
+                             "from the moved tile alone ('manhattan')")
+        return epea_search(start_board, goal_board, tracer)
+    
     start_state = PuzzleState(start_board)
+    if tracer is not None:
+        tracer.start()
     
     if start_state.board == goal_board:
         return {"path": [], "nodes_expanded": 0}
     
     # Choose heuristic function
-    if heuristic == 'manhattan':
-        h_func = lambda s: manhattan_distance(s, goal_board)
-    else:
-        h_func = lambda s: misplaced_tiles(s, goal_board)
+    h_func = get_heuristic(heuristic, goal_board)
     
     # Initialize start state
     start_state.h = h_func(start_state)
@@ -35,6 +51,8 @@ def astar_search(start_board, goal_board, heuristic='manhattan'):
     closed_set = set()
     
     nodes_expanded = 0
+    nodes_generated = 0
+    peak_open = 1
     
     while open_list:
         # Get state with lowest f value
@@ -47,23 +65,30 @@ def astar_search(start_board, goal_board, heuristic='manhattan'):
         
         # Check if goal is reached
         if current_state.board == goal_board:
-            return {
+            return attach_trace({
                 "path": get_path(current_state),
                 "nodes_expanded": nodes_expanded,
                 "path_length": current_state.g,
-                "solution_found": True
-            }
+                "solution_found": True,
+                "nodes_generated": nodes_generated,
+                "peak_open": peak_open
+            }, tracer)
         
         # Add to closed set
         closed_set.add(current_key)
         nodes_expanded += 1
+        if tracer is not None:
+            tracer.on_expand(len(open_list), len(closed_set), current_f)
         
         # Generate successors
         for move_name, next_state in get_possible_moves(current_state):
+            nodes_generated += 1
             next_key = tuple(map(tuple, next_state.board))
             
             # Skip if in closed set
             if next_key in closed_set:
+                if tracer is not None:
+                    tracer.on_duplicate()
                 continue
             
             # Calculate f value
@@ -82,9 +107,126 @@ def astar_search(start_board, goal_board, heuristic='manhattan'):
                     
                     # Re-heapify
                     heapq.heapify(open_list)
+                    if tracer is not None:
+                        tracer.on_decrease_key()
+                elif tracer is not None:
+                    tracer.on_duplicate()
             else:
                 # Add to open list
                 heapq.heappush(open_list, (next_state.f, next_state))
                 open_dict[next_key] = next_state
+                if tracer is not None:
+                    tracer.on_generate()
+        peak_open = max(peak_open, len(open_list))
     
-    return {"solution_found": False, "nodes_expanded": nodes_expanded}
+    return attach_trace({"solution_found": False, "nodes_expanded": nodes_expanded}, tracer)
+
+def delta_f_table(goal_board):
+    """
+    EPEA* operator table: change of f = g + Manhattan when a tile slides into the blank
+    :return: table[blank][target][tile], 0 (tile moves toward its goal) or 2 (away from it),
+             for cell indices blank and target
+    """
+    width = len(goal_board)
+    dist = manhattan_table(goal_board)
+    cells = width * width
+    return [[[1 + dist[tile][blank] - dist[tile][target] for tile in range(cells)]
+             for target in range(cells)] for blank in range(cells)]
+
+def epea_search(start_board, goal_board, tracer=None):
+    """
+    Enhanced Partial Expansion A* with Manhattan distance
+    A node is stored with a value F, starting at its f. Expanding it generates only
+    the children whose f equals F, read from the delta_f_table without building the
+    others, and re-inserts the node with the next larger child f. Children that would
+    never be popped are never copied, evaluated or pushed.
+    :return: Dictionary with results; nodes_generated counts children actually built,
+             full_expansion_generated the children plain A* builds for the same expanded
+             nodes, plus generated_reduction, reexpansions and peak_open
+    """
+    start_state = PuzzleState(start_board)
+    if tracer is not None:
+        tracer.start()
+
+    width = len(start_board)
+    table = delta_f_table(goal_board)
+    start_state.h = manhattan_distance(start_state, goal_board)
+    start_state.f = start_state.h
+
+    tie = itertools.count()
+    open_list = [(start_state.f, 0, next(tie), start_state)]  # (F, -g, order, state): deepest first on ties
+    best_g = {tuple(map(tuple, start_board)): 0}
+
+    nodes_expanded = 0        # distinct nodes, as in plain A*
+    reexpansions = 0          # later partial expansions of a node already counted
+    nodes_generated = 0
+    full_expansion_generated = 0
+    peak_open = 1
+
+    while open_list:
+        stored_f, _, _, state = heapq.heappop(open_list)
+        if state.g > best_g[tuple(map(tuple, state.board))]:
+            continue  # reached again by a shorter path
+
+        first = stored_f == state.f
+        if first and state.board == goal_board:
+            return attach_trace({
+                "path": get_path(state),
+                "nodes_expanded": nodes_expanded,
+                "path_length": state.g,
+                "solution_found": True,
+                "nodes_generated": nodes_generated,
+                "full_expansion_generated": full_expansion_generated,
+                "generated_reduction": (1 - nodes_generated / full_expansion_generated
+                                        if full_expansion_generated else 0.0),
+                "reexpansions": reexpansions,
+                "peak_open": peak_open
+            }, tracer)
+
+        blank_row, blank_col = state.get_blank_position()
+        blank = blank_row * width + blank_col
+        if first:
+            nodes_expanded += 1
+        else:
+            reexpansions += 1
+        if tracer is not None:
+            tracer.on_expand(len(open_list), len(best_g), stored_f)
+
+        next_f = None
+        for move_name, row_change, col_change in DIRECTIONS:
+            row, col = blank_row + row_change, blank_col + col_change
+            if not (0 <= row < width and 0 <= col < width):
+                continue
+            if first:
+                full_expansion_generated += 1
+            tile = state.board[row][col]
+            child_f = state.f + table[blank][row * width + col][tile]
+            if child_f > stored_f:
+                if next_f is None or child_f < next_f:
+                    next_f = child_f
+                continue
+            if child_f < stored_f:
+                continue  # generated by an earlier partial expansion
+
+            board = [r[:] for r in state.board]
+            board[blank_row][blank_col], board[row][col] = tile, 0
+            nodes_generated += 1
+            key = tuple(map(tuple, board))
+            g = state.g + 1
+            if g >= best_g.get(key, g + 1):
+                if tracer is not None:
+                    tracer.on_duplicate()
+                continue
+            best_g[key] = g
+            child = PuzzleState(board, parent=state, move=move_name, g=g)
+            child.h = child_f - g
+            child.f = child_f
+            heapq.heappush(open_list, (child_f, -g, next(tie), child))
+            if tracer is not None:
+                tracer.on_generate()
+
+        if next_f is not None:
+            heapq.heappush(open_list, (next_f, -state.g, next(tie), state))
+        peak_open = max(peak_open, len(open_list))
+
+    return attach_trace({"solution_found": False, "nodes_expanded": nodes_expanded}, tracer)
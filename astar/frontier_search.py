@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Breadth-first heuristic search with divide-and-conquer path recovery
+
+The search runs breadth-first, layer by layer, and prunes every node whose
+f = g + h (Manhattan) exceeds an upper bound. If the goal is not found, the
+bound is raised to the smallest pruned f and the search repeats. No closed list
+is kept. The sliding-tile graph is undirected and bipartite, so a child can
+only duplicate a node of the previous layer or of the layer being built. Only
+those two layers and the current one are stored.
+
+Without parent pointers, each node in the second half of the search carries
+its relay: its ancestor at depth length // 2. When the goal is reached, its
+relay is a state on an optimal path. The two halves are then solved
+recursively with their exact lengths as the bound. Short segments are finished
+with a bidirectional BFS. Peak memory is about three layers of the bounded
+search instead of every state A* has seen.
+"""
+
+from utils.corpus import pack_board, unpack_board
+from utils.inplace import MOVE_NAMES, neighbor_table
+from utils.packed import blank_index, manhattan_table, packed_manhattan
+from utils.path_optimizer import shortest_between
+from utils.tracing import attach_trace
+from utils.solvability import is_solvable, unsolvable_result
+
+# Segments up to this many moves are solved directly by bidirectional BFS
+BASE_LENGTH = 6
+
+def _bounded_layers(source, target, bound, relay_depth, ctx, tracer=None):
+    """
+    One breadth-first pass with f = g + h <= bound
+    :return: (depth of target or None, relay of target, smallest pruned f)
+    """
+    dist = ctx["dist"][target]
+    cells, table = ctx["cells"], ctx["table"]
+    previous = {}
+    current = {source: source if relay_depth == 0 else None}
+    next_bound = float('inf')
+    depth = 0
+
+    while current:
+        if target in current:
+            return depth, current[target], next_bound
+
+        following = {}
+        child_g = depth + 1
+        for state, relay in current.items():
+            ctx["expanded"] += 1
+            if tracer is not None:
+                tracer.on_expand(len(following), len(previous) + len(current), bound)
+            blank = blank_index(state)
+            for _, position in table[blank]:
+                tile = (state >> (4 * position)) & 0xF
+                child = state + (tile << (4 * blank)) - (tile << (4 * position))
+                if child in previous or child in following:
+                    if tracer is not None:
+                        tracer.on_duplicate()
+                    continue
+                f = child_g + packed_manhattan(child, cells, dist)
+                if f > bound:
+                    next_bound = min(next_bound, f)
+                    continue
+                following[child] = child if child_g == relay_depth else relay
+                if tracer is not None:
+                    tracer.on_generate()
+
+        ctx["peak"] = max(ctx["peak"], len(previous) + len(current) + len(following))
+        previous, current = current, following
+        depth = child_g
+
+    return None, None, next_bound
+
+def _distances(ctx, target):
+    if target not in ctx["dist"]:
+        ctx["dist"][target] = manhattan_table(unpack_board(target, ctx["width"]))
+    return ctx["dist"][target]
+
+def _segment(source, target, length, ctx):
+    """States after each move of an optimal path of known `length` (source excluded)"""
+    if length <= BASE_LENGTH:
+        return [state for _, state in shortest_between(source, target, length, ctx["table"])]
+
+    _distances(ctx, target)
+    ctx["relay_searches"] += 1
+    middle = length // 2
+    _, relay, _ = _bounded_layers(source, target, length, middle, ctx)
+    return _segment(source, relay, middle, ctx) + _segment(relay, target, length - middle, ctx)
+
+def _move_between(before, after, table):
+    """Name of the move that turns `before` into the adjacent state `after`"""
+    blank = blank_index(before)
+    for move, position in table[blank]:
+        tile = (before >> (4 * position)) & 0xF
+        if before + (tile << (4 * blank)) - (tile << (4 * position)) == after:
+            return MOVE_NAMES[move]
+    raise ValueError("states are not adjacent")
+
+def frontier_search(start_board, goal_board, tracer=None):
+    """
+    Memory-lean optimal search: breadth-first heuristic search with divide-and-conquer paths
+    :param start_board: Starting board configuration
+    :param goal_board: Goal board configuration
+    :param tracer: Optional SearchTracer for event counts and frontier samples
+    :return: Dictionary with results, plus peak_stored_states (most states held at once),
+             iterations (upper bounds tried) and relay_searches (divide-and-conquer searches);
+             nodes_expanded counts the bounded passes, not the short BFS segments
+    """
+    if not is_solvable(start_board, goal_board):
+        return unsolvable_result()
+    if tracer is not None:
+        tracer.start()
+
+    width = len(start_board)
+    start, goal = pack_board(start_board), pack_board(goal_board)
+    ctx = {"width": width, "cells": width * width, "table": neighbor_table(width),
+           "dist": {}, "expanded": 0, "peak": 1, "relay_searches": 0}
+    dist = _distances(ctx, goal)
+
+    # Raise the bound until the goal lies within it; the bound is then the optimal length
+    bound = packed_manhattan(start, ctx["cells"], dist)
+    iterations = 0
+    while True:
+        iterations += 1
+        length, relay, next_bound = _bounded_layers(start, goal, bound, bound // 2, ctx, tracer)
+        if length is not None:
+            break
+        bound = next_bound
+
+    if length <= BASE_LENGTH:
+        states = _segment(start, goal, length, ctx)
+    else:
+        middle = length // 2
+        states = _segment(start, relay, middle, ctx) + _segment(relay, goal, length - middle, ctx)
+
+    path = []
+    before = start
+    for state in states:
+        path.append((_move_between(before, state, ctx["table"]), unpack_board(state, width)))
+        before = state
+
+    return attach_trace({
+        "path": path,
+        "nodes_expanded": ctx["expanded"],
+        "path_length": len(path),
+        "solution_found": True,
+        "peak_stored_states": ctx["peak"],
+        "iterations": iterations,
+        "relay_searches": ctx["relay_searches"]
+    }, tracer)
+
+def compare_memory(instances, memory_mode='full'):
+    """
+    Peak memory and work of frontier search against A* (Manhattan) on the same instances
+    :param instances: List of (name, start_board, goal_board)
+    :return: List of row dicts
+    """
+    from astar.astar import astar_search
+    from utils.memory import measure_run
+
+    rows = []
+    for name, start, goal in instances:
+        frontier = measure_run(frontier_search, start, goal, memory_mode=memory_mode)
+        astar = measure_run(astar_search, start, goal, 'manhattan', memory_mode=memory_mode)
+        rows.append({
+            "instance": name,
+            "path_length": frontier["path_length"],
+            "astar_path_length": astar["path_length"],
+            "frontier_peak_memory": frontier.get("peak_memory_bytes"),
+            "astar_peak_memory": astar.get("peak_memory_bytes"),
+            "peak_stored_states": frontier["peak_stored_states"],
+            "frontier_nodes": frontier["nodes_expanded"],
+            "astar_nodes": astar["nodes_expanded"],
+            "frontier_time": frontier["time_taken"],
+            "astar_time": astar["time_taken"]
+        })
+    return rows
+
+def main(argv=None):
+    import argparse
+    import random
+    from test_cases import TEST_CASES
+    from utils.generator import GOAL_BOARD, boards_at_depth
+
+    parser = argparse.ArgumentParser(description="Frontier search vs A* peak memory")
+    parser.add_argument("--depths", nargs="+", type=int, default=[20, 24, 26],
+                        help="Optimal depths of extra random instances")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    instances = [("very_hard", TEST_CASES["very_hard"]["start"], TEST_CASES["very_hard"]["goal"])]
+    rng = random.Random(args.seed)
+    for depth in args.depths:
+        for board in boards_at_depth(depth, 1, rng, GOAL_BOARD):
+            instances.append((f"depth {depth}", board, GOAL_BOARD))
+
+    print(f"{'Instance':<11} {'Len':<4} {'Frontier Mem':<13} {'A* Mem':<13} {'Ratio':<6} "
+          f"{'Stored':<8} {'Frontier Nodes':<15} {'A* Nodes':<9} {'Frontier (s)':<13} {'A* (s)':<8}")
+    print("-" * 110)
+    for row in compare_memory(instances):
+        ratio = row["frontier_peak_memory"] / row["astar_peak_memory"]
+        print(f"{row['instance']:<11} {row['path_length']:<4} {row['frontier_peak_memory']:<13,} "
+              f"{row['astar_peak_memory']:<13,} {ratio:<6.2f} {row['peak_stored_states']:<8,} "
+              f"{row['frontier_nodes']:<15,} {row['astar_nodes']:<9,} {row['frontier_time']:<13.3f} "
+              f"{row['astar_time']:<8.3f}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,318 @@
+"""
+Hash-Distributed A* (HDA*) across processes
+
+Every state is owned by the worker its hash maps to. Each worker keeps its own
+open list and g-table, expands its cheapest node, and ships successors owned by
+other workers to them in batches over multiprocessing queues.
+
+Optimality: a worker never expands a node with f >= the best solution cost
+found so far (the shared incumbent), and the search stops only once every
+worker is idle (no node with f < incumbent) and no batch is in flight. At that
+point no cheaper solution can exist, so the incumbent is optimal.
+"""
+
+import heapq
+import multiprocessing as mp
+import os
+import queue
+import random
+import time
+from utils.corpus import pack_board, unpack_board
+from utils.inplace import MOVE_NAMES, neighbor_table
+from utils.packed import blank_index, manhattan_table, packed_manhattan
+from utils.solvability import is_solvable, unsolvable_result
+
+NO_SOLUTION = 2 ** 31 - 1
+EXPANSIONS_PER_POLL = 32  # nodes expanded between inbox checks
+
+def owner(state, workers):
+    """Worker that owns a packed state (multiplicative hash, so neighbours spread out)"""
+    return (((state * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 32) % workers
+
+def _hda_worker(index, workers, start, goal, goal_board, inboxes, results, incumbent,
+                idle, activity, sent, received, batch_size):
+    """Worker process body: run A* over the states this worker owns"""
+    width = len(goal_board)
+    cells = width * width
+    table = neighbor_table(width)
+    dist = manhattan_table(goal_board)
+    inbox = inboxes[index]
+
+    open_list = []       # (f, -g, state): deeper nodes first among equal f
+    best_g = {}          # state -> lowest g seen
+    parent = {}          # state -> (parent state, move index)
+    outgoing = [[] for _ in range(workers)]
+    expanded = generated = duplicates = reopened = batches = 0
+
+    def flush(target):
+        nonlocal batches
+        batch = outgoing[target]
+        if batch:
+            outgoing[target] = []
+            sent[index] += 1  # counted before the put so in-flight batches are visible
+            inboxes[target].put(("nodes", batch))
+            batches += 1
+
+    def receive(state, g, h, parent_state, move):
+        nonlocal duplicates, reopened
+        known = best_g.get(state)
+        if known is not None and known <= g:
+            duplicates += 1
+            return
+        if known is not None:
+            reopened += 1
+        best_g[state] = g
+        parent[state] = (parent_state, move)
+        heapq.heappush(open_list, (g + h, -g, state))
+
+    def handle(message):
+        kind, payload = message
+        if kind == "nodes":
+            if idle[index]:
+                # Becoming active is announced before the receipt is counted (see _terminated)
+                with activity.get_lock():
+                    activity.value += 1
+                idle[index] = 0
+            received[index] += 1
+            for node in payload:
+                receive(*node)
+        elif kind == "trace":
+            results.put(("parent", payload, parent.get(payload)))
+        elif kind == "stop":
+            results.put(("stats", index, {
+                "nodes_expanded": expanded,
+                "nodes_generated": generated,
+                "duplicates": duplicates,
+                "reopened": reopened,
+                "batches_sent": batches,
+                "states_owned": len(best_g)
+            }))
+            return True
+        return False
+
+    if owner(start, workers) == index:
+        receive(start, 0, packed_manhattan(start, cells, dist), None, None)
+
+    while True:
+        # Drain whatever has arrived without blocking
+        while True:
+            try:
+                message = inbox.get_nowait()
+            except queue.Empty:
+                break
+            if handle(message):
+                return
+
+        for _ in range(EXPANSIONS_PER_POLL):
+            # Drop stale entries and anything that cannot beat the incumbent
+            while open_list and (open_list[0][0] >= incumbent.value or
+                                 -open_list[0][1] > best_g[open_list[0][2]]):
+                heapq.heappop(open_list)
+            if not open_list:
+                break
+
+            f, negative_g, state = heapq.heappop(open_list)
+            g = -negative_g
+            if state == goal:
+                with incumbent.get_lock():
+                    if g < incumbent.value:
+                        incumbent.value = g
+                continue
+
+            expanded += 1
+            h = f - g
+            blank = blank_index(state)
+            parent_state = parent[state][0]
+            for move, target in table[blank]:
+                tile = (state >> (4 * target)) & 0xF
+                child = state + (tile << (4 * blank)) - (tile << (4 * target))
+                if child == parent_state:
+                    continue
+                generated += 1
+                child_h = h + dist[tile][blank] - dist[tile][target]
+                destination = owner(child, workers)
+                if destination == index:
+                    receive(child, g + 1, child_h, state, move)
+                else:
+                    outgoing[destination].append((child, g + 1, child_h, state, move))
+                    if len(outgoing[destination]) >= batch_size:
+                        flush(destination)
+
+        if open_list:
+            continue
+
+        # Out of useful work: ship everything buffered, then wait for more
+        for target in range(workers):
+            flush(target)
+        idle[index] = 1
+        try:
+            message = inbox.get(timeout=0.05)
+        except queue.Empty:
+            continue
+        if handle(message):
+            return
+
+def _terminated(idle, activity, sent, received):
+    """
+    True when every worker is idle and no batch is in flight
+    A worker woken by a batch bumps `activity` before counting the receipt, so an
+    unchanged activity count across the snapshot means no worker woke up during it.
+    """
+    before = activity.value
+    if not all(idle):
+        return False
+    if sum(sent) != sum(received):
+        return False
+    return activity.value == before
+
+def hda_star_search(start_board, goal_board, workers=None, batch_size=64, timeout=None):
+    """
+    Hash-Distributed A* with the Manhattan distance heuristic
+    :param start_board: Starting board configuration (width up to 4)
+    :param goal_board: Goal board configuration
+    :param workers: Worker processes (defaults to CPU count)
+    :param batch_size: Successors buffered per destination before a batch is sent
+    :param timeout: Optional wall-clock limit in seconds
+    :return: Dictionary with results, including per-worker statistics
+    """
+    if not is_solvable(start_board, goal_board):
+        return unsolvable_result()
+
+    width = len(start_board)
+    workers = max(1, workers or os.cpu_count() or 1)
+    start = pack_board(start_board)
+    goal = pack_board(goal_board)
+    if start == goal:
+        return {"path": [], "nodes_expanded": 0, "path_length": 0, "solution_found": True,
+                "workers": workers}
+
+    ctx = mp.get_context()
+    inboxes = [ctx.Queue() for _ in range(workers)]
+    results = ctx.Queue()
+    incumbent = ctx.Value('i', NO_SOLUTION)
+    activity = ctx.Value('q', 0)
+    idle = ctx.Array('i', workers, lock=False)
+    sent = ctx.Array('q', workers, lock=False)
+    received = ctx.Array('q', workers, lock=False)
+
+    processes = [ctx.Process(target=_hda_worker,
+                             args=(i, workers, start, goal, goal_board, inboxes, results, incumbent,
+                                   idle, activity, sent, received, batch_size),
+                             daemon=True)
+                 for i in range(workers)]
+    started = time.perf_counter()
+    for process in processes:
+        process.start()
+
+    timed_out = False
+    while not _terminated(idle, activity, sent, received):
+        if timeout is not None and time.perf_counter() - started > timeout:
+            timed_out = True
+            break
+        time.sleep(0.001)
+    search_time = time.perf_counter() - started
+
+    # Walk parent pointers back from the goal, asking each state's owner in turn
+    states = []
+    if not timed_out and incumbent.value != NO_SOLUTION:
+        state = goal
+        while state != start:
+            inboxes[owner(state, workers)].put(("trace", state))
+            _, _, link = results.get()
+            states.append((state, link[1]))
+            state = link[0]
+        states.reverse()
+
+    for inbox in inboxes:
+        inbox.put(("stop", None))
+    worker_stats = [None] * workers
+    for _ in range(workers):
+        _, index, stats = results.get()
+        worker_stats[index] = stats
+    for process in processes:
+        process.join()
+
+    result = {
+        "solution_found": bool(states),
+        "nodes_expanded": sum(s["nodes_expanded"] for s in worker_stats),
+        "nodes_generated": sum(s["nodes_generated"] for s in worker_stats),
+        "workers": workers,
+        "worker_stats": worker_stats,
+        "batches_sent": sum(s["batches_sent"] for s in worker_stats),
+        "search_time": search_time
+    }
+    if timed_out:
+        result["timed_out"] = True
+    if states:
+        result["path"] = [(MOVE_NAMES[move], unpack_board(state, width)) for state, move in states]
+        result["path_length"] = len(states)
+    return result
+
+def random_walk_board(goal_board, steps, seed=0):
+    """Board reached by a seeded random walk of `steps` blank moves from the goal"""
+    rng = random.Random(seed)
+    width = len(goal_board)
+    table = neighbor_table(width)
+    state = pack_board(goal_board)
+    previous = None
+    for _ in range(steps):
+        blank = blank_index(state)
+        choices = [target for _, target in table[blank] if target != previous]
+        target = rng.choice(choices)
+        tile = (state >> (4 * target)) & 0xF
+        state = state + (tile << (4 * blank)) - (tile << (4 * target))
+        previous = blank
+    return unpack_board(state, width)
+
+def scaling_report(instances, worker_counts=(1, 2, 4, 8), batch_size=64):
+    """
+    Speedup and search overhead of HDA* per worker count
+    :param instances: Dict of name -> (start_board, goal_board)
+    :param worker_counts: Worker counts to compare; the first is the baseline
+    :return: List of row dicts (instance, workers, time, speedup, nodes, overhead, path_length)
+    """
+    rows = []
+    for name, (start_board, goal_board) in instances.items():
+        baseline = None
+        for workers in worker_counts:
+            result = hda_star_search(start_board, goal_board, workers, batch_size)
+            if baseline is None:
+                baseline = result
+            rows.append({
+                "instance": name,
+                "workers": workers,
+                "time": result["search_time"],
+                "speedup": baseline["search_time"] / result["search_time"],
+                "nodes_expanded": result["nodes_expanded"],
+                "search_overhead": result["nodes_expanded"] / max(1, baseline["nodes_expanded"]),
+                "path_length": result.get("path_length")
+            })
+    return rows
+
+def main(argv=None):
+    import argparse
+    from test_cases import TEST_CASES
+    from utils.solvability import default_goal
+
+    parser = argparse.ArgumentParser(description="HDA* speedup and search overhead")
+    parser.add_argument("--workers", nargs="+", type=int, default=[1, 2, 4, 8])
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--walk", type=int, default=50, help="Random-walk length of the 4x4 instance")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    goal_4x4 = default_goal(4)
+    instances = {
+        "3x3 very_hard": (TEST_CASES["very_hard"]["start"], TEST_CASES["very_hard"]["goal"]),
+        f"4x4 walk {args.walk}": (random_walk_board(goal_4x4, args.walk, args.seed), goal_4x4)
+    }
+
+    print(f"CPUs available: {os.cpu_count()}")
+    print(f"{'Instance':<18} {'Workers':>7} {'Time (s)':>9} {'Speedup':>8} {'Nodes':>10} {'Overhead':>9} {'Len':>4}")
+    for row in scaling_report(instances, args.workers, args.batch_size):
+        print(f"{row['instance']:<18} {row['workers']:>7} {row['time']:>9.3f} {row['speedup']:>8.2f} "
+              f"{row['nodes_expanded']:>10,} {row['search_overhead']:>9.2f} {row['path_length']:>4}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
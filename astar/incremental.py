@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Incremental hint session
+
+Successive hint requests differ by one player move, so a session keeps what
+earlier searches learned instead of starting over:
+
+- Path reuse: every state on a path already proven optimal keeps its exact
+  distance and best move. A hint for such a state needs no search, and a new
+  search stops as soon as it pops a state whose exact distance is known.
+- Learned heuristic (Adaptive A*): after a search of cost C, every expanded
+  state s gets h(s) = C - g(s). This stays admissible and consistent and is
+  never smaller than Manhattan, so later searches expand fewer nodes.
+
+The goal is fixed and the graph never changes, so this is enough to keep every
+hint optimal without the bookkeeping of LPA* or D* Lite.
+"""
+
+import heapq
+import random
+import statistics
+import time
+from utils.corpus import pack_board, unpack_board
+from utils.inplace import MOVE_NAMES, INVERSE, neighbor_table
+from utils.packed import blank_index, manhattan_table, packed_manhattan
+from utils.solvability import is_solvable
+
+class HintSession:
+    """Stateful optimal-hint solver for one goal board"""
+
+    def __init__(self, goal_board, board=None):
+        self.width = len(goal_board)
+        self.cells = self.width * self.width
+        self.goal_board = [row[:] for row in goal_board]
+        self.goal = pack_board(goal_board)
+        self.table = neighbor_table(self.width)
+        self.dist = manhattan_table(goal_board)
+        self.board = [row[:] for row in (board or goal_board)]
+        self.reset()
+
+    def reset(self):
+        """Forget everything learned so far"""
+        self.exact = {self.goal: (0, None)}  # state -> (distance, move index on an optimal path)
+        self.learned = {}                    # state -> learned admissible h
+        self.stats = {"hints": 0, "searches": 0, "reused": 0, "nodes_expanded": 0}
+
+    def _h(self, state):
+        known = self.exact.get(state)
+        if known is not None:
+            return known[0]
+        return max(packed_manhattan(state, self.cells, self.dist), self.learned.get(state, 0))
+
+    def _search(self, start):
+        """A* from `start` that stops at the goal or at any state with a known exact distance"""
+        table = self.table
+        open_list = [(self._h(start), 0, start)]  # (f, -g, state): deeper nodes first among equal f
+        best_g = {start: 0}
+        parent = {start: None}
+        expanded = []
+
+        while open_list:
+            f, negative_g, state = heapq.heappop(open_list)
+            g = -negative_g
+            if g > best_g[state]:
+                continue
+            if state in self.exact:
+                break
+            expanded.append((state, g))
+
+            blank = blank_index(state)
+            for move, target in table[blank]:
+                tile = (state >> (4 * target)) & 0xF
+                child = state + (tile << (4 * blank)) - (tile << (4 * target))
+                child_g = g + 1
+                if child_g < best_g.get(child, child_g + 1):
+                    best_g[child] = child_g
+                    parent[child] = (state, move)
+                    heapq.heappush(open_list, (child_g + self._h(child), -child_g, child))
+
+        # f of the popped state is the optimal cost: it has an exact distance and
+        # every other open node has f at least as large
+        cost = f
+        for expanded_state, expanded_g in expanded:
+            if cost - expanded_g > self.learned.get(expanded_state, 0):
+                self.learned[expanded_state] = cost - expanded_g
+
+        # Everything on the new path now has a proven distance and best move
+        while parent[state] is not None:
+            previous, move = parent[state]
+            self.exact[previous] = (cost - best_g[previous], move)
+            state = previous
+
+        self.stats["searches"] += 1
+        self.stats["nodes_expanded"] += len(expanded)
+        return len(expanded)
+
+    def hint(self, board=None):
+        """
+        Next optimal move from a board (default: the session's current board)
+        :return: Dict with move, distance (moves left), board_after, nodes_expanded and reused,
+                 or None when the board is already solved
+        """
+        if board is not None:
+            self.board = [row[:] for row in board]
+        state = pack_board(self.board)
+        if state == self.goal:
+            return None
+        if not is_solvable(self.board, self.goal_board):
+            raise ValueError("board cannot reach the goal")
+
+        self.stats["hints"] += 1
+        nodes = 0
+        reused = state in self.exact
+        if reused:
+            self.stats["reused"] += 1
+        else:
+            nodes = self._search(state)
+
+        distance, move = self.exact[state]
+        blank = blank_index(state)
+        target = next(t for m, t in self.table[blank] if m == move)
+        tile = (state >> (4 * target)) & 0xF
+        after = state + (tile << (4 * blank)) - (tile << (4 * target))
+        return {
+            "move": MOVE_NAMES[move],
+            "distance": distance,
+            "board_after": unpack_board(after, self.width),
+            "nodes_expanded": nodes,
+            "reused": reused
+        }
+
+    def move(self, move_name):
+        """
+        Apply a player's move to the session board
+        :param move_name: 'Up', 'Down', 'Left' or 'Right' (direction the blank moves)
+        :return: The new board
+        """
+        state = pack_board(self.board)
+        blank = blank_index(state)
+        move = MOVE_NAMES.index(move_name)
+        target = next((t for m, t in self.table[blank] if m == move), None)
+        if target is None:
+            raise ValueError(f"illegal move '{move_name}'")
+        tile = (state >> (4 * target)) & 0xF
+        self.board = unpack_board(state + (tile << (4 * blank)) - (tile << (4 * target)), self.width)
+        return self.board
+
+def play_session(start_board, goal_board, follow_rate=0.7, seed=0, max_moves=200):
+    """
+    Boards a simulated player visits: the hint with probability `follow_rate`, otherwise
+    a random legal move that does not undo the previous one
+    :return: List of boards at which a hint is requested
+    """
+    rng = random.Random(seed)
+    session = HintSession(goal_board, start_board)
+    boards = []
+    last_move = None
+    while len(boards) < max_moves:
+        hint = session.hint()
+        if hint is None:
+            break
+        boards.append([row[:] for row in session.board])
+        if rng.random() < follow_rate:
+            move = hint["move"]
+        else:
+            blank = blank_index(pack_board(session.board))
+            options = [MOVE_NAMES[m] for m, _ in session.table[blank]
+                       if last_move is None or m != INVERSE[MOVE_NAMES.index(last_move)]]
+            move = rng.choice(options)
+        session.move(move)
+        last_move = move
+    return boards
+
+def benchmark_hints(start_board, goal_board, follow_rate=0.7, seed=0):
+    """
+    Per-hint latency of one session against cold solves at the same boards
+    :return: Dict of variant -> {'median', 'mean', 'total', 'nodes'} plus the hint count
+    """
+    from astar.astar import astar_search
+
+    boards = play_session(start_board, goal_board, follow_rate, seed)
+
+    def timed(solve):
+        times, nodes = [], 0
+        for board in boards:
+            started = time.perf_counter()
+            nodes += solve(board)
+            times.append(time.perf_counter() - started)
+        return {"median": statistics.median(times), "mean": statistics.mean(times),
+                "total": sum(times), "nodes": nodes}
+
+    session = HintSession(goal_board)
+    return {
+        "hints": len(boards),
+        "incremental session": timed(lambda b: session.hint(b)["nodes_expanded"]),
+        "cold session per hint": timed(lambda b: HintSession(goal_board).hint(b)["nodes_expanded"]),
+        "cold astar_search": timed(lambda b: astar_search(b, goal_board)["nodes_expanded"])
+    }
+
+def main(argv=None):
+    import argparse
+    from test_cases import TEST_CASES
+
+    parser = argparse.ArgumentParser(description="Incremental hint latency vs cold solves")
+    parser.add_argument("case", nargs="?", default="very_hard")
+    parser.add_argument("--follow-rate", type=float, default=0.7,
+                        help="Probability the simulated player follows the hint")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    case = TEST_CASES[args.case]
+    results = benchmark_hints(case["start"], case["goal"], args.follow_rate, args.seed)
+    print(f"{results.pop('hints')} hints on '{args.case}' (follow rate {args.follow_rate:.0%})")
+    print(f"{'Variant':<24} {'Median (ms)':>12} {'Mean (ms)':>10} {'Total (s)':>10} {'Nodes':>10}")
+    for name, row in results.items():
+        print(f"{name:<24} {row['median'] * 1000:>12.3f} {row['mean'] * 1000:>10.3f} "
+              f"{row['total']:>10.3f} {row['nodes']:>10,}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
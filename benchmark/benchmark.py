@@ -0,0 +1,565 @@
+#!/usr/bin/env python3
+"""
+Reproducible statistical benchmark harness for the 8-Puzzle solvers
+"""
+
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from utils.generator import GOAL_BOARD, boards_at_depth
+from utils.corpus import Corpus
+from utils.registry import BENCHMARK_SOLVERS, SOLVERS as REGISTERED_SOLVERS, SolverSet, get_solver
+
+# Cold-import budget (seconds) for the solver entry points
+IMPORT_BUDGET = 0.2
+ENTRY_POINTS = [
+    "main",
+    "run_analysis",
+    "report",
+    "bfs.bfs",
+    "dfs.dfs",
+    "ucs.ucs",
+    "ids.ids",
+    "astar.astar",
+    "hill_climbing.hill_climbing",
+    "genetic_algorithm.genetic"
+]
+
+# One A* solve from the command line, the cold-start path users hit most
+COLD_START_COMMAND = ["main.py", "--case", "hard", "--algorithm", "A* (Manhattan)", "--memory", "off"]
+
+SOLVERS = SolverSet(BENCHMARK_SOLVERS)
+
+def build_instances(depths, per_depth, seed, goal_board=GOAL_BOARD):
+    """
+    Seeded instance set stratified by optimal solution depth
+    :return: List of {"depth", "start", "goal"} dicts
+    """
+    rng = random.Random(seed)
+    instances = []
+
+    for depth in depths:
+        for board in boards_at_depth(depth, per_depth, rng, goal_board):
+            instances.append({"depth": depth, "start": board, "goal": [row[:] for row in goal_board]})
+
+    return instances
+
+def load_instances(path, depths, per_depth, seed):
+    """
+    Seeded, depth-stratified sample from a corpus file written by utils.generator
+    :return: List of {"depth", "start", "goal"} dicts
+    """
+    rng = random.Random(seed)
+    instances = []
+
+    with Corpus(path) as corpus:
+        for depth in depths:
+            indices = [i for i in range(len(corpus)) if corpus.depth(i) == depth]
+            for index in rng.sample(indices, min(per_depth, len(indices))):
+                start, goal, _ = corpus[index]
+                instances.append({"depth": depth, "start": start, "goal": goal})
+
+    return instances
+
+def percentile(values, pct):
+    """Linear-interpolated percentile of a list of numbers"""
+    ordered = sorted(values)
+    if not ordered:
+        return float('nan')
+    k = (len(ordered) - 1) * pct / 100
+    lower, upper = math.floor(k), math.ceil(k)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+def measure_peak_memory(solver, start, goal):
+    """Peak traced allocation (bytes) of one solver run"""
+    tracemalloc.start()
+    try:
+        solver(start, goal)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+def benchmark_solver(solver, instances, warmup=1, repeats=5):
+    """
+    Time one solver over an instance set
+    :return: Dictionary keyed by depth with raw samples and summary statistics
+    """
+    for _ in range(warmup):
+        solver(instances[0]["start"], instances[0]["goal"])
+
+    by_depth = {}
+    for instance in instances:
+        bucket = by_depth.setdefault(instance["depth"], {
+            "times": [], "nodes_per_sec": [], "peak_memory": [], "solved": 0, "runs": 0
+        })
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = solver(instance["start"], instance["goal"])
+            elapsed = time.perf_counter() - start
+
+            bucket["times"].append(elapsed)
+            bucket["runs"] += 1
+            nodes = result.get("nodes_expanded")
+            if isinstance(nodes, int) and elapsed > 0:
+                bucket["nodes_per_sec"].append(nodes / elapsed)
+            if result.get("solution_found", False) or instance["depth"] == 0:
+                bucket["solved"] += 1
+
+        bucket["peak_memory"].append(measure_peak_memory(solver, instance["start"], instance["goal"]))
+
+    summary = {}
+    for depth, bucket in sorted(by_depth.items()):
+        times = bucket["times"]
+        summary[str(depth)] = {
+            "times": times,
+            "median_time": statistics.median(times),
+            "p10_time": percentile(times, 10),
+            "p90_time": percentile(times, 90),
+            "median_nodes_per_sec": statistics.median(bucket["nodes_per_sec"]) if bucket["nodes_per_sec"] else None,
+            "peak_memory_bytes": max(bucket["peak_memory"]),
+            "success_rate": bucket["solved"] / bucket["runs"]
+        }
+    return summary
+
+def run_benchmark(solver_names=None, depths=(2, 4, 8, 12), per_depth=3, seed=0,
+                  warmup=1, repeats=5, corpus=None):
+    """
+    Run the benchmark suite
+    :param corpus: Optional corpus file to sample instances from
+    :return: Baseline dictionary (JSON serialisable)
+    """
+    solver_names = solver_names or list(SOLVERS)
+    if corpus:
+        instances = load_instances(corpus, depths, per_depth, seed)
+    else:
+        instances = build_instances(depths, per_depth, seed)
+
+    baseline = {
+        "meta": {
+            "generated": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": seed,
+            "depths": list(depths),
+            "per_depth": per_depth,
+            "warmup": warmup,
+            "repeats": repeats,
+            "corpus": corpus
+        },
+        "results": {}
+    }
+
+    for name in solver_names:
+        print(f"Benchmarking {name}...")
+        random.seed(seed)  # Stochastic solvers draw from the global generator
+        baseline["results"][name] = benchmark_solver(get_solver(name), instances, warmup, repeats)
+
+    return baseline
+
+SCALING_SOLVERS = ["BFS", "A* (Misplaced)", "A* (Manhattan)", "A* (Walking Distance)"]
+
+def _scaling_cell(name, start, goal, memory_mode):
+    """Worker process body for run_scaling()"""
+    from utils.memory import measure_run
+    return measure_run(get_solver(name), start, goal, memory_mode=memory_mode)
+
+def run_scaling(solver_names=None, depths=range(2, 23, 2), per_depth=10, seed=0, corpus=None,
+                timeout=60.0, workers=None, memory_mode='full', store_path=None):
+    """
+    Run solvers on depth-stratified instances and bucket the runs by optimal depth
+    :param store_path: Also append every run to this results store (instance names carry the boards)
+    :return: PerformanceAnalyzer holding the depth samples
+    """
+    from report.analysis import PerformanceAnalyzer
+    from utils.parallel import run_tasks
+
+    solver_names = solver_names or SCALING_SOLVERS
+    if corpus:
+        instances = load_instances(corpus, depths, per_depth, seed)
+    else:
+        instances = build_instances(depths, per_depth, seed)
+    tasks = [((name, index), (name, instance["start"], instance["goal"], memory_mode))
+             for index, instance in enumerate(instances) for name in solver_names]
+
+    def report(key, status, value, elapsed):
+        if status != "ok":
+            print(f"  {'⏱' if status == 'timeout' else '✗'} {key[0]} on instance {key[1]} "
+                  f"(depth {instances[key[1]]['depth']}, {elapsed:.1f}s)")
+
+    print(f"Running {len(tasks)} solver x instance cells...")
+    outcomes = run_tasks(tasks, _scaling_cell, workers, timeout, report)
+
+    analyzer = PerformanceAnalyzer(headless=True)
+    for (name, index), (status, value, _) in outcomes.items():
+        if status == "ok":
+            analyzer.add_depth_sample(name, instances[index]["depth"], value)
+
+    if store_path:
+        from report.store import ResultsStore
+        from portfolio.selector import encode_instance
+        with ResultsStore(store_path) as store:
+            for (name, index), (status, value, elapsed) in outcomes.items():
+                instance = instances[index]
+                if status != "ok":
+                    value = {"solution_found": False, "time_taken": elapsed}
+                store.add(name, encode_instance(instance["start"], instance["goal"]), value,
+                          optimal_length=instance["depth"])
+    return analyzer
+
+def print_scaling(curves):
+    """Print the fitted growth per metric and the per-depth median nodes and b*"""
+    print(f"\n{'Algorithm':<25} {'Nodes Growth':<13} {'Time Growth':<12} {'Memory Growth':<14}")
+    print("-" * 66)
+    for name, curve in curves.items():
+        growth = [f"{fit['growth']:.3f}" if fit else 'N/A'
+                  for fit in (curve['fits'][metric] for metric in ('nodes', 'time', 'memory'))]
+        print(f"{name:<25} {growth[0]:<13} {growth[1]:<12} {growth[2]:<14}")
+
+    print(f"\n{'Algorithm':<25} {'Depth':<6} {'Runs':<5} {'Median Nodes':<13} {'b*':<7} "
+          f"{'Median (s)':<11} {'P90 (s)':<10}")
+    print("-" * 80)
+    for name, curve in curves.items():
+        for i, depth in enumerate(curve['depths']):
+            ebf = curve['ebf'][i]
+            print(f"{name:<25} {depth:<6} {curve['samples'][i]:<5} {curve['nodes']['p50'][i]:<13,.0f} "
+                  f"{(f'{ebf:.3f}' if ebf else 'N/A'):<7} {curve['time']['p50'][i]:<11.5f} "
+                  f"{curve['time']['p90'][i]:<10.5f}")
+
+def compare_heuristics(heuristics=('manhattan', 'linear_conflict', 'walking_distance'),
+                       depths=(20, 22, 24, 26), per_depth=5, seed=0):
+    """
+    A* expansions and time per heuristic on the same random hard instances
+    :return: List of row dicts (heuristic, depth, median/mean nodes, median time, ratio to the first heuristic)
+    """
+    from astar.astar import astar_search
+
+    instances = build_instances(depths, per_depth, seed)
+    rows = []
+    baseline_nodes = {}
+    for heuristic in heuristics:
+        astar_search(instances[0]["start"], instances[0]["goal"], heuristic)  # loads any tables
+        for depth in depths:
+            nodes, times = [], []
+            for instance in (i for i in instances if i["depth"] == depth):
+                start = time.perf_counter()
+                result = astar_search(instance["start"], instance["goal"], heuristic)
+                times.append(time.perf_counter() - start)
+                nodes.append(result["nodes_expanded"])
+            if not nodes:
+                continue
+            median_nodes = statistics.median(nodes)
+            baseline_nodes.setdefault(depth, median_nodes)
+            rows.append({
+                "heuristic": heuristic,
+                "depth": depth,
+                "median_nodes": median_nodes,
+                "mean_nodes": statistics.mean(nodes),
+                "median_time": statistics.median(times),
+                "nodes_ratio": median_nodes / baseline_nodes[depth] if baseline_nodes[depth] else 1.0
+            })
+    return rows
+
+def compare_partial_expansion(depths=(18, 22, 26), per_depth=5, seed=0):
+    """
+    Plain A* against EPEA* (both Manhattan) on the same random instances
+    Time is measured without tracing; peak memory in a second, traced run.
+    :return: List of row dicts per depth with medians of generated nodes, peak traced memory
+             and time for both variants, and the EPEA*/A* ratios
+    """
+    from astar.astar import astar_search
+
+    instances = build_instances(depths, per_depth, seed)
+    rows = []
+    for depth in depths:
+        samples = {False: {"generated": [], "memory": [], "time": []},
+                   True: {"generated": [], "memory": [], "time": []}}
+        for instance in (i for i in instances if i["depth"] == depth):
+            for partial_expansion, bucket in samples.items():
+                start = time.perf_counter()
+                result = astar_search(instance["start"], instance["goal"], 'manhattan',
+                                      partial_expansion=partial_expansion)
+                bucket["time"].append(time.perf_counter() - start)
+                bucket["generated"].append(result.get("nodes_generated", 0))
+                bucket["memory"].append(measure_peak_memory(
+                    lambda s, g: astar_search(s, g, 'manhattan', partial_expansion=partial_expansion),
+                    instance["start"], instance["goal"]))
+        if not samples[False]["time"]:
+            continue
+        row = {"depth": depth}
+        for metric in ("generated", "memory", "time"):
+            plain = statistics.median(samples[False][metric])
+            epea = statistics.median(samples[True][metric])
+            row[f"astar_{metric}"] = plain
+            row[f"epea_{metric}"] = epea
+            row[f"{metric}_ratio"] = epea / plain if plain else 1.0
+        rows.append(row)
+    return rows
+
+def mann_whitney_u(sample_a, sample_b):
+    """
+    Two-sided Mann-Whitney U test (normal approximation with tie correction)
+    :return: p-value
+    """
+    n1, n2 = len(sample_a), len(sample_b)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    combined = sorted([(v, 0) for v in sample_a] + [(v, 1) for v in sample_b])
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tie_term += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+
+    rank_sum_a = sum(r for r, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum_a - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    sigma = math.sqrt(n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1))))
+    if sigma == 0:
+        return 1.0
+
+    z = (abs(u - n1 * n2 / 2) - 0.5) / sigma
+    return math.erfc(max(z, 0) / math.sqrt(2))
+
+def compare(baseline, current, alpha=0.05, threshold=0.10):
+    """
+    Flag statistically significant slowdowns against a saved baseline
+    :param alpha: Significance level of the Mann-Whitney U test
+    :param threshold: Minimum relative increase of the median time
+    :return: List of comparison rows
+    """
+    rows = []
+    for name, depths in current["results"].items():
+        for depth, stats in depths.items():
+            base = baseline["results"].get(name, {}).get(depth)
+            if base is None:
+                continue
+            change = stats["median_time"] / base["median_time"] - 1 if base["median_time"] else 0.0
+            p_value = mann_whitney_u(base["times"], stats["times"])
+            rows.append({
+                "algorithm": name,
+                "depth": int(depth),
+                "baseline_median": base["median_time"],
+                "current_median": stats["median_time"],
+                "change": change,
+                "p_value": p_value,
+                "regression": change > threshold and p_value < alpha
+            })
+    return rows
+
+def measure_import_time(module, repeats=3):
+    """
+    Cold import time of a module in a fresh interpreter (best of `repeats`)
+    :return: Seconds, from `python -X importtime`
+    """
+    best = float('inf')
+    for _ in range(repeats):
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                   capture_output=True, text=True, check=True)
+        for line in completed.stderr.splitlines():
+            parts = [part.strip() for part in line.split("|")]
+            if len(parts) == 3 and parts[2] == module:
+                best = min(best, int(parts[1]) / 1e6)
+    return best
+
+def measure_cold_start(argv=COLD_START_COMMAND, repeats=5):
+    """
+    Wall time of a command-line run in a fresh interpreter, start-up and imports included
+    :param argv: Arguments after the interpreter, e.g. ['main.py', '--case', 'hard']
+    :return: Dict with best and median seconds over `repeats` runs
+    """
+    times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, *argv], capture_output=True, check=True)
+        times.append(time.perf_counter() - started)
+    return {"best": min(times), "median": statistics.median(times)}
+
+def check_import_budget(modules=ENTRY_POINTS, budget=IMPORT_BUDGET):
+    """
+    Measure every entry point against the import-time budget
+    :return: List of (module, seconds, within_budget)
+    """
+    return [(module, seconds, seconds <= budget)
+            for module, seconds in ((m, measure_import_time(m)) for m in modules)]
+
+def print_summary(baseline):
+    """Print the benchmark summary table"""
+    print(f"\n{'Algorithm':<25} {'Depth':<6} {'Median (s)':<12} {'P90 (s)':<12} "
+          f"{'Nodes/s':<12} {'Peak Mem':<12} {'Success':<8}")
+    print("-" * 90)
+    for name, depths in baseline["results"].items():
+        for depth, stats in depths.items():
+            nps = stats["median_nodes_per_sec"]
+            print(f"{name:<25} {depth:<6} {stats['median_time']:<12.5f} {stats['p90_time']:<12.5f} "
+                  f"{(f'{nps:,.0f}' if nps else 'N/A'):<12} {stats['peak_memory_bytes']:<12,} "
+                  f"{stats['success_rate']:<8.0%}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="8-Puzzle solver benchmark suite")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmark and write a baseline JSON")
+    run_parser.add_argument("--algorithms", nargs="+", choices=list(REGISTERED_SOLVERS), default=None)
+    run_parser.add_argument("--depths", nargs="+", type=int, default=[2, 4, 8, 12])
+    run_parser.add_argument("--per-depth", type=int, default=3)
+    run_parser.add_argument("--seed", type=int, default=0)
+    run_parser.add_argument("--warmup", type=int, default=1)
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--corpus", default=None, help="Sample instances from a corpus file")
+    run_parser.add_argument("--output", default="report/benchmark_baseline.json")
+
+    compare_parser = commands.add_parser("compare", help="Compare two benchmark JSON files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--alpha", type=float, default=0.05)
+    compare_parser.add_argument("--threshold", type=float, default=0.10)
+
+    heuristics_parser = commands.add_parser("heuristics", help="Compare A* expansions per heuristic")
+    heuristics_parser.add_argument("--heuristics", nargs="+",
+                                   default=["manhattan", "linear_conflict", "walking_distance"])
+    heuristics_parser.add_argument("--depths", nargs="+", type=int, default=[20, 22, 24, 26])
+    heuristics_parser.add_argument("--per-depth", type=int, default=5)
+    heuristics_parser.add_argument("--seed", type=int, default=0)
+
+    epea_parser = commands.add_parser("epea", help="Compare plain A* with partial expansion (EPEA*)")
+    epea_parser.add_argument("--depths", nargs="+", type=int, default=[18, 22, 26])
+    epea_parser.add_argument("--per-depth", type=int, default=5)
+    epea_parser.add_argument("--seed", type=int, default=0)
+
+    scaling_parser = commands.add_parser("scaling", help="Cost curves by optimal depth with fitted growth")
+    scaling_parser.add_argument("--algorithms", nargs="+", choices=list(REGISTERED_SOLVERS), default=None)
+    scaling_parser.add_argument("--depths", nargs="+", type=int, default=list(range(2, 23, 2)))
+    scaling_parser.add_argument("--per-depth", type=int, default=10)
+    scaling_parser.add_argument("--seed", type=int, default=0)
+    scaling_parser.add_argument("--corpus", default=None, help="Sample instances from a corpus file")
+    scaling_parser.add_argument("--from-store", default=None,
+                                help="Analyse rows already in a results store instead of running solvers")
+    scaling_parser.add_argument("--store", default=None, help="Also append the runs to this results store")
+    scaling_parser.add_argument("--timeout", type=float, default=60.0, help="Seconds per solver x instance")
+    scaling_parser.add_argument("--workers", type=int, default=None)
+    scaling_parser.add_argument("--memory", choices=["full", "rss"], default="full")
+    scaling_parser.add_argument("--output", default="report/scaling_curves.json")
+    scaling_parser.add_argument("--plot", default="report/scaling_curves.png")
+    scaling_parser.add_argument("--mix", nargs="+", default=None, metavar="DEPTH:WEIGHT",
+                                help="Difficulty mix to predict capacity for, e.g. 10:5 20:3 26:1")
+    scaling_parser.add_argument("--budget", type=float, default=3600.0,
+                                help="Seconds of solver time for the capacity estimate")
+
+    imports_parser = commands.add_parser("imports", help="Check entry-point import times against a budget")
+    imports_parser.add_argument("--budget", type=float, default=IMPORT_BUDGET)
+
+    cold_parser = commands.add_parser("coldstart", help="Time a full command-line A* solve from a cold interpreter")
+    cold_parser.add_argument("--repeats", type=int, default=5)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "imports":
+        rows = check_import_budget(budget=args.budget)
+        print(f"{'Module':<30} {'Import (ms)':<12} {'Status':<8}")
+        print("-" * 52)
+        for module, seconds, ok in rows:
+            print(f"{module:<30} {seconds * 1000:<12.1f} {'ok' if ok else 'OVER':<8}")
+        over = sum(not ok for _, _, ok in rows)
+        print(f"\nBudget: {args.budget * 1000:.0f} ms, {over} module(s) over budget")
+        return 1 if over else 0
+
+    if args.command == "epea":
+        rows = compare_partial_expansion(args.depths, args.per_depth, args.seed)
+        print(f"{'Depth':<6} {'A* Generated':<13} {'EPEA* Gen':<10} {'Ratio':<6} {'A* Mem':<12} "
+              f"{'EPEA* Mem':<12} {'Ratio':<6} {'A* (s)':<8} {'EPEA* (s)':<9} {'Ratio':<6}")
+        print("-" * 96)
+        for row in rows:
+            print(f"{row['depth']:<6} {row['astar_generated']:<13,.0f} {row['epea_generated']:<10,.0f} "
+                  f"{row['generated_ratio']:<6.2f} {row['astar_memory']:<12,.0f} {row['epea_memory']:<12,.0f} "
+                  f"{row['memory_ratio']:<6.2f} {row['astar_time']:<8.4f} {row['epea_time']:<9.4f} "
+                  f"{row['time_ratio']:<6.2f}")
+        return 0
+
+    if args.command == "scaling":
+        if args.from_store:
+            from report.analysis import PerformanceAnalyzer
+            from report.store import ResultsStore
+            analyzer = PerformanceAnalyzer(headless=True)
+            with ResultsStore(args.from_store) as store:
+                for name in args.algorithms or [None]:
+                    analyzer.load_depth_samples(store, algorithm=name)
+        else:
+            analyzer = run_scaling(args.algorithms, args.depths, args.per_depth, args.seed, args.corpus,
+                                   args.timeout, args.workers, args.memory, args.store)
+        curves = analyzer.scaling_curves()
+        print_scaling(curves)
+        print(f"\n✓ Curves saved to {analyzer.export_scaling_curves(args.output)}")
+        print(f"✓ Chart saved to {analyzer.plot_scaling_curves(args.plot)}")
+
+        if args.mix:
+            from report.analysis import predict_capacity
+            mix = {int(d): float(w) for d, w in (item.split(":") for item in args.mix)}
+            print(f"\nCapacity for mix {args.mix} within {args.budget:,.0f}s:")
+            print(f"{'Algorithm':<25} {'Mean Nodes':<13} {'Mean (s)':<11} {'Peak Mem':<14} {'Instances':<10}")
+            print("-" * 76)
+            for name, row in predict_capacity(curves, mix, args.budget).items():
+                print(f"{name:<25} {row['mean_nodes']:<13,.0f} {row['mean_time']:<11.5f} "
+                      f"{row['peak_memory']:<14,.0f} {row['instances_per_budget']:<10,.0f}")
+        return 0
+
+    if args.command == "coldstart":
+        timing = measure_cold_start(repeats=args.repeats)
+        print(f"python {' '.join(COLD_START_COMMAND)}")
+        print(f"Best: {timing['best'] * 1000:.1f} ms, median: {timing['median'] * 1000:.1f} ms")
+        return 0
+
+    if args.command == "heuristics":
+        rows = compare_heuristics(args.heuristics, args.depths, args.per_depth, args.seed)
+        print(f"{'Heuristic':<18} {'Depth':<6} {'Median Nodes':<14} {'Mean Nodes':<12} "
+              f"{'Median (s)':<11} {'vs ' + args.heuristics[0]:<16}")
+        print("-" * 80)
+        for row in rows:
+            print(f"{row['heuristic']:<18} {row['depth']:<6} {row['median_nodes']:<14,.0f} "
+                  f"{row['mean_nodes']:<12,.0f} {row['median_time']:<11.4f} {row['nodes_ratio']:<16.2f}")
+        return 0
+
+    if args.command == "run":
+        baseline = run_benchmark(args.algorithms, args.depths, args.per_depth, args.seed,
+                                 args.warmup, args.repeats, args.corpus)
+        print_summary(baseline)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2)
+        print(f"\n✓ Baseline saved to {args.output}")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    with open(args.current, encoding='utf-8') as f:
+        current = json.load(f)
+
+    rows = compare(baseline, current, args.alpha, args.threshold)
+    print(f"{'Algorithm':<25} {'Depth':<6} {'Baseline (s)':<14} {'Current (s)':<14} "
+          f"{'Change':<9} {'p-value':<9} {'Status':<10}")
+    print("-" * 90)
+    for row in rows:
+        status = "REGRESSED" if row["regression"] else "ok"
+        print(f"{row['algorithm']:<25} {row['depth']:<6} {row['baseline_median']:<14.5f} "
+              f"{row['current_median']:<14.5f} {row['change']:<+9.1%} {row['p_value']:<9.4f} {status:<10}")
+
+    regressions = sum(row["regression"] for row in rows)
+    print(f"\n{regressions} significant regression(s)")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
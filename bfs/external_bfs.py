@@ -0,0 +1,270 @@
+"""
+External-memory Breadth-First Search with delayed duplicate detection
+
+Each BFS layer lives on disk as a sorted file of packed 64-bit states
+(utils.corpus.pack_board). Successors of a layer are buffered in memory,
+written out as sorted runs, then merged; duplicates are removed during the
+merge against the two previous layers instead of through an in-memory set.
+"""
+
+import heapq
+import mmap
+import os
+import shutil
+import tempfile
+from array import array
+from bisect import bisect_left
+from utils.corpus import pack_board, unpack_board
+from utils.inplace import MOVE_NAMES, neighbor_table
+from utils.packed import blank_index
+from utils.solvability import is_solvable, unsolvable_result
+
+CHUNK = 1 << 16  # states per read
+
+class DiskBudgetExceeded(Exception):
+    """Raised when the layer and run files would exceed the disk budget"""
+
+class _DiskUsage:
+    """Tracks bytes held by live layer/run files"""
+
+    def __init__(self, budget):
+        self.budget = budget
+        self.current = 0
+        self.peak = 0
+
+    def add(self, nbytes):
+        if self.budget is not None and self.current + nbytes > self.budget:
+            raise DiskBudgetExceeded(
+                f"disk budget of {self.budget:,} bytes exceeded ({self.current + nbytes:,} needed)")
+        self.current += nbytes
+        self.peak = max(self.peak, self.current)
+
+    def remove(self, path):
+        if os.path.exists(path):
+            self.current -= os.path.getsize(path)
+            os.remove(path)
+
+def _iter_file(path):
+    """Stream the packed states of a file in order"""
+    with open(path, 'rb') as f:
+        while True:
+            block = array('Q')
+            try:
+                block.fromfile(f, CHUNK)
+            except EOFError:
+                pass  # short final block: fromfile keeps what it read
+            if not block:
+                return
+            yield from block
+
+def _write_states(path, values, usage):
+    """Write an iterable of packed states, charging the disk budget as it goes"""
+    count = 0
+    with open(path, 'wb') as f:
+        block = array('Q')
+        for value in values:
+            block.append(value)
+            if len(block) >= CHUNK:
+                usage.add(len(block) * 8)
+                block.tofile(f)
+                count += len(block)
+                block = array('Q')
+        if block:
+            usage.add(len(block) * 8)
+            block.tofile(f)
+            count += len(block)
+    return count
+
+def _unique(sorted_values):
+    previous = None
+    for value in sorted_values:
+        if value != previous:
+            yield value
+            previous = value
+
+def _subtract(sorted_values, excluded):
+    """Values of one sorted stream that are absent from another sorted stream"""
+    excluded = iter(excluded)
+    current = next(excluded, None)
+    for value in sorted_values:
+        while current is not None and current < value:
+            current = next(excluded, None)
+        if value != current:
+            yield value
+
+def _track(values, target, found):
+    """Pass a sorted stream through, noting whether `target` appears in it"""
+    for value in values:
+        if value == target:
+            found.append(value)
+        yield value
+
+def _successors(state, width, table):
+    """Packed successor states (blank moves) of a packed state"""
+    blank = blank_index(state)
+    for _, target in table[blank]:
+        tile = (state >> (4 * target)) & 0xF
+        yield state + (tile << (4 * blank)) - (tile << (4 * target))
+
+class _SortedFile:
+    """Memory-mapped sorted state file supporting membership tests"""
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        size = os.path.getsize(path)
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self.states = memoryview(self._map).cast('Q') if size else []
+
+    def __contains__(self, value):
+        index = bisect_left(self.states, value)
+        return index < len(self.states) and self.states[index] == value
+
+    def close(self):
+        if self._map is not None:
+            self.states.release()
+            self._map.close()
+        self._file.close()
+
+def _recover_path(layer_paths, goal, width, table):
+    """Walk back from the goal through the kept layers to rebuild the move sequence"""
+    states = [goal]
+    for path in reversed(layer_paths[:-1]):
+        layer = _SortedFile(path)
+        try:
+            states.append(next(s for s in _successors(states[-1], width, table) if s in layer))
+        finally:
+            layer.close()
+    states.reverse()
+
+    path = []
+    for before, after in zip(states, states[1:]):
+        blank_after = blank_index(after)
+        move = next(m for m, t in table[blank_index(before)] if t == blank_after)
+        path.append((MOVE_NAMES[move], unpack_board(after, width)))
+    return path
+
+def external_bfs(start_board, goal_board=None, work_dir=None, memory_states=1_000_000,
+                 disk_budget_bytes=1 << 30, keep_layers=None, progress=None):
+    """
+    External-memory Breadth-First Search
+    :param start_board: Starting board configuration (width up to 4)
+    :param goal_board: Goal board; None runs an exhaustive search of the reachable space
+    :param work_dir: Directory for layer and run files (a temporary directory by default)
+    :param memory_states: Successors buffered in memory before a sorted run is written
+    :param disk_budget_bytes: Maximum bytes of layer and run files on disk (None for no limit)
+    :param keep_layers: Keep every layer for path recovery (default: only when a goal is given)
+    :param progress: Optional callback(depth, layer_size, disk_bytes) called after each layer
+    :return: Dictionary with results
+    """
+    width = len(start_board)
+    if goal_board is not None and not is_solvable(start_board, goal_board):
+        return unsolvable_result()
+    if keep_layers is None:
+        keep_layers = goal_board is not None
+
+    table = neighbor_table(width)
+    start = pack_board(start_board)
+    goal = pack_board(goal_board) if goal_board is not None else None
+
+    own_dir = work_dir is None
+    work_dir = tempfile.mkdtemp(prefix="external_bfs_") if own_dir else work_dir
+    os.makedirs(work_dir, exist_ok=True)
+    usage = _DiskUsage(disk_budget_bytes)
+
+    layer_paths = [os.path.join(work_dir, "layer_0.bin")]
+    layer_sizes = [_write_states(layer_paths[0], [start], usage)]
+    nodes_expanded = 0
+    result = None
+
+    try:
+        if start == goal:
+            result = {"path": [], "nodes_expanded": 0, "path_length": 0, "solution_found": True}
+
+        while result is None and layer_sizes[-1]:
+            depth = len(layer_paths)
+
+            # 1. Expand the current layer into sorted, de-duplicated runs
+            run_paths = []
+            buffer = []
+            for state in _iter_file(layer_paths[-1]):
+                nodes_expanded += 1
+                buffer.extend(_successors(state, width, table))
+                if len(buffer) >= memory_states:
+                    run_paths.append(os.path.join(work_dir, f"run_{depth}_{len(run_paths)}.bin"))
+                    _write_states(run_paths[-1], _unique(sorted(buffer)), usage)
+                    buffer = []
+            if buffer:
+                run_paths.append(os.path.join(work_dir, f"run_{depth}_{len(run_paths)}.bin"))
+                _write_states(run_paths[-1], _unique(sorted(buffer)), usage)
+                buffer = []
+
+            # 2. Merge the runs and drop states seen in the previous two layers
+            merged = _unique(heapq.merge(*(_iter_file(p) for p in run_paths)))
+            for previous in layer_paths[-2:]:
+                merged = _subtract(merged, _iter_file(previous))
+
+            layer_paths.append(os.path.join(work_dir, f"layer_{depth}.bin"))
+            found = []
+            if goal is not None:
+                merged = _track(merged, goal, found)
+            layer_sizes.append(_write_states(layer_paths[-1], merged, usage))
+
+            for path in run_paths:
+                usage.remove(path)
+            if not keep_layers and len(layer_paths) > 3:
+                usage.remove(layer_paths[-4])
+
+            if progress is not None:
+                progress(depth, layer_sizes[-1], usage.current)
+
+            if found:
+                result = {
+                    "path": _recover_path(layer_paths, goal, width, table),
+                    "nodes_expanded": nodes_expanded,
+                    "path_length": depth,
+                    "solution_found": True
+                }
+
+        if result is None:
+            result = {"solution_found": False, "nodes_expanded": nodes_expanded}
+            if goal is None:
+                result["max_depth"] = len([size for size in layer_sizes if size]) - 1
+                result["states_reached"] = sum(layer_sizes)
+    except DiskBudgetExceeded as error:
+        result = {"solution_found": False, "nodes_expanded": nodes_expanded,
+                  "disk_budget_exceeded": True, "error": str(error)}
+    finally:
+        if own_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    result["layer_sizes"] = [size for size in layer_sizes if size]
+    result["peak_disk_bytes"] = usage.peak
+    return result
+
+def main(argv=None):
+    import argparse
+    from utils.solvability import default_goal
+
+    parser = argparse.ArgumentParser(description="Exhaustive external-memory BFS from the goal board")
+    parser.add_argument("--width", type=int, default=3, help="Board width (3 or 4)")
+    parser.add_argument("--work-dir", default=None, help="Directory for layer and run files")
+    parser.add_argument("--memory-states", type=int, default=1_000_000,
+                        help="Successors buffered in memory per sorted run")
+    parser.add_argument("--disk-budget-mb", type=float, default=1024, help="Disk budget in MiB")
+    args = parser.parse_args(argv)
+
+    def report(depth, size, disk_bytes):
+        print(f"depth {depth:3d}: {size:>14,} states   disk {disk_bytes / 1048576:10.1f} MiB", flush=True)
+
+    result = external_bfs(default_goal(args.width), None, work_dir=args.work_dir,
+                          memory_states=args.memory_states,
+                          disk_budget_bytes=int(args.disk_budget_mb * 1048576), progress=report)
+    if result.get("disk_budget_exceeded"):
+        print(f"✗ {result['error']}")
+        return 1
+    print(f"✓ {result['states_reached']:,} states, radius {result['max_depth']}, "
+          f"peak disk {result['peak_disk_bytes'] / 1048576:.1f} MiB")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
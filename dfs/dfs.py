@@ -1,48 +1,84 @@
-from utils.state import PuzzleState
-from utils.moves import get_possible_moves, get_path
+from utils.inplace import MutableBoard
+from utils.tracing import attach_trace
+from utils.solvability import is_solvable, unsolvable_result
 
-def dfs(start_board, goal_board, max_depth=50):
+def dfs(start_board, goal_board, max_depth=50, tracer=None):
     """
     Depth-First Search for 8-Puzzle with depth limit
     :param start_board: Starting board configuration
     :param goal_board: Goal board configuration
     :param max_depth: Maximum depth to search
+    :param tracer: Optional SearchTracer for event counts and frontier samples
     :return: Dictionary with results
     """
-    start_state = PuzzleState(start_board)
+    if not is_solvable(start_board, goal_board):
+        return unsolvable_result()
     
-    if start_state.board == goal_board:
+    board = MutableBoard(start_board)
+    goal_key = tuple(cell for row in goal_board for cell in row)
+    if tracer is not None:
+        tracer.start()
+    
+    if board.key() == goal_key:
         return {"path": [], "nodes_expanded": 0}
     
-    # Initialize stack with (state, depth)
-    stack = [(start_state, 0)]
-    explored = set()
-    nodes_expanded = 0
+    # One frame of pending moves per depth; the board itself is mutated in place
+    explored = {board.key()}
+    nodes_expanded = 1
+    frames = [expand(board, explored, tracer)]
+    if tracer is not None:
+        tracer.on_expand(0, len(explored), 0)
     
-    while stack:
-        current_state, depth = stack.pop()  # LIFO stack
+    while frames:
+        frame = frames[-1]
+        
+        # Frame exhausted: backtrack to the parent
+        if not frame:
+            frames.pop()
+            if frames:
+                board.undo()
+            continue
+        
+        board.apply(*frame.pop())  # LIFO, like popping the last pushed successor
+        depth = board.depth()
         
         # Check if goal is reached
-        if current_state.board == goal_board:
-            return {
-                "path": get_path(current_state),
+        if board.key() == goal_key:
+            return attach_trace({
+                "path": board.path(start_board),
                 "nodes_expanded": nodes_expanded,
-                "path_length": current_state.g,
+                "path_length": depth,
                 "solution_found": True
-            }
+            }, tracer)
         
         # Check depth limit
         if depth >= max_depth:
+            board.undo()
             continue
         
         # Add to explored set
-        explored.add(tuple(map(tuple, current_state.board)))
+        explored.add(board.key())
         nodes_expanded += 1
+        if tracer is not None:
+            tracer.on_expand(sum(map(len, frames)), len(explored), depth)
         
-        # Generate successors
-        for move_name, next_state in get_possible_moves(current_state):
-            board_tuple = tuple(map(tuple, next_state.board))
-            if board_tuple not in explored:
-                stack.append((next_state, depth + 1))
+        frames.append(expand(board, explored, tracer))
     
-    return {"solution_found": False, "nodes_expanded": nodes_expanded}
+    return attach_trace({"solution_found": False, "nodes_expanded": nodes_expanded}, tracer)
+
+def expand(board, explored, tracer=None):
+    """
+    Successor moves of the current board that lead to unexplored states
+    :return: List of (move_index, target) pairs in generation order
+    """
+    frame = []
+    for move in board.successors():
+        board.apply(*move)
+        if board.key() not in explored:
+            frame.append(move)
+            if tracer is not None:
+                tracer.on_generate()
+        elif tracer is not None:
+            tracer.on_duplicate()
+        board.undo()
+    return frame
@@ -1,11 +1,65 @@
 import random
-import numpy as np
+from collections import OrderedDict
 from utils.state import PuzzleState
 from utils.heuristics import manhattan_distance
+from utils.tracing import attach_trace
+from utils.solvability import is_solvable, unsolvable_result
+
+MOVE_DELTAS = {'Up': (-1, 0), 'Down': (1, 0), 'Left': (0, -1), 'Right': (0, 1)}
+
+class PrefixCache:
+    """
+    Bounded LRU cache of (start board, move prefix) -> (board, blank position).
+    Prefixes are stored every `interval` moves so a lookup probes at most
+    len(chromosome) / interval keys. The start board is part of the key, so one
+    cache can serve runs from different starts.
+    """
+
+    def __init__(self, max_size=5000, interval=5):
+        self.max_size = max_size
+        self.interval = interval
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def longest_prefix(self, chromosome, start_key):
+        """
+        Find the longest cached prefix of a chromosome
+        :param start_key: Start board as a tuple of row tuples
+        :return: (prefix_length, board, blank_pos) or (0, None, None)
+        """
+        best = (0, None, None)
+        for length in range(self.interval, len(chromosome) + 1, self.interval):
+            key = (start_key, tuple(chromosome[:length]))
+            entry = self.entries.get(key)
+            if entry is None:
+                break
+            self.entries.move_to_end(key)
+            best = (length, entry[0], entry[1])
+
+        if best[0]:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return best
+
+    def store(self, prefix, board, blank_pos, start_key):
+        """Cache a copy of the board reached after `prefix` from the start board `start_key`"""
+        key = (start_key, tuple(prefix))
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return
+        self.entries[key] = ([row[:] for row in board], blank_pos)
+        if len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
 
 class GeneticAlgorithm:
     def __init__(self, goal_board, population_size=100, max_generations=500,
-                 mutation_rate=0.1, crossover_rate=0.8):
+                 mutation_rate=0.1, crossover_rate=0.8, prefix_cache_size=5000):
         self.goal_board = goal_board
         self.population_size = population_size
         self.max_generations = max_generations
@@ -15,6 +69,11 @@ class GeneticAlgorithm:
         # Flatten goal board for easier comparison
         self.goal_flat = [cell for row in goal_board for cell in row]
         
+        # Prefix memoization (0 disables it)
+        self.prefix_cache = PrefixCache(prefix_cache_size) if prefix_cache_size else None
+        self.moves_requested = 0
+        self.moves_simulated = 0
+        
         # Statistics tracking
         self.best_fitness_history = []
         self.avg_fitness_history = []
@@ -27,6 +86,11 @@ class GeneticAlgorithm:
     
     def chromosome_to_state(self, chromosome, start_board):
         """Convert chromosome (move sequence) to final state"""
+        self.moves_requested += len(chromosome)
+        if self.prefix_cache is not None:
+            return self._cached_chromosome_to_state(chromosome, start_board)
+        self.moves_simulated += len(chromosome)
+        
         current_board = [row[:] for row in start_board]
         
         for move in chromosome:
@@ -57,6 +121,43 @@ class GeneticAlgorithm:
         
         return PuzzleState(current_board)
     
+    def _cached_chromosome_to_state(self, chromosome, start_board):
+        """Resume from the longest cached prefix and replay only the suffix"""
+        cache = self.prefix_cache
+        start_key = tuple(map(tuple, start_board))
+        prefix_length, board, blank_pos = cache.longest_prefix(chromosome, start_key)
+        
+        if board is None:
+            current_board = [row[:] for row in start_board]
+            blank_pos = next((i, j) for i in range(3) for j in range(3) if current_board[i][j] == 0)
+        else:
+            current_board = [row[:] for row in board]
+        
+        i, j = blank_pos
+        for index in range(prefix_length, len(chromosome)):
+            di, dj = MOVE_DELTAS[chromosome[index]]
+            ni, nj = i + di, j + dj
+            if 0 <= ni < 3 and 0 <= nj < 3:
+                current_board[i][j], current_board[ni][nj] = current_board[ni][nj], 0
+                i, j = ni, nj
+            
+            if (index + 1) % cache.interval == 0:
+                cache.store(chromosome[:index + 1], current_board, (i, j), start_key)
+        
+        self.moves_simulated += len(chromosome) - prefix_length
+        return PuzzleState(current_board)
+    
+    def cache_statistics(self, generations):
+        """Prefix cache statistics for the run result"""
+        generations = max(generations, 1)
+        return {
+            "cache_hit_rate": self.prefix_cache.hit_rate() if self.prefix_cache else 0.0,
+            "moves_requested_per_generation": self.moves_requested / generations,
+            "moves_simulated_per_generation": self.moves_simulated / generations,
+            "moves_simulated_reduction": (1 - self.moves_simulated / self.moves_requested
+                                          if self.moves_requested else 0.0)
+        }
+    
     def fitness_function(self, chromosome, start_board):
         """Calculate fitness of a chromosome"""
         state = self.chromosome_to_state(chromosome, start_board)
@@ -135,10 +236,35 @@ class GeneticAlgorithm:
 
         return mutated
     
-    def run(self, start_board):
+    def next_generation(self, population, start_board):
+        """Breed the next generation from a population sorted by fitness"""
+        new_population = []
+        elite_size = max(1, self.population_size // 10)
+        new_population.extend(population[:elite_size])
+        
+        while len(new_population) < self.population_size:
+            parent1, parent2 = self.selection(population)
+            child1, child2 = self.crossover(parent1, parent2)
+            child1 = self.mutation(child1)
+            child2 = self.mutation(child2)
+            
+            fitness1 = self.fitness_function(child1, start_board)
+            fitness2 = self.fitness_function(child2, start_board)
+            
+            new_population.append((child1, fitness1))
+            if len(new_population) < self.population_size:
+                new_population.append((child2, fitness2))
+        
+        return new_population
+    
+    def run(self, start_board, tracer=None):
         """Main GA execution"""
+        if tracer is not None:
+            tracer.start()
         population = self.create_initial_population(start_board)
         nodes_expanded = len(population)  # Initial population count
+        if tracer is not None:
+            tracer.on_generate(len(population))
         
         for generation in range(self.max_generations):
             population.sort(key=lambda x: x[1], reverse=True)
@@ -151,40 +277,29 @@ class GeneticAlgorithm:
             best_chromosome = population[0][0]
             best_state = self.chromosome_to_state(best_chromosome, start_board)
             
+            if tracer is not None:
+                tracer.on_expand(len(population), 0)
+            
             if best_state.board == self.goal_board:
-                return {
+                return attach_trace({
                     "solution_found": True,
                     "solution": best_chromosome,
                     "generations": generation + 1,
                     "best_fitness": best_fitness,
                     "path_length": len(best_chromosome),
-                    "fitness_history": self.best_fitness_history
-                }
+                    "fitness_history": self.best_fitness_history,
+                    **self.cache_statistics(generation + 1)
+                }, tracer)
             
-            new_population = []
-            elite_size = max(1, self.population_size // 10)
-            new_population.extend(population[:elite_size])
-            
-            while len(new_population) < self.population_size:
-                parent1, parent2 = self.selection(population)
-                child1, child2 = self.crossover(parent1, parent2)
-                child1 = self.mutation(child1)
-                child2 = self.mutation(child2)
-                
-                fitness1 = self.fitness_function(child1, start_board)
-                fitness2 = self.fitness_function(child2, start_board)
-                
-                new_population.append((child1, fitness1))
-                if len(new_population) < self.population_size:
-                    new_population.append((child2, fitness2))
-            
-            population = new_population
+            population = self.next_generation(population, start_board)
+            if tracer is not None:
+                tracer.on_generate(len(population))
         
         population.sort(key=lambda x: x[1], reverse=True)
         best_chromosome = population[0][0]
         best_state = self.chromosome_to_state(best_chromosome, start_board)
         
-        return {
+        return attach_trace({
             "solution_found": best_state.board == self.goal_board,
             "solution": best_chromosome,
             "generations": self.max_generations,
@@ -192,11 +307,50 @@ class GeneticAlgorithm:
             "final_state": best_state.board,
             "distance_to_goal": manhattan_distance(best_state, self.goal_board),
             "nodes_expanded": nodes_expanded,
-            "fitness_history": self.best_fitness_history
-        }
+            "fitness_history": self.best_fitness_history,
+            **self.cache_statistics(self.max_generations)
+        }, tracer)
 
-def genetic_algorithm_search(start_board, goal_board):
+def build_path(start_board, moves):
+    """
+    Replay a move sequence into a path of (move, board_before_move) tuples
+    :param start_board: Starting board configuration
+    :param moves: Chromosome (list of move names)
+    :return: List of (move, board) tuples
+    """
+    path = []
+    current_board = [row[:] for row in start_board]
+    
+    for move in moves:
+        path.append((move, [row[:] for row in current_board]))
+        
+        blank_pos = None
+        for i in range(3):
+            for j in range(3):
+                if current_board[i][j] == 0:
+                    blank_pos = (i, j)
+                    break
+            if blank_pos:
+                break
+        
+        i, j = blank_pos
+        
+        if move == 'Up' and i > 0:
+            current_board[i][j], current_board[i-1][j] = current_board[i-1][j], current_board[i][j]
+        elif move == 'Down' and i < 2:
+            current_board[i][j], current_board[i+1][j] = current_board[i+1][j], current_board[i][j]
+        elif move == 'Left' and j > 0:
+            current_board[i][j], current_board[i][j-1] = current_board[i][j-1], current_board[i][j]
+        elif move == 'Right' and j < 2:
+            current_board[i][j], current_board[i][j+1] = current_board[i][j+1], current_board[i][j]
+    
+    return path
+
+def genetic_algorithm_search(start_board, goal_board, tracer=None):
     """Wrapper function for Genetic Algorithm"""
+    if not is_solvable(start_board, goal_board):
+        return unsolvable_result()
+    
     ga = GeneticAlgorithm(
         goal_board=goal_board,
         population_size=50,
@@ -205,36 +359,44 @@ def genetic_algorithm_search(start_board, goal_board):
         crossover_rate=0.7
     )
     
-    result = ga.run(start_board)
+    result = ga.run(start_board, tracer)
     
     if result["solution_found"]:
-        path = []
-        current_board = [row[:] for row in start_board]
-        
-        for move in result["solution"]:
-            path.append((move, [row[:] for row in current_board]))
-            
-            blank_pos = None
-            for i in range(3):
-                for j in range(3):
-                    if current_board[i][j] == 0:
-                        blank_pos = (i, j)
-                        break
-                if blank_pos:
-                    break
-            
-            i, j = blank_pos
-            
-            if move == 'Up' and i > 0:
-                current_board[i][j], current_board[i-1][j] = current_board[i-1][j], current_board[i][j]
-            elif move == 'Down' and i < 2:
-                current_board[i][j], current_board[i+1][j] = current_board[i+1][j], current_board[i][j]
-            elif move == 'Left' and j > 0:
-                current_board[i][j], current_board[i][j-1] = current_board[i][j-1], current_board[i][j]
-            elif move == 'Right' and j < 2:
-                current_board[i][j], current_board[i][j+1] = current_board[i][j+1], current_board[i][j]
-        
+        path = build_path(start_board, result["solution"])
         result["path"] = path
         result["path_length"] = len(path)
     
     return result
+
+def check_prefix_cache(goal_board, start_boards, seed=0, **settings):
+    """
+    Check that one cached GeneticAlgorithm reused across start boards matches
+    fresh uncached runs (prefix_cache_size=0) under the same seeds
+    :param settings: Further GeneticAlgorithm keyword arguments
+    :return: List of mismatch descriptions (empty when the cache is transparent)
+    """
+    reused = GeneticAlgorithm(goal_board, **settings)
+    mismatches = []
+    for index, start_board in enumerate(start_boards):
+        random.seed(seed + index)
+        cached = reused.run(start_board)
+        random.seed(seed + index)
+        plain = GeneticAlgorithm(goal_board, prefix_cache_size=0, **settings).run(start_board)
+
+        for key in ("solution_found", "solution", "generations", "best_fitness"):
+            if cached.get(key) != plain.get(key):
+                mismatches.append(f"start {index}: {key} differs ({cached.get(key)!r} vs {plain.get(key)!r})")
+        if cached["solution_found"]:
+            replay = GeneticAlgorithm(goal_board, prefix_cache_size=0)
+            if replay.chromosome_to_state(cached["solution"], start_board).board != goal_board:
+                mismatches.append(f"start {index}: reported solution does not reach the goal")
+    return mismatches
+
+if __name__ == "__main__":
+    from utils.generator import GOAL_BOARD, boards_at_depth
+
+    starts = boards_at_depth(8, 3, random.Random(0), GOAL_BOARD)
+    problems = check_prefix_cache(GOAL_BOARD, starts, population_size=50, max_generations=100,
+                                  mutation_rate=0.15, crossover_rate=0.7)
+    print("\n".join(problems) or "✓ Reused cached instance matches uncached runs")
+    raise SystemExit(1 if problems else 0)
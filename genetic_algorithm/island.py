@@ -0,0 +1,176 @@
+import multiprocessing as mp
+import queue
+import random
+import time
+from genetic_algorithm.genetic import GeneticAlgorithm, build_path
+from utils.solvability import is_solvable, unsolvable_result
+
+# (mutation_rate, crossover_rate) per island, cycled when there are more islands
+ISLAND_PARAMETERS = [
+    (0.15, 0.7),
+    (0.10, 0.8),
+    (0.20, 0.6),
+    (0.05, 0.9),
+]
+
+def island_worker(island_id, start_board, goal_board, settings, inbox, outbox, results, stop_event):
+    """
+    Evolve one island until it solves, runs out of generations or another island solves.
+    Every `migration_interval` generations the top individuals are sent to the next
+    island in the ring and any arrivals replace the worst individuals.
+    """
+    # Migrants left in a queue when an island stops are not needed
+    inbox.cancel_join_thread()
+    outbox.cancel_join_thread()
+
+    random.seed(settings["seed"])
+    ga = GeneticAlgorithm(
+        goal_board=goal_board,
+        population_size=settings["population_size"],
+        max_generations=settings["max_generations"],
+        mutation_rate=settings["mutation_rate"],
+        crossover_rate=settings["crossover_rate"]
+    )
+
+    population = ga.create_initial_population(start_board)
+    nodes_expanded = len(population)
+    generations = 0
+    migrants_received = 0
+
+    for generation in range(ga.max_generations):
+        if stop_event.is_set():
+            break
+
+        population.sort(key=lambda x: x[1], reverse=True)
+        generations = generation + 1
+        ga.best_fitness_history.append(population[0][1])
+        ga.avg_fitness_history.append(sum(f for _, f in population) / len(population))
+
+        best_chromosome = population[0][0]
+        if ga.chromosome_to_state(best_chromosome, start_board).board == goal_board:
+            results.put(("solution", island_id, best_chromosome, generations, time.time()))
+            stop_event.set()
+            break
+
+        if generation and generation % settings["migration_interval"] == 0:
+            outbox.put(population[:settings["migrants"]])
+            arrivals = []
+            try:
+                while True:
+                    arrivals.extend(inbox.get_nowait())
+            except queue.Empty:
+                pass
+            if arrivals:
+                arrivals = arrivals[:len(population) - 1]
+                population[len(population) - len(arrivals):] = arrivals
+                population.sort(key=lambda x: x[1], reverse=True)
+                migrants_received += len(arrivals)
+
+        population = ga.next_generation(population, start_board)
+        nodes_expanded += len(population)
+
+    results.put(("report", island_id, {
+        "generations": generations,
+        "best_fitness": max(f for _, f in population),
+        "fitness_history": ga.best_fitness_history,
+        "avg_fitness_history": ga.avg_fitness_history,
+        "nodes_expanded": nodes_expanded,
+        "migrants_received": migrants_received,
+        "mutation_rate": settings["mutation_rate"],
+        "crossover_rate": settings["crossover_rate"]
+    }))
+
+def island_model_search(start_board, goal_board, islands=4, population_size=50,
+                        max_generations=100, migration_interval=10, migrants=2, seed=None):
+    """
+    Island-model Genetic Algorithm running one GeneticAlgorithm population per process
+    :param start_board: Starting board configuration
+    :param goal_board: Goal board configuration
+    :param islands: Number of island processes
+    :param population_size: Population size of each island
+    :param max_generations: Generation limit of each island
+    :param migration_interval: Generations between migrations
+    :param migrants: Individuals sent to the next island per migration
+    :param seed: Base random seed (island i uses seed + i)
+    :return: Dictionary with results
+    """
+    if not is_solvable(start_board, goal_board):
+        return unsolvable_result()
+    
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+
+    ctx = mp.get_context()
+    inboxes = [ctx.Queue() for _ in range(islands)]
+    results = ctx.Queue()
+    stop_event = ctx.Event()
+
+    start_time = time.time()
+    workers = []
+    for island_id in range(islands):
+        mutation_rate, crossover_rate = ISLAND_PARAMETERS[island_id % len(ISLAND_PARAMETERS)]
+        settings = {
+            "seed": seed + island_id,
+            "population_size": population_size,
+            "max_generations": max_generations,
+            "mutation_rate": mutation_rate,
+            "crossover_rate": crossover_rate,
+            "migration_interval": migration_interval,
+            "migrants": migrants
+        }
+        worker = ctx.Process(
+            target=island_worker,
+            args=(island_id, start_board, goal_board, settings,
+                  inboxes[island_id], inboxes[(island_id + 1) % islands], results, stop_event),
+            daemon=True
+        )
+        worker.start()
+        workers.append(worker)
+
+    solution = None
+    reports = {}
+    while len(reports) < islands:
+        try:
+            message = results.get(timeout=1)
+        except queue.Empty:
+            if not any(worker.is_alive() for worker in workers):
+                break
+            continue
+        if message[0] == "solution" and solution is None:
+            solution = message
+        elif message[0] == "report":
+            reports[message[1]] = message[2]
+
+    for worker in workers:
+        worker.join()
+
+    result = {
+        "solution_found": solution is not None,
+        "islands": islands,
+        "seed": seed,
+        "nodes_expanded": sum(r["nodes_expanded"] for r in reports.values()),
+        "island_histories": {i: reports[i]["fitness_history"] for i in sorted(reports)},
+        "island_reports": [reports[i] for i in sorted(reports)],
+        "best_fitness": max((r["best_fitness"] for r in reports.values()), default=0.0),
+    }
+
+    if solution is not None:
+        _, island_id, chromosome, generations, solved_at = solution
+        path = build_path(start_board, chromosome)
+        result.update({
+            "solution": chromosome,
+            "path": path,
+            "path_length": len(path),
+            "winning_island": island_id,
+            "generations": generations,
+            "time_to_solution": solved_at - start_time,
+            "fitness_history": reports.get(island_id, {}).get("fitness_history", [])
+        })
+    else:
+        best_island = max(reports, key=lambda i: reports[i]["best_fitness"], default=None)
+        result.update({
+            "generations": max((r["generations"] for r in reports.values()), default=0),
+            "fitness_history": reports[best_island]["fitness_history"] if reports else []
+        })
+
+    return result
@@ -0,0 +1,273 @@
+import time
+import numpy as np
+from genetic_algorithm.genetic import GeneticAlgorithm
+
+MOVES = ['Up', 'Down', 'Left', 'Right']
+MOVE_DELTAS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+PAD = -1
+MAX_CHROMOSOME_LENGTH = 100
+
+
+def build_move_table(size=3):
+    """
+    Build the blank move table
+    :param size: Board width
+    :return: int8 array [blank_index, move] -> new blank index (same index for a wall)
+    """
+    table = np.zeros((size * size, len(MOVES)), dtype=np.int8)
+    for pos in range(size * size):
+        i, j = divmod(pos, size)
+        for m, (di, dj) in enumerate(MOVE_DELTAS):
+            ni, nj = i + di, j + dj
+            if 0 <= ni < size and 0 <= nj < size:
+                table[pos, m] = ni * size + nj
+            else:
+                table[pos, m] = pos
+    return table
+
+
+def build_distance_table(goal_board):
+    """
+    Build the Manhattan distance table
+    :param goal_board: Goal board configuration
+    :return: int8 array [tile, position] -> distance of tile at position from its goal
+    """
+    size = len(goal_board)
+    cells = size * size
+    table = np.zeros((cells, cells), dtype=np.int8)
+    for gi in range(size):
+        for gj in range(size):
+            tile = goal_board[gi][gj]
+            if tile == 0:
+                continue
+            for pos in range(cells):
+                i, j = divmod(pos, size)
+                table[tile, pos] = abs(i - gi) + abs(j - gj)
+    return table
+
+
+class VectorizedGeneticAlgorithm:
+    """
+    Genetic Algorithm with the whole population held in NumPy arrays.
+
+    Chromosomes are rows of an int8 matrix padded with PAD past their length,
+    so every generation is simulated and scored in a single pass.
+    """
+
+    def __init__(self, goal_board, population_size=100, max_generations=500,
+                 mutation_rate=0.1, crossover_rate=0.8, seed=None):
+        self.goal_board = goal_board
+        self.population_size = population_size
+        self.max_generations = max_generations
+        self.mutation_rate = mutation_rate
+        self.crossover_rate = crossover_rate
+        self.rng = np.random.default_rng(seed)
+
+        self.size = len(goal_board)
+        self.goal_flat = np.array([cell for row in goal_board for cell in row], dtype=np.int8)
+        self.move_table = build_move_table(self.size)
+        self.distance_table = build_distance_table(goal_board)
+
+        # Statistics tracking
+        self.best_fitness_history = []
+        self.avg_fitness_history = []
+
+    def create_initial_population(self):
+        """Create a random population as (chromosomes, lengths)"""
+        n = self.population_size
+        lengths = self.rng.integers(10, 51, size=n).astype(np.int16)
+        chromosomes = self.rng.integers(0, len(MOVES), size=(n, MAX_CHROMOSOME_LENGTH)).astype(np.int8)
+        chromosomes[np.arange(MAX_CHROMOSOME_LENGTH) >= lengths[:, None]] = PAD
+        return chromosomes, lengths
+
+    def simulate(self, chromosomes, lengths, start_board):
+        """
+        Replay every chromosome from the start board in parallel
+        :return: (boards, blanks) - final flat boards and blank indices
+        """
+        n = len(lengths)
+        rows = np.arange(n)
+        start_flat = np.array([cell for row in start_board for cell in row], dtype=np.int8)
+        boards = np.tile(start_flat, (n, 1))
+        blanks = np.full(n, int(np.argmin(start_flat != 0)), dtype=np.intp)
+
+        for t in range(int(lengths.max(initial=0))):
+            moves = chromosomes[:, t]
+            active = t < lengths
+            targets = np.where(active, self.move_table[blanks, np.maximum(moves, 0)], blanks)
+            boards[rows, blanks] = boards[rows, targets]
+            boards[rows, targets] = 0
+            blanks = targets
+
+        return boards, blanks
+
+    def distances(self, boards):
+        """Manhattan distance of every board to the goal"""
+        cells = boards.shape[1]
+        return self.distance_table[boards, np.arange(cells)].sum(axis=1, dtype=np.int32)
+
+    def fitness(self, chromosomes, lengths, start_board):
+        """Calculate fitness of the whole population (same formula as GeneticAlgorithm)"""
+        boards, _ = self.simulate(chromosomes, lengths, start_board)
+        distance = self.distances(boards)
+        fitness = 1.0 / (distance + 1) - lengths * 0.01
+        return np.maximum(fitness, 0.001), boards
+
+    def selection(self, fitness, count):
+        """Tournament selection (size 3) of `count` parent indices"""
+        tournament = self.rng.integers(0, len(fitness), size=(count, 3))
+        winners = np.argmax(fitness[tournament], axis=1)
+        return tournament[np.arange(count), winners]
+
+    def crossover(self, chromosomes, lengths, parents1, parents2):
+        """Single-point crossover of paired parent rows"""
+        p1, p2 = chromosomes[parents1], chromosomes[parents2]
+        len1, len2 = lengths[parents1], lengths[parents2]
+        n = len(parents1)
+
+        min_len = np.minimum(len1, len2)
+        crossing = (self.rng.random(n) <= self.crossover_rate) & (min_len > 1)
+        points = 1 + (self.rng.random(n) * np.maximum(min_len - 1, 1)).astype(np.int16)
+        points = np.where(crossing, points, MAX_CHROMOSOME_LENGTH)
+
+        head = np.arange(MAX_CHROMOSOME_LENGTH) < points[:, None]
+        child1 = np.where(head, p1, p2)
+        child2 = np.where(head, p2, p1)
+        child1_len = np.where(crossing, len2, len1)
+        child2_len = np.where(crossing, len1, len2)
+
+        return (np.concatenate([child1, child2]),
+                np.concatenate([child1_len, child2_len]).astype(np.int16))
+
+    def mutation(self, chromosomes, lengths):
+        """Point mutation plus at most one insertion or deletion per chromosome"""
+        n = len(lengths)
+        columns = np.arange(MAX_CHROMOSOME_LENGTH)
+        live = columns < lengths[:, None]
+
+        point = live & (self.rng.random(chromosomes.shape) < self.mutation_rate)
+        chromosomes = np.where(point, self.rng.integers(0, len(MOVES), size=chromosomes.shape),
+                               chromosomes).astype(np.int8)
+
+        indel = self.rng.random(n) < self.mutation_rate * lengths / 2
+        insert = indel & (self.rng.random(n) < 0.5) & (lengths < MAX_CHROMOSOME_LENGTH)
+        delete = indel & ~insert & (lengths > 5)
+        positions = (self.rng.random(n) * (lengths + insert)).astype(np.int16)
+
+        # Shift each row right (insert) or left (delete) around its position
+        offsets = np.zeros(chromosomes.shape, dtype=np.intp)
+        offsets[insert] = -(columns > positions[insert, None]).astype(np.intp)
+        offsets[delete] = (columns >= positions[delete, None]).astype(np.intp)
+        source = np.clip(columns + offsets, 0, MAX_CHROMOSOME_LENGTH - 1)
+        shifted = np.take_along_axis(chromosomes, source, axis=1)
+
+        rows = np.nonzero(insert)[0]
+        shifted[rows, positions[rows]] = self.rng.integers(0, len(MOVES), size=len(rows))
+
+        lengths = (lengths + insert - delete).astype(np.int16)
+        shifted[columns >= lengths[:, None]] = PAD
+        return shifted, lengths
+
+    def decode(self, chromosome, length):
+        """Convert an encoded row back to a list of move names"""
+        return [MOVES[m] for m in chromosome[:length]]
+
+    def run(self, start_board):
+        """Main GA execution"""
+        chromosomes, lengths = self.create_initial_population()
+        fitness, boards = self.fitness(chromosomes, lengths, start_board)
+        nodes_expanded = self.population_size
+        elite_size = max(1, self.population_size // 10)
+
+        for generation in range(self.max_generations):
+            best = int(np.argmax(fitness))
+            self.best_fitness_history.append(float(fitness[best]))
+            self.avg_fitness_history.append(float(fitness.mean()))
+
+            if np.array_equal(boards[best], self.goal_flat):
+                best_chromosome = self.decode(chromosomes[best], lengths[best])
+                return {
+                    "solution_found": True,
+                    "solution": best_chromosome,
+                    "generations": generation + 1,
+                    "best_fitness": float(fitness[best]),
+                    "path_length": len(best_chromosome),
+                    "nodes_expanded": nodes_expanded,
+                    "fitness_history": self.best_fitness_history
+                }
+
+            elite = np.argpartition(-fitness, elite_size - 1)[:elite_size]
+
+            pairs = (self.population_size - elite_size + 1) // 2
+            parents1 = self.selection(fitness, pairs)
+            parents2 = self.selection(fitness, pairs)
+            children, child_lengths = self.crossover(chromosomes, lengths, parents1, parents2)
+            children, child_lengths = self.mutation(children, child_lengths)
+
+            # Interleave so that truncation keeps child1/child2 pairs like GeneticAlgorithm.run
+            order = np.arange(2 * pairs).reshape(2, pairs).T.ravel()
+            needed = self.population_size - elite_size
+            children, child_lengths = children[order][:needed], child_lengths[order][:needed]
+            child_fitness, child_boards = self.fitness(children, child_lengths, start_board)
+            nodes_expanded += needed
+
+            chromosomes = np.concatenate([chromosomes[elite], children])
+            lengths = np.concatenate([lengths[elite], child_lengths])
+            fitness = np.concatenate([fitness[elite], child_fitness])
+            boards = np.concatenate([boards[elite], child_boards])
+
+        best = int(np.argmax(fitness))
+        best_chromosome = self.decode(chromosomes[best], lengths[best])
+        final_board = boards[best].reshape(self.size, self.size).tolist()
+
+        return {
+            "solution_found": final_board == self.goal_board,
+            "solution": best_chromosome,
+            "generations": self.max_generations,
+            "best_fitness": float(fitness[best]),
+            "final_state": final_board,
+            "distance_to_goal": int(self.distances(boards[best:best + 1])[0]),
+            "nodes_expanded": nodes_expanded,
+            "fitness_history": self.best_fitness_history
+        }
+
+
+def benchmark_generations(start_board, goal_board, population_sizes=(1000, 10000, 100000),
+                          generations=5):
+    """
+    Compare generations/sec of GeneticAlgorithm.run and VectorizedGeneticAlgorithm.run
+    :param population_sizes: Population sizes to measure
+    :param generations: Generations to run per measurement
+    :return: List of dicts with one row per population size
+    """
+    # Swapping two tiles flips parity, so the goal is never matched and both
+    # engines run every generation
+    size = len(goal_board)
+    unreachable = [row[:] for row in goal_board]
+    (i1, j1), (i2, j2) = [divmod(pos, size) for pos in range(size * size)
+                          if goal_board[pos // size][pos % size] != 0][:2]
+    unreachable[i1][j1], unreachable[i2][j2] = unreachable[i2][j2], unreachable[i1][j1]
+
+    rows = []
+    for size in population_sizes:
+        row = {"population_size": size}
+        for name, engine in (("python", GeneticAlgorithm), ("vectorized", VectorizedGeneticAlgorithm)):
+            ga = engine(goal_board=unreachable, population_size=size, max_generations=generations)
+            start = time.perf_counter()
+            ga.run(start_board)
+            elapsed = time.perf_counter() - start
+            row[f"{name}_gen_per_sec"] = generations / elapsed if elapsed > 0 else float('inf')
+        row["speedup"] = row["vectorized_gen_per_sec"] / row["python_gen_per_sec"]
+        rows.append(row)
+    return rows
+
+
+if __name__ == "__main__":
+    from test_cases import TEST_CASES
+
+    case = TEST_CASES["hard"]
+    print(f"{'Population':<12} {'Python gen/s':<15} {'NumPy gen/s':<15} {'Speedup':<10}")
+    print("-" * 55)
+    for row in benchmark_generations(case["start"], case["goal"]):
+        print(f"{row['population_size']:<12} {row['python_gen_per_sec']:<15.3f} "
+              f"{row['vectorized_gen_per_sec']:<15.3f} {row['speedup']:<10.1f}")
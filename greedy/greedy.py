@@ -0,0 +1,129 @@
+import heapq
+from itertools import count
+from utils.state import PuzzleState
+from utils.moves import get_possible_moves, get_path, add_quality
+from utils.heuristics import get_heuristic
+from utils.tracing import attach_trace
+from utils.solvability import is_solvable, unsolvable_result
+
+def greedy_best_first_search(start_board, goal_board, heuristic='manhattan', optimal_length=None,
+                             tracer=None):
+    """
+    Greedy Best-First Search for 8-Puzzle (orders the frontier by h only)
+    :param start_board: Starting board configuration
+    :param goal_board: Goal board configuration
+    :param heuristic: 'manhattan', 'misplaced' or 'linear_conflict'
+    :param optimal_length: Optional known optimal length, adds 'suboptimality' to the result
+    :param tracer: Optional SearchTracer for event counts and frontier samples
+    :return: Dictionary with results
+    """
+    if not is_solvable(start_board, goal_board):
+        return unsolvable_result()
+    
+    h_func = get_heuristic(heuristic, goal_board)
+    start_state = PuzzleState(start_board)
+    if tracer is not None:
+        tracer.start()
+    
+    # Ties on h are broken first-in, first-out
+    order = count()
+    open_list = [(h_func(start_state), next(order), start_state)]
+    seen = {tuple(map(tuple, start_board))}
+    nodes_expanded = 0
+    
+    while open_list:
+        current_h, _, current_state = heapq.heappop(open_list)
+        
+        if current_state.board == goal_board:
+            return add_quality(attach_trace({
+                "path": get_path(current_state),
+                "nodes_expanded": nodes_expanded,
+                "path_length": current_state.g,
+                "solution_found": True
+            }, tracer), optimal_length)
+        
+        nodes_expanded += 1
+        if tracer is not None:
+            tracer.on_expand(len(open_list), nodes_expanded, current_h)
+        
+        for move_name, next_state in get_possible_moves(current_state):
+            next_key = tuple(map(tuple, next_state.board))
+            
+            # The first path to a state is kept; greedy search never reopens
+            if next_key in seen:
+                if tracer is not None:
+                    tracer.on_duplicate()
+                continue
+            
+            seen.add(next_key)
+            heapq.heappush(open_list, (h_func(next_state), next(order), next_state))
+            if tracer is not None:
+                tracer.on_generate()
+    
+    return add_quality(attach_trace({"solution_found": False, "nodes_expanded": nodes_expanded},
+                                    tracer), optimal_length)
+
+def beam_search(start_board, goal_board, beam_width=50, heuristic='manhattan', optimal_length=None,
+                tracer=None):
+    """
+    Beam Search for 8-Puzzle
+    Breadth-first by depth, keeping only the `beam_width` successors with the lowest h
+    :param start_board: Starting board configuration
+    :param goal_board: Goal board configuration
+    :param beam_width: States kept per depth
+    :param heuristic: 'manhattan', 'misplaced' or 'linear_conflict'
+    :param optimal_length: Optional known optimal length, adds 'suboptimality' to the result
+    :param tracer: Optional SearchTracer for event counts and frontier samples
+    :return: Dictionary with results
+    """
+    if not is_solvable(start_board, goal_board):
+        return unsolvable_result()
+    if beam_width < 1:
+        raise ValueError("beam_width must be at least 1")
+    
+    h_func = get_heuristic(heuristic, goal_board)
+    start_state = PuzzleState(start_board)
+    if tracer is not None:
+        tracer.start()
+    
+    beam = [start_state]
+    seen = {tuple(map(tuple, start_board))}
+    nodes_expanded = 0
+    
+    while beam:
+        candidates = []
+        
+        for current_state in beam:
+            if current_state.board == goal_board:
+                return add_quality(attach_trace({
+                    "path": get_path(current_state),
+                    "nodes_expanded": nodes_expanded,
+                    "path_length": current_state.g,
+                    "solution_found": True,
+                    "beam_width": beam_width
+                }, tracer), optimal_length)
+            
+            nodes_expanded += 1
+            if tracer is not None:
+                tracer.on_expand(len(candidates), nodes_expanded, current_state.h)
+            
+            for move_name, next_state in get_possible_moves(current_state):
+                next_key = tuple(map(tuple, next_state.board))
+                if next_key in seen:
+                    if tracer is not None:
+                        tracer.on_duplicate()
+                    continue
+                
+                seen.add(next_key)
+                next_state.h = h_func(next_state)
+                candidates.append((next_state.h, len(candidates), next_state))
+                if tracer is not None:
+                    tracer.on_generate()
+        
+        beam = [state for _, _, state in heapq.nsmallest(beam_width, candidates)]
+    
+    return add_quality(attach_trace({
+        "solution_found": False,
+        "nodes_expanded": nodes_expanded,
+        "beam_width": beam_width
+    }, tracer), optimal_length)
@@ -1,18 +1,28 @@
 import random
 from utils.state import PuzzleState
 from utils.moves import get_possible_moves
-from utils.heuristics import manhattan_distance
+from utils.heuristics import get_heuristic
+from utils.tracing import attach_trace
+from utils.solvability import is_solvable, unsolvable_result
 
-def hill_climbing(start_board, goal_board, max_iterations=1000):
+def hill_climbing(start_board, goal_board, max_iterations=1000, heuristic='manhattan', tracer=None):
     """
     Hill Climbing for 8-Puzzle
     :param start_board: Starting board configuration
     :param goal_board: Goal board configuration
     :param max_iterations: Maximum number of iterations
+    :param heuristic: 'manhattan', 'misplaced', 'linear_conflict' or 'walking_distance'
+    :param tracer: Optional SearchTracer for event counts and frontier samples
     :return: Dictionary with results
     """
+    if not is_solvable(start_board, goal_board):
+        return unsolvable_result()
+    
+    h_func = get_heuristic(heuristic, goal_board)
     current_state = PuzzleState(start_board)
-    current_h = manhattan_distance(current_state, goal_board)
+    if tracer is not None and tracer.start_time is None:
+        tracer.start()
+    current_h = h_func(current_state)
     
     path = []
     nodes_expanded = 0
@@ -20,37 +30,40 @@ def hill_climbing(start_board, goal_board, max_iterations=1000):
     for iteration in range(max_iterations):
         # Check if goal is reached
         if current_state.board == goal_board:
-            return {
+            return attach_trace({
                 "path": path,
                 "nodes_expanded": nodes_expanded,
                 "path_length": len(path),
                 "solution_found": True,
                 "iterations": iteration + 1
-            }
+            }, tracer)
         
         # Get all possible moves
         moves = get_possible_moves(current_state)
         nodes_expanded += len(moves)
+        if tracer is not None:
+            tracer.on_expand(len(moves), len(path), current_h)
+            tracer.on_generate(len(moves))
         
         # Find the best neighbor
         best_neighbor = None
         best_h = current_h
         
         for move_name, next_state in moves:
-            h = manhattan_distance(next_state, goal_board)
+            h = h_func(next_state)
             if h < best_h:
                 best_h = h
                 best_neighbor = (move_name, next_state)
         
         # If no better neighbor, we're at a local optimum
         if best_neighbor is None:
-            return {
+            return attach_trace({
                 "solution_found": False,
                 "nodes_expanded": nodes_expanded,
                 "final_h": current_h,
                 "iterations": iteration + 1,
                 "local_optimum": True
-            }
+            }, tracer)
         
         # Move to the best neighbor
         move_name, next_state = best_neighbor
@@ -58,22 +71,28 @@ def hill_climbing(start_board, goal_board, max_iterations=1000):
         current_state = next_state
         current_h = best_h
     
-    return {
+    return attach_trace({
         "solution_found": False,
         "nodes_expanded": nodes_expanded,
         "iterations": max_iterations,
         "max_iterations_reached": True
-    }
+    }, tracer)
 
-def hill_climbing_with_restart(start_board, goal_board, restarts=10, max_iterations=500):
+def hill_climbing_with_restart(start_board, goal_board, restarts=10, max_iterations=500,
+                               heuristic='manhattan', tracer=None):
     """
     Hill Climbing with Random Restart
+    :param heuristic: 'manhattan', 'misplaced', 'linear_conflict' or 'walking_distance'
+    :param tracer: Optional SearchTracer for event counts and frontier samples
     """
+    if not is_solvable(start_board, goal_board):
+        return unsolvable_result()
+    
     best_solution = None
     best_h = float('inf')
     
     for restart in range(restarts):
-        result = hill_climbing(start_board, goal_board, max_iterations)
+        result = hill_climbing(start_board, goal_board, max_iterations, heuristic, tracer)
         
         if result["solution_found"]:
             return result
@@ -83,4 +102,4 @@ def hill_climbing_with_restart(start_board, goal_board, restarts=10, max_iterati
             best_h = result["final_h"]
             best_solution = result
     
-    return best_solution or {"solution_found": False}
+    return attach_trace(best_solution or {"solution_found": False}, tracer)
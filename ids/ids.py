@@ -1,44 +1,58 @@
-from utils.state import PuzzleState
-from utils.moves import get_possible_moves, get_path
+from utils.inplace import MutableBoard
+from utils.tracing import attach_trace
+from utils.solvability import is_solvable, unsolvable_result
 
-def depth_limited_dfs(state, goal_board, depth_limit, explored, nodes_expanded):
+def depth_limited_dfs(board, goal_key, depth_limit, explored, nodes_expanded, tracer=None):
     """
     Depth Limited DFS helper function
+    Mutates `board` in place; on success it is left at the goal with its move stack intact.
     """
     # Check if goal is reached
-    if state.board == goal_board:
-        return {
-            "state": state,
-            "nodes_expanded": nodes_expanded,
-            "found": True
-        }
+    if board.key() == goal_key:
+        return {"found": True, "nodes_expanded": nodes_expanded[0]}
     
     # Check depth limit
     if depth_limit <= 0:
-        return {"found": False, "nodes_expanded": nodes_expanded}
+        return {"found": False, "nodes_expanded": nodes_expanded[0]}
     
     # Add to explored set
-    explored.add(tuple(map(tuple, state.board)))
+    explored.add(board.key())
     nodes_expanded[0] += 1
+    if tracer is not None:
+        depth = board.depth()
+        tracer.on_expand(depth, len(explored), depth + depth_limit)
     
-    # Generate successors
-    for move_name, next_state in get_possible_moves(state):
-        next_key = tuple(map(tuple, next_state.board))
+    # Generate successors (never the move that undoes the last one)
+    for move in board.successors():
+        board.apply(*move)
         
-        if next_key not in explored:
-            result = depth_limited_dfs(next_state, goal_board, depth_limit - 1, explored, nodes_expanded)
+        if board.key() not in explored:
+            if tracer is not None:
+                tracer.on_generate()
+            result = depth_limited_dfs(board, goal_key, depth_limit - 1, explored, nodes_expanded, tracer)
             if result["found"]:
                 return result
+        elif tracer is not None:
+            tracer.on_duplicate()
+        
+        board.undo()
     
     return {"found": False, "nodes_expanded": nodes_expanded[0]}
 
-def ids(start_board, goal_board, max_depth=50):
+def ids(start_board, goal_board, max_depth=50, tracer=None):
     """
     Iterative Deepening Search for 8-Puzzle
+    :param tracer: Optional SearchTracer for event counts and frontier samples
     """
-    start_state = PuzzleState(start_board)
+    if not is_solvable(start_board, goal_board):
+        return unsolvable_result()
+    
+    board = MutableBoard(start_board)
+    goal_key = tuple(cell for row in goal_board for cell in row)
+    if tracer is not None:
+        tracer.start()
     
-    if start_state.board == goal_board:
+    if board.key() == goal_key:
         return {"path": [], "nodes_expanded": 0}
     
     total_nodes_expanded = 0
@@ -48,22 +62,23 @@ def ids(start_board, goal_board, max_depth=50):
         nodes_expanded = [0]
         
         result = depth_limited_dfs(
-            start_state, 
-            goal_board, 
+            board, 
+            goal_key, 
             depth, 
             explored, 
-            nodes_expanded
+            nodes_expanded,
+            tracer
         )
         
         total_nodes_expanded += nodes_expanded[0]
         
         if result["found"]:
-            return {
-                "path": get_path(result["state"]),
+            return attach_trace({
+                "path": board.path(start_board),
                 "nodes_expanded": total_nodes_expanded,
-                "path_length": result["state"].g,
+                "path_length": board.depth(),
                 "depth_limit": depth,
                 "solution_found": True
-            }
+            }, tracer)
     
-    return {"solution_found": False, "nodes_expanded": total_nodes_expanded}
+    return attach_trace({"solution_found": False, "nodes_expanded": total_nodes_expanded}, tracer)
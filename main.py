@@ -1,35 +1,36 @@
 #!/usr/bin/env python3
 """
 Main script to run 8-Puzzle algorithms with test cases
+
+Examples:
+    python main.py                                  # every standard algorithm on 'easy'
+    python main.py --case hard -a "A* (Manhattan)"
+    python main.py --case very_hard -a DFS -o max_depth=40 --memory off
+    python main.py --file instances.8pz --index 3 -a "A* (Walking Distance)"
+    python main.py --case hard -a auto                  # solver picked by portfolio/selector.py
+    python main.py --list
 """
 
-import time
-from test_cases import TEST_CASES, print_board, get_test_case
-from bfs.bfs import bfs
-from dfs.dfs import dfs
-from ucs.ucs import ucs
-from ids.ids import ids
-from astar.astar import astar_search
-from hill_climbing.hill_climbing import hill_climbing, hill_climbing_with_restart
-from genetic_algorithm.genetic import genetic_algorithm_search
-
-def run_algorithm(algorithm_name, algorithm_func, *args):
+import argparse
+from test_cases import TEST_CASES, print_board
+from utils.memory import MEMORY_MODES, measure_run
+from utils.registry import (ANALYSIS_SOLVERS, SOLVERS, check_options, default_options, get_solver,
+                            parse_options)
+
+def run_algorithm(algorithm_name, algorithm_func, *args, memory_mode='full'):
     """Run single algorithm and measure performance"""
     print(f"\n{'='*50}")
     print(f"Running {algorithm_name}")
     print(f"{'='*50}")
     
-    start_time = time.time()
-    result = algorithm_func(*args)
-    end_time = time.time()
-    
-    result["time_taken"] = end_time - start_time
+    result = measure_run(algorithm_func, *args, memory_mode=memory_mode)
     
     if result.get("solution_found", False):
         print(f"✓ Solution found!")
         print(f"Path length: {result['path_length']}")
         print(f"Nodes expanded: {result.get('nodes_expanded', 'N/A')}")
         print(f"Time taken: {result['time_taken']:.4f} seconds")
+        print_memory(result)
 
         # Show first and last few moves
         path = result.get('path')
@@ -39,90 +40,155 @@ def run_algorithm(algorithm_name, algorithm_func, *args):
                 print(f"Last 5 moves: {[p[0] for p in path[-5:]]}")
     else:
         print(f"✗ No solution found")
+        if result.get('unsolvable', False):
+            print("Start board cannot reach the goal (permutation parity)")
         print(f"Nodes expanded: {result.get('nodes_expanded', 'N/A')}")
         print(f"Time taken: {result.get('time_taken', 0):.4f} seconds")
+        print_memory(result)
     
     return result
 
-def main():
+def print_memory(result):
+    """Print the memory metrics recorded by measure_run"""
+    if 'peak_memory_bytes' in result:
+        print(f"Peak memory: {result['peak_memory_bytes']:,} bytes")
+    if 'peak_rss_delta_bytes' in result:
+        print(f"Peak RSS delta: {result['peak_rss_delta_bytes']:,} bytes")
+    if 'bytes_per_node' in result:
+        print(f"Bytes per node: {result['bytes_per_node']:,.1f}")
+
+# -a value that routes the instance through the learned solver selector
+AUTO = "auto"
+
+def auto_solver(model_path=None):
+    """
+    Solver that lets the trained SolverSelector pick a shortest-path solver per instance
+    :return: Callable solver(start_board, goal_board); the result names the chosen solver
+    """
+    from portfolio.selector import MODEL_PATH, SolverSelector
+    return SolverSelector.load(model_path or MODEL_PATH).solve
+
+def load_instance(path, index=0):
+    """
+    Read one instance from a file
+    :param path: JSON file with 'start' and 'goal' boards (optionally 'optimal_length'),
+                 or a corpus file written by utils.generator
+    :param index: Instance index within a corpus file
+    :return: Test case dict with start, goal, optimal_length and description
+    """
+    if path.endswith('.json'):
+        import json
+
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return {"start": data["start"], "goal": data["goal"],
+                "optimal_length": data.get("optimal_length"), "description": path}
+
+    from utils.corpus import Corpus
+    with Corpus(path) as corpus:
+        start, goal, depth = corpus[index]
+    return {"start": start, "goal": goal, "optimal_length": depth,
+            "description": f"{path} #{index}"}
+
+def list_solvers():
+    """Print every registered solver with its default options"""
+    print(f"{'Algorithm':<25} {'Optimal':<8} {'Defaults':<40}")
+    print("-" * 73)
+    for name, spec in SOLVERS.items():
+        options = ", ".join(f"{k}={v!r}" for k, v in default_options(name).items()) or "-"
+        print(f"{name:<25} {'yes' if spec.get('optimal') else 'no':<8} {options:<40}")
+
+def main(argv=None):
     """Main function"""
+    parser = argparse.ArgumentParser(description="Run 8-Puzzle solvers on one instance")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--case", choices=list(TEST_CASES), default="easy",
+                        help="Built-in test case (default: easy)")
+    source.add_argument("--file", help="JSON instance file or corpus file")
+    parser.add_argument("--index", type=int, default=0, help="Instance index in a corpus file")
+    parser.add_argument("-a", "--algorithm", action="append", choices=list(SOLVERS) + [AUTO],
+                        metavar="NAME", help="Solver to run, or 'auto' to let the trained selector "
+                                             "choose (repeatable; default: the standard set)")
+    parser.add_argument("-o", "--option", action="append", metavar="KEY=VALUE",
+                        help="Keyword option passed to every selected solver (repeatable; requires -a)")
+    parser.add_argument("--memory", choices=MEMORY_MODES, default="full",
+                        help="Memory measurement mode (default: full)")
+    parser.add_argument("--list", action="store_true", help="List registered solvers and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        list_solvers()
+        return 0
+
+    if args.option and not args.algorithm:
+        parser.error("-o/--option requires -a/--algorithm")
+    try:
+        options = parse_options(args.option)
+        for name in args.algorithm or ():
+            if name == AUTO:
+                if options:
+                    raise ValueError("-o/--option cannot be used with -a auto")
+            else:
+                check_options(name, options)
+    except ValueError as e:
+        parser.error(str(e))
+
+    auto = None
+    if AUTO in (args.algorithm or ()):
+        try:
+            auto = auto_solver()
+        except FileNotFoundError as e:
+            parser.error(f"-a auto needs a trained selector model ({e.filename}); "
+                         "run 'python -m portfolio.selector train'")
+
+    if args.file:
+        selected_case = args.file
+        test_case = load_instance(args.file, args.index)
+    else:
+        selected_case = args.case
+        test_case = TEST_CASES[selected_case]
+
     print("8-Puzzle Solver - Test Suite")
     print("=" * 50)
-    
-    # Select test case
-    print("\n📋 Available Test Cases:")
-    for i, (name, case) in enumerate(TEST_CASES.items(), 1):
-        print(f"{i}. {name:12} - {case['description']}")
-    
-    try:
-        choice = int(input("\nEnter test case number (1-4): ").strip())
-        case_names = list(TEST_CASES.keys())
-        selected_case = case_names[choice-1] if 1 <= choice <= 4 else "easy"
-    except (ValueError, IndexError):
-        selected_case = "easy"
-    
-    test_case = TEST_CASES[selected_case]
-    
     print(f"\nSelected Case: {selected_case}")
     print(f"Description: {test_case['description']}")
-    print(f"Optimal length: {test_case['optimal_length']} moves")
-    
+    if test_case.get("optimal_length") is not None:
+        print(f"Optimal length: {test_case['optimal_length']} moves")
+
     print("\nStart Board:")
     print_board(test_case["start"])
-    
+
     print("\nGoal Board:")
     print_board(test_case["goal"])
-    
-    # Run all algorithms
-    results = {}
-    
-    # 1. BFS
-    results['BFS'] = run_algorithm("BFS", bfs, test_case["start"], test_case["goal"])
-    
-    # 2. DFS
-    results['DFS'] = run_algorithm("DFS", dfs, test_case["start"], test_case["goal"])
-    
-    # 3. UCS
-    results['UCS'] = run_algorithm("UCS", ucs, test_case["start"], test_case["goal"])
-    
-    # 4. IDS
-    results['IDS'] = run_algorithm("IDS", ids, test_case["start"], test_case["goal"])
-    
-    # 5. A* Manhattan
-    results['A* Manhattan'] = run_algorithm("A* (Manhattan)", astar_search, 
-                                          test_case["start"], test_case["goal"], 'manhattan')
-    
-    # 6. A* Misplaced
-    results['A* Misplaced'] = run_algorithm("A* (Misplaced)", astar_search,
-                                          test_case["start"], test_case["goal"], 'misplaced')
-    
-    # 7. Hill Climbing
-    results['Hill Climbing'] = run_algorithm("Hill Climbing", hill_climbing,
-                                           test_case["start"], test_case["goal"])
-    
-    # 8. Hill Climbing with Restart
-    results['Hill Climbing (Restart)'] = run_algorithm("Hill Climbing (Restart)", 
-                                                      hill_climbing_with_restart,
-                                                      test_case["start"], test_case["goal"])
+
+    # Run the selected algorithms; each solver module is imported only when it runs
     #Abdelrhman Reda Abdelrhman Torad
-    # 9. Genetic Algorithm
-    results['Genetic Algorithm'] = run_algorithm("Genetic Algorithm", genetic_algorithm_search,
-                                               test_case["start"], test_case["goal"])
-    
+    results = {}
+    for name in args.algorithm or ANALYSIS_SOLVERS:
+        solver = auto if name == AUTO else get_solver(name, **options)
+        result = run_algorithm(name, solver, test_case["start"], test_case["goal"],
+                               memory_mode=args.memory)
+        if "solver" in result:
+            name = f"{name} ({result['solver']})"
+            print(f"Selected solver: {result['solver']}")
+        results[name] = result
+
     # Display comparison table
-    print("\n" + "="*70)
+    print("\n" + "="*84)
     print("COMPARISON TABLE")
-    print("="*70)
-    print(f"{'Algorithm':<25} {'Time (s)':<10} {'Nodes':<10} {'Path Len':<10} {'Found':<10}")
-    print("-"*70)
-    
+    print("="*84)
+    print(f"{'Algorithm':<25} {'Time (s)':<10} {'Nodes':<10} {'Path Len':<10} {'Peak Mem':<14} {'Found':<10}")
+    print("-"*84)
+
     for algo_name, result in results.items():
         time_taken = result.get('time_taken', 0)
         nodes = result.get('nodes_expanded', 'N/A')
         path_len = result.get('path_length', 'N/A')
+        peak = result.get('peak_memory_bytes', result.get('peak_rss_delta_bytes', 'N/A'))
         found = '✓' if result.get('solution_found', False) else '✗'
-        
-        print(f"{algo_name:<25} {time_taken:<10.4f} {nodes:<10} {path_len:<10} {found:<10}")
+
+        print(f"{algo_name:<25} {time_taken:<10.4f} {nodes:<10} {path_len:<10} {peak:<14} {found:<10}")
+    return 0
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Algorithm portfolio racing
+
+Several solvers run on the same instance in parallel processes. In 'first'
+mode the first acceptable result wins and the other processes are terminated
+at once; in 'best' mode every entrant runs until the deadline and the shortest
+path wins. Each race updates a JSON file of per-solver win counts.
+"""
+
+import json
+import os
+import time
+from utils.memory import measure_run
+from utils.parallel import run_tasks
+from utils.registry import SOLVERS, SolverSet
+from utils.solvability import is_solvable, unsolvable_result
+
+DEFAULT_PORTFOLIO = SolverSet(["A* (Manhattan)", "Greedy Best-First", "DFS (depth 40)"])
+
+STATS_PATH = "report/portfolio_stats.json"
+
+def _run_entrant(solver, start_board, goal_board):
+    """Worker process body: one solver on one instance"""
+    return measure_run(solver, start_board, goal_board, memory_mode='off')
+
+def _solved(result):
+    return result.get("solution_found", False)
+
+def load_stats(path=STATS_PATH):
+    """Win statistics: solver -> {'races', 'wins', 'win_time_total'}"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def record_race(entrants, winner, win_time, path=STATS_PATH):
+    """Add one race to the win statistics file"""
+    stats = load_stats(path)
+    for name in entrants:
+        entry = stats.setdefault(name, {"races": 0, "wins": 0, "win_time_total": 0.0})
+        entry["races"] += 1
+        if name == winner:
+            entry["wins"] += 1
+            entry["win_time_total"] += win_time
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(stats, f, indent=2)
+    os.replace(temp_path, path)
+    return stats
+
+def portfolio_search(start_board, goal_board, solvers=None, mode='first', deadline=30.0,
+                     accept=None, stats_path=STATS_PATH):
+    """
+    Race several solvers on one instance
+    :param start_board: Starting board configuration
+    :param goal_board: Goal board configuration
+    :param solvers: Dict of name -> solver function (default: DEFAULT_PORTFOLIO)
+    :param mode: 'first' (first acceptable result wins) or 'best' (shortest path by the deadline)
+    :param deadline: Wall-clock limit in seconds; entrants still running are terminated
+    :param accept: Optional predicate on a result; defaults to any solution found
+    :param stats_path: Win statistics file to update (None to skip recording)
+    :return: The winning result with a 'portfolio' entry describing the race
+    """
+    if mode not in ('first', 'best'):
+        raise ValueError("mode must be 'first' or 'best'")
+    if not is_solvable(start_board, goal_board):
+        return unsolvable_result()
+
+    solvers = solvers or DEFAULT_PORTFOLIO
+    accept = accept or _solved
+
+    def on_result(name, status, value, elapsed):
+        # Returning True cancels the remaining entrants
+        return mode == 'first' and status == "ok" and accept(value)
+
+    started = time.perf_counter()
+    tasks = [(name, (solver, start_board, goal_board)) for name, solver in solvers.items()]
+    outcomes = run_tasks(tasks, _run_entrant, workers=len(tasks), timeout=deadline,
+                         on_result=on_result)
+    race_time = time.perf_counter() - started
+
+    candidates = [(name, value) for name, (status, value, _) in outcomes.items()
+                  if status == "ok" and accept(value)]
+    if mode == 'first':
+        # Only the entrant that triggered cancellation can be acceptable, bar simultaneous finishes
+        candidates.sort(key=lambda item: outcomes[item[0]][2])
+    else:
+        candidates.sort(key=lambda item: (item[1].get("path_length", float('inf')),
+                                          outcomes[item[0]][2]))
+
+    if candidates:
+        winner, result = candidates[0]
+    else:
+        winner, result = None, {"solution_found": False, "nodes_expanded": 0}
+
+    result["portfolio"] = {
+        "winner": winner,
+        "mode": mode,
+        "race_time": race_time,
+        "entrants": {name: {"status": status, "elapsed": elapsed,
+                            "solution_found": bool(value and _solved(value))}
+                     for name, (status, value, elapsed) in outcomes.items()}
+    }
+    if stats_path:
+        record_race(list(solvers), winner, outcomes[winner][2] if winner else 0.0, stats_path)
+    return result
+
+def print_stats(stats):
+    """Print win counts, win rates and mean winning time per solver"""
+    print(f"{'Solver':<25} {'Races':<7} {'Wins':<6} {'Win Rate':<9} {'Mean Win (s)':<12}")
+    print("-" * 62)
+    for name, entry in sorted(stats.items(), key=lambda item: -item[1]["wins"]):
+        rate = entry["wins"] / entry["races"] if entry["races"] else 0.0
+        mean = entry["win_time_total"] / entry["wins"] if entry["wins"] else 0.0
+        print(f"{name:<25} {entry['races']:<7} {entry['wins']:<6} {rate:<9.1%} {mean:<12.4f}")
+
+def main(argv=None):
+    import argparse
+    from test_cases import TEST_CASES
+
+    parser = argparse.ArgumentParser(description="Race a portfolio of 8-Puzzle solvers")
+    parser.add_argument("cases", nargs="*", default=list(TEST_CASES),
+                        help=f"Test case names (default: all of {', '.join(TEST_CASES)})")
+    parser.add_argument("--solvers", nargs="+", choices=list(SOLVERS), default=None,
+                        help="Registered solvers to race (default: the standard portfolio)")
+    parser.add_argument("--mode", choices=["first", "best"], default="first")
+    parser.add_argument("--deadline", type=float, default=30.0)
+    parser.add_argument("--stats", default=STATS_PATH)
+    parser.add_argument("--show-stats", action="store_true", help="Only print the win statistics")
+    args = parser.parse_args(argv)
+    # Checked here: argparse rejects a list default when `choices` is combined with nargs="*"
+    unknown = [name for name in args.cases if name not in TEST_CASES]
+    if unknown:
+        parser.error(f"unknown test case(s) {', '.join(unknown)} (choose from {', '.join(TEST_CASES)})")
+
+    if not args.show_stats:
+        for case_name in args.cases:
+            case = TEST_CASES[case_name]
+            result = portfolio_search(case["start"], case["goal"],
+                                      SolverSet(args.solvers) if args.solvers else None, mode=args.mode,
+                                      deadline=args.deadline, stats_path=args.stats)
+            race = result["portfolio"]
+            if race["winner"]:
+                print(f"✓ {case_name}: {race['winner']} won in {race['race_time']:.3f}s "
+                      f"({result['path_length']} moves)")
+            else:
+                print(f"✗ {case_name}: no acceptable result within {args.deadline}s")
+        print()
+
+    print_stats(load_stats(args.stats))
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+"""
+Learned cost model for solver selection
+
+For every solver, log(runtime) and log(peak memory) are fitted by least squares
+on cheap instance features (Manhattan distance, linear conflicts, blank
+position, board size). A request is routed to the solver with the lowest
+predicted cost among those meeting the caller's requirements. The fitted
+coefficients live in a small JSON file and are retrained from the rows of the
+results store (report/store.py).
+"""
+
+import hashlib
+import json
+import math
+import os
+from utils.registry import ANALYSIS_SOLVERS, OPTIMAL_SOLVERS, SOLVERS, get_solver
+
+MODEL_PATH = "report/selector_model.json"
+FEATURES = ("bias", "manhattan", "linear_conflicts", "blank_row", "blank_col", "width")
+
+def instance_features(start_board, goal_board):
+    """
+    Cheap features of one instance, in FEATURES order
+    :return: List of floats
+    """
+    width = len(start_board)
+    goal_at = {tile: (i, j) for i, row in enumerate(goal_board) for j, tile in enumerate(row)}
+
+    manhattan = 0
+    conflicts = 0
+    blank_row = blank_col = 0
+    for i, row in enumerate(start_board):
+        for j, tile in enumerate(row):
+            if tile == 0:
+                blank_row, blank_col = i, j
+                continue
+            goal_i, goal_j = goal_at[tile]
+            manhattan += abs(i - goal_i) + abs(j - goal_j)
+
+    # Pairs of tiles in their goal row (column) but in reversed order
+    for line in range(width):
+        row_targets = [goal_at[t][1] for t in start_board[line] if t and goal_at[t][0] == line]
+        col_tiles = [start_board[i][line] for i in range(width)]
+        col_targets = [goal_at[t][0] for t in col_tiles if t and goal_at[t][1] == line]
+        for targets in (row_targets, col_targets):
+            conflicts += sum(1 for a in range(len(targets)) for b in range(a + 1, len(targets))
+                             if targets[a] > targets[b])
+
+    return [1.0, float(manhattan), float(conflicts), float(blank_row), float(blank_col), float(width)]
+
+def encode_instance(start_board, goal_board):
+    """Instance name that carries its boards, e.g. '123/405/786>123/456/780'"""
+    def encode(board):
+        return "/".join("".join(format(tile, 'x') for tile in row) for row in board)
+    return f"{encode(start_board)}>{encode(goal_board)}"
+
+def decode_instance(name):
+    """
+    Boards of an instance name: an encode_instance() string or a TEST_CASES key
+    :return: (start_board, goal_board) or None if the name carries no boards
+    """
+    if ">" in name:
+        def decode(text):
+            return [[int(c, 16) for c in row] for row in text.split("/")]
+        start, goal = name.split(">")
+        return decode(start), decode(goal)
+
+    from test_cases import TEST_CASES
+    case = TEST_CASES.get(name)
+    return (case["start"], case["goal"]) if case else None
+
+def _fit(rows, targets):
+    """Least-squares coefficients of targets on feature rows"""
+    import numpy as np
+    coefficients, *_ = np.linalg.lstsq(np.array(rows), np.array(targets), rcond=None)
+    return [float(c) for c in coefficients]
+
+def _is_holdout(name):
+    """Deterministic ~20% split of instances for the oracle comparison"""
+    return hashlib.sha256(name.encode()).digest()[0] % 5 == 0
+
+class SolverSelector:
+    """Per-solver runtime and memory model with cost-based routing"""
+
+    def __init__(self, solvers=None, metadata=None):
+        self.solvers = solvers or {}
+        self.metadata = metadata or {}
+
+    @classmethod
+    def load(cls, path=MODEL_PATH):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data["solvers"], data.get("metadata"))
+
+    def save(self, path=MODEL_PATH):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"features": FEATURES, "solvers": self.solvers, "metadata": self.metadata},
+                      f, indent=2)
+
+    @classmethod
+    def train(cls, rows, min_samples=3):
+        """
+        Fit the model from results-store rows
+        :param rows: Iterable of store rows (algorithm, instance, solution_found, time_taken, ...)
+        :param min_samples: Solved rows a solver needs before it is modelled
+        :return: SolverSelector
+        """
+        samples = {}
+        for row in rows:
+            boards = decode_instance(row["instance"])
+            if boards is None or row["time_taken"] is None:
+                continue
+            bucket = samples.setdefault(row["algorithm"], {"runs": 0, "solved": [], "optimal": True})
+            bucket["runs"] += 1
+            if row["solution_found"]:
+                bucket["solved"].append((instance_features(*boards), row))
+
+        solvers = {}
+        for name, bucket in samples.items():
+            solved = bucket["solved"]
+            if len(solved) < min_samples:
+                continue
+            features = [f for f, _ in solved]
+            model = {
+                "time": _fit(features, [math.log(max(r["time_taken"], 1e-6)) for _, r in solved]),
+                "success_rate": len(solved) / bucket["runs"],
+                "optimal": name in OPTIMAL_SOLVERS,
+                "samples": len(solved)
+            }
+            memory = [(f, r["peak_memory_bytes"]) for f, r in solved if r["peak_memory_bytes"]]
+            if len(memory) >= min_samples:
+                model["memory"] = _fit([f for f, _ in memory], [math.log(m) for _, m in memory])
+            solvers[name] = model
+        return cls(solvers)
+
+    def predict(self, start_board, goal_board):
+        """
+        Predicted runtime (s) and peak memory (bytes) per solver
+        :return: Dict of name -> {'time', 'memory', 'success_rate', 'optimal'}
+        """
+        features = instance_features(start_board, goal_board)
+        predictions = {}
+        for name, model in self.solvers.items():
+            predictions[name] = {
+                "time": math.exp(sum(c * x for c, x in zip(model["time"], features))),
+                "memory": (math.exp(sum(c * x for c, x in zip(model["memory"], features)))
+                           if "memory" in model else None),
+                "success_rate": model["success_rate"],
+                "optimal": model["optimal"]
+            }
+        return predictions
+
+    def select(self, start_board, goal_board, require_optimal=True, objective='time',
+               min_success=0.95, candidates=None):
+        """
+        Cheapest solver meeting the requirements
+        :param require_optimal: Only consider solvers that return shortest paths
+        :param objective: 'time' or 'memory'
+        :param min_success: Minimum training success rate
+        :param candidates: Optional collection of solver names to choose from
+        :return: Solver name, or None if no modelled solver qualifies
+        """
+        best, best_cost = None, float('inf')
+        for name, prediction in self.predict(start_board, goal_board).items():
+            if candidates is not None and name not in candidates:
+                continue
+            if require_optimal and not prediction["optimal"]:
+                continue
+            if prediction["success_rate"] < min_success:
+                continue
+            cost = prediction[objective]
+            if cost is not None and cost < best_cost:
+                best, best_cost = name, cost
+        return best
+
+    def solve(self, start_board, goal_board, require_optimal=True, objective='time', **options):
+        """
+        Solve an instance with the solver select() picks for it
+        :param require_optimal: Only consider solvers that return shortest paths
+        :param objective: 'time' or 'memory'
+        :param options: Keyword options passed to the chosen solver (e.g. tracer)
+        :return: The solver's result dictionary, with the chosen name under 'solver'
+        """
+        name = self.select(start_board, goal_board, require_optimal=require_optimal,
+                           objective=objective)
+        if name is None:
+            raise ValueError("No modelled solver meets the requirements; retrain the selector")
+        result = get_solver(name, **options)(start_board, goal_board)
+        result["solver"] = name
+        return result
+
+def evaluate(selector, rows, require_optimal=True, baseline="A* (Manhattan)"):
+    """
+    Compare the selector's choices with the oracle (fastest qualifying solver in hindsight)
+    :param rows: Store rows for instances the model was not trained on
+    :return: Dict with instances, agreement rate, mean time regret and the fixed baseline's regret
+    """
+    by_instance = {}
+    for row in rows:
+        if decode_instance(row["instance"]) is not None and row["algorithm"] in selector.solvers:
+            by_instance.setdefault(row["instance"], {})[row["algorithm"]] = row
+
+    agree = 0
+    regrets, baseline_regrets = [], []
+    failures = 0
+    for name, results in by_instance.items():
+        qualifying = {a: r for a, r in results.items()
+                      if r["solution_found"] and (not require_optimal or a in OPTIMAL_SOLVERS)}
+        if not qualifying:
+            continue
+        oracle = min(qualifying, key=lambda a: qualifying[a]["time_taken"])
+        oracle_time = max(qualifying[oracle]["time_taken"], 1e-9)
+        choice = selector.select(*decode_instance(name), require_optimal=require_optimal,
+                                 candidates=set(results))
+        agree += choice == oracle
+        if choice in qualifying:
+            regrets.append(qualifying[choice]["time_taken"] / oracle_time)
+        else:
+            failures += 1
+        if baseline in qualifying:
+            baseline_regrets.append(qualifying[baseline]["time_taken"] / oracle_time)
+
+    scored = len(regrets) + failures
+    return {
+        "instances": scored,
+        "oracle_agreement": agree / scored if scored else None,
+        "mean_regret": sum(regrets) / len(regrets) if regrets else None,
+        "failed_choices": failures,
+        "baseline": baseline,
+        "baseline_mean_regret": sum(baseline_regrets) / len(baseline_regrets) if baseline_regrets else None
+    }
+
+def retrain(store_path="report/results.db", model_path=MODEL_PATH):
+    """
+    Retrain from the results store, hold out ~20% of instances for the oracle comparison
+    :return: (SolverSelector, evaluation dict)
+    """
+    from report.store import ResultsStore
+
+    with ResultsStore(store_path) as store:
+        rows = list(store.rows())
+
+    selector = SolverSelector.train(r for r in rows if not _is_holdout(r["instance"]))
+    evaluation = evaluate(selector, [r for r in rows if _is_holdout(r["instance"])])
+    selector.metadata = {"trained_rows": len(rows), "evaluation": evaluation}
+    selector.save(model_path)
+    return selector, evaluation
+
+def _run_cell(algo_name, start_board, goal_board, memory_mode):
+    """Worker process body for collect()"""
+    from utils.memory import measure_run
+    return measure_run(get_solver(algo_name), start_board, goal_board, memory_mode=memory_mode)
+
+def collect(store_path="report/results.db", algorithms=None, depths=(2, 6, 10, 14, 18, 22),
+            per_depth=4, seed=0, timeout=10.0, workers=None, memory_mode='full'):
+    """
+    Run solvers on seeded instances and append the rows to the results store
+    Instance names carry the boards (encode_instance), so the rows can be retrained on.
+    :return: Number of rows written
+    """
+    from report.store import ResultsStore
+    from utils.parallel import run_tasks
+    from benchmark.benchmark import build_instances
+
+    algorithms = algorithms or ANALYSIS_SOLVERS
+    instances = build_instances(depths, per_depth, seed)
+    tasks = [((algo, index), (algo, instance["start"], instance["goal"], memory_mode))
+             for index, instance in enumerate(instances) for algo in algorithms]
+
+    def report(key, status, value, elapsed):
+        mark = '✓' if status == "ok" and value.get("solution_found") else '⏱' if status == "timeout" else '✗'
+        print(f"  {mark} {key[0]} on instance {key[1]} ({elapsed:.3f}s)")
+
+    outcomes = run_tasks(tasks, _run_cell, workers, timeout, report)
+    with ResultsStore(store_path) as store:
+        for (algo, index), (status, value, elapsed) in outcomes.items():
+            instance = instances[index]
+            if status != "ok":
+                value = {"solution_found": False, "time_taken": elapsed}
+            store.add(algo, encode_instance(instance["start"], instance["goal"]), value,
+                      optimal_length=instance["depth"])
+    return len(outcomes)
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Learned solver selection")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    collect_parser = commands.add_parser("collect", help="Run solvers on seeded instances into the store")
+    collect_parser.add_argument("--store", default="report/results.db")
+    collect_parser.add_argument("--algorithms", nargs="+", choices=list(SOLVERS), default=None)
+    collect_parser.add_argument("--depths", nargs="+", type=int, default=[2, 6, 10, 14, 18, 22])
+    collect_parser.add_argument("--per-depth", type=int, default=4)
+    collect_parser.add_argument("--seed", type=int, default=0)
+    collect_parser.add_argument("--timeout", type=float, default=10.0)
+    collect_parser.add_argument("--workers", type=int, default=None)
+
+    train_parser = commands.add_parser("train", help="Retrain the model from the store")
+    train_parser.add_argument("--store", default="report/results.db")
+    train_parser.add_argument("--model", default=MODEL_PATH)
+
+    select_parser = commands.add_parser("select", help="Pick a solver for one test case")
+    select_parser.add_argument("case")
+    select_parser.add_argument("--model", default=MODEL_PATH)
+    select_parser.add_argument("--any-path", action="store_true", help="Allow non-optimal solvers")
+    select_parser.add_argument("--objective", choices=["time", "memory"], default="time")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "collect":
+        written = collect(args.store, args.algorithms, args.depths, args.per_depth, args.seed,
+                          args.timeout, args.workers)
+        print(f"✓ {written} rows appended to {args.store}")
+        return 0
+
+    if args.command == "train":
+        selector, evaluation = retrain(args.store, args.model)
+        print(f"✓ Model for {len(selector.solvers)} solvers saved to {args.model}")
+        if evaluation["instances"]:
+            print(f"Held-out instances: {evaluation['instances']}")
+            print(f"Oracle agreement:   {evaluation['oracle_agreement']:.1%}")
+            if evaluation["mean_regret"] is not None:
+                print(f"Mean time regret:   {evaluation['mean_regret']:.2f}x oracle")
+            print(f"Failed choices:     {evaluation['failed_choices']}")
+            if evaluation["baseline_mean_regret"] is not None:
+                print(f"Always {evaluation['baseline']}: {evaluation['baseline_mean_regret']:.2f}x oracle")
+        return 0
+
+    boards = decode_instance(args.case)
+    if boards is None:
+        parser.error(f"unknown case '{args.case}'")
+    selector = SolverSelector.load(args.model)
+    choice = selector.select(*boards, require_optimal=not args.any_path, objective=args.objective)
+    predictions = selector.predict(*boards)
+    print(f"{'Solver':<25} {'Pred. Time (s)':<15} {'Pred. Memory':<14} {'Optimal':<8}")
+    for name, prediction in sorted(predictions.items(), key=lambda item: item[1]["time"]):
+        memory = f"{prediction['memory']:,.0f}" if prediction["memory"] is not None else "N/A"
+        mark = " ←" if name == choice else ""
+        print(f"{name:<25} {prediction['time']:<15.5f} {memory:<14} {'yes' if prediction['optimal'] else 'no':<8}{mark}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
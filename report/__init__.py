@@ -2,6 +2,13 @@
 Report generation module for 8-Puzzle project
 """
 
-from .analysis import PerformanceAnalyzer
+from .store import ResultsStore
 
-__all__ = ['PerformanceAnalyzer']
+__all__ = ['PerformanceAnalyzer', 'ResultsStore']
+
+def __getattr__(name):
+    # Deferred so that importing the package does not load the analysis stack
+    if name == 'PerformanceAnalyzer':
+        from .analysis import PerformanceAnalyzer
+        return PerformanceAnalyzer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,128 @@
-import matplotlib.pyplot as plt
-import numpy as np
-import pandas as pd
+import json
+import math
+import multiprocessing as mp
+import os
+import sys
 from datetime import datetime
 
+# matplotlib and pandas are imported inside the methods that need them, so
+# importing this module (and the report package) stays cheap for solver runs
+
+def display_available():
+    """True when an interactive display is likely available"""
+    if sys.platform.startswith('linux'):
+        return bool(os.environ.get('DISPLAY') or os.environ.get('WAYLAND_DISPLAY'))
+    return True
+
+def _render_chart(analyzer, chart, args, kwargs):
+    """Background process body: render one chart without a display"""
+    analyzer.headless = True
+    getattr(analyzer, chart)(*args, **kwargs)
+
+SCALING_METRICS = ('nodes', 'time', 'memory')
+
+def _percentile(values, pct):
+    """Linear-interpolated percentile of a non-empty list of numbers"""
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lower, upper = math.floor(k), math.ceil(k)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+def effective_branching_factor(nodes, depth, tolerance=1e-6):
+    """
+    Branching factor b* of a uniform tree of the given depth holding `nodes` nodes:
+    nodes = b* + b*^2 + ... + b*^depth
+    :return: b*, or None when depth or nodes is zero
+    """
+    if depth <= 0 or nodes <= 0:
+        return None
+    low, high = 0.0, max(1.0, float(nodes))
+    while high - low > tolerance:
+        b = (low + high) / 2
+        total = depth if b == 1 else b * (b ** depth - 1) / (b - 1)
+        if total < nodes:
+            low = b
+        else:
+            high = b
+    return (low + high) / 2
+
+def fit_exponential(depths, values):
+    """
+    Least-squares fit of value = scale * growth^depth on log scale
+    :return: (scale, growth), or None with fewer than two distinct depths
+    """
+    points = [(d, math.log(v)) for d, v in zip(depths, values) if v > 0]
+    if len({d for d, _ in points}) < 2:
+        return None
+    mean_d = sum(d for d, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    slope = (sum((d - mean_d) * (y - mean_y) for d, y in points) /
+             sum((d - mean_d) ** 2 for d, _ in points))
+    return math.exp(mean_y - slope * mean_d), math.exp(slope)
+
+def predict_capacity(curves, depth_mix, budget_seconds=3600.0):
+    """
+    Expected per-instance cost of a difficulty mix from fitted scaling curves
+    :param curves: Output of PerformanceAnalyzer.scaling_curves() (or its JSON export)
+    :param depth_mix: Dict of optimal depth -> weight (counts or fractions)
+    :param budget_seconds: Time budget for the instances-per-budget estimate
+    :return: Dict of algorithm -> {'mean_nodes', 'mean_time', 'peak_memory', 'instances_per_budget'}
+    """
+    total = sum(depth_mix.values())
+    predictions = {}
+    for algorithm, curve in curves.items():
+        fits = curve['fits']
+        if any(fits.get(metric) is None for metric in SCALING_METRICS):
+            continue
+
+        def at(metric, depth):
+            return fits[metric]['scale'] * fits[metric]['growth'] ** float(depth)
+
+        mean_time = sum(w * at('time', d) for d, w in depth_mix.items()) / total
+        predictions[algorithm] = {
+            'mean_nodes': sum(w * at('nodes', d) for d, w in depth_mix.items()) / total,
+            'mean_time': mean_time,
+            'peak_memory': max(at('memory', d) for d, w in depth_mix.items() if w > 0),
+            'instances_per_budget': budget_seconds / mean_time if mean_time > 0 else float('inf')
+        }
+    return predictions
+
 class PerformanceAnalyzer:
-    def __init__(self):
+    def __init__(self, headless=None):
+        """
+        :param headless: True renders with the Agg backend and never calls plt.show();
+                         None picks headless mode when no display is available
+        """
         self.results = {}
         self.comparison_data = []
+        self.depth_samples = {}  # algorithm -> optimal depth -> list of {'nodes', 'time', 'memory'}
+        self.headless = (not display_available()) if headless is None else headless
+    
+    def _pyplot(self):
+        """Import pyplot on first use, selecting Agg in headless mode"""
+        import matplotlib
+        if self.headless:
+            matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        return plt
+    
+    def _finish_figure(self, plt, save_path):
+        """Save the current figure, show it when interactive, then release it"""
+        plt.tight_layout()
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        if not self.headless:
+            plt.show()
+        plt.close()
+    
+    def render_in_background(self, chart, *args, **kwargs):
+        """
+        Render a chart in a separate headless process
+        :param chart: Name of a plot method, e.g. 'plot_comparison_chart'
+        :return: The started multiprocessing.Process (join it before exiting)
+        """
+        process = mp.get_context().Process(target=_render_chart, args=(self, chart, args, kwargs))
+        process.start()
+        return process
     
     def add_result(self, algorithm_name, result):
         """Add algorithm result for analysis"""
@@ -18,7 +134,10 @@ class PerformanceAnalyzer:
             'Nodes Expanded': result.get('nodes_expanded', 0),
             'Path Length': result.get('path_length', 0),
             'Solution Found': result.get('solution_found', False),
-            'Optimal': True if algorithm_name in ['BFS', 'UCS', 'A*'] else False
+            'Optimal': True if algorithm_name in ['BFS', 'UCS', 'A*'] else False,
+            'Peak Memory (bytes)': result.get('peak_memory_bytes', 0),
+            'Peak RSS Delta (bytes)': result.get('peak_rss_delta_bytes', 0),
+            'Bytes/Node': result.get('bytes_per_node', 0)
         }
         
         if 'generations' in result:
@@ -27,15 +146,39 @@ class PerformanceAnalyzer:
             metrics['Iterations'] = result['iterations']
         if 'final_h' in result:
             metrics['Final Heuristic'] = result['final_h']
+        if 'suboptimality' in result:
+            metrics['Path/Optimal'] = result['suboptimality']
         
         self.comparison_data.append(metrics)
     
+    def load_from_store(self, store, run_id):
+        """Add every result of one stored run without building a DataFrame"""
+        for row in store.rows(run_id=run_id):
+            self.add_result(row['algorithm'], {
+                'time_taken': row['time_taken'] or 0,
+                'nodes_expanded': row['nodes_expanded'] or 0,
+                'path_length': row['path_length'] or 0,
+                'solution_found': bool(row['solution_found']),
+                'peak_memory_bytes': row['peak_memory_bytes'] or 0
+            })
+    
+    def store_aggregates(self, store, run_id=None):
+        """Stream per-algorithm aggregates computed by the results store"""
+        return store.aggregates(run_id)
+    
+    def store_trend(self, store, algorithm, instance=None):
+        """Stream an algorithm's per-run averages, oldest run first"""
+        return store.trend(algorithm, instance)
+    
     def generate_comparison_table(self):
         """Generate comparison table"""
+        import pandas as pd
+        
         df = pd.DataFrame(self.comparison_data)
         
         columns_order = ['Algorithm', 'Solution Found', 'Time (s)', 'Nodes Expanded', 
-                        'Path Length', 'Optimal']
+                        'Path Length', 'Optimal', 'Peak Memory (bytes)',
+                        'Peak RSS Delta (bytes)', 'Bytes/Node']
         additional_cols = [col for col in df.columns if col not in columns_order]
         
         df = df[columns_order + additional_cols]
@@ -45,13 +188,16 @@ class PerformanceAnalyzer:
     
     def plot_comparison_chart(self, save_path='report/comparison_chart.png'):
         """Create visualization charts"""
-        fig, axes = plt.subplots(2, 2, figsize=(15, 10))
+        plt = self._pyplot()
+        fig, axes = plt.subplots(3, 2, figsize=(15, 15))
         
         algorithms = [r['Algorithm'] for r in self.comparison_data]
         times = [r['Time (s)'] for r in self.comparison_data]
         nodes = [r['Nodes Expanded'] for r in self.comparison_data]
         path_lengths = [r['Path Length'] if r['Path Length'] != 0 else 1 for r in self.comparison_data]
         found = [1 if r['Solution Found'] else 0 for r in self.comparison_data]
+        memory_kb = [r.get('Peak Memory (bytes)', 0) / 1024 for r in self.comparison_data]
+        bytes_per_node = [r.get('Bytes/Node', 0) for r in self.comparison_data]
         
         # 1. Time comparison
         axes[0, 0].bar(algorithms, times, color='skyblue')
@@ -78,9 +224,19 @@ class PerformanceAnalyzer:
         axes[1, 1].set_ylim([0, 1.2])
         axes[1, 1].tick_params(axis='x', rotation=45)
         
-        plt.tight_layout()
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+        # 5. Peak memory
+        axes[2, 0].bar(algorithms, memory_kb, color='plum')
+        axes[2, 0].set_title('Peak Memory Comparison')
+        axes[2, 0].set_ylabel('Peak Traced Memory (KiB)')
+        axes[2, 0].tick_params(axis='x', rotation=45)
+        
+        # 6. Memory per expanded node
+        axes[2, 1].bar(algorithms, bytes_per_node, color='sandybrown')
+        axes[2, 1].set_title('Bytes per Expanded Node')
+        axes[2, 1].set_ylabel('Bytes / Node')
+        axes[2, 1].tick_params(axis='x', rotation=45)
+        
+        self._finish_figure(plt, save_path)
         
         return save_path
     
@@ -90,6 +246,7 @@ class PerformanceAnalyzer:
             return None
         
         fitness_history = ga_result['fitness_history']
+        plt = self._pyplot()
         
         plt.figure(figsize=(10, 6))
         plt.plot(fitness_history, label='Best Fitness', linewidth=2)
@@ -104,14 +261,187 @@ class PerformanceAnalyzer:
                        label=f'Final Fitness: {fitness_history[-1]:.4f}')
         
         plt.legend()
-        plt.tight_layout()
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        plt.show()
+        self._finish_figure(plt, save_path)
         
         return save_path
     
-    def generate_report_text(self):
-        """Generate detailed text report"""
+    def plot_search_trace(self, traces, save_path='report/search_trace.png'):
+        """
+        Plot frontier size and f-bound over time for one or more traced runs
+        :param traces: Dict of name -> SearchTracer or Chrome trace-event dict
+        """
+        if not traces:
+            return None
+        
+        plt = self._pyplot()
+        fig, axes = plt.subplots(1, 3, figsize=(18, 5))
+        
+        for name, trace in traces.items():
+            if isinstance(trace, dict):
+                samples = {}
+                for event in trace.get('traceEvents', []):
+                    if event.get('ph') == 'C':
+                        sample = samples.setdefault(event['ts'], {})
+                        sample.update(event['args'])
+                points = sorted(samples.items())
+                times = [ts / 1e6 for ts, _ in points]
+                open_sizes = [p.get('open', 0) for _, p in points]
+                closed_sizes = [p.get('closed', 0) for _, p in points]
+                f_bounds = [p.get('f') for _, p in points]
+            else:
+                times = [sample[0] for sample in trace.samples]
+                open_sizes = [sample[2] for sample in trace.samples]
+                closed_sizes = [sample[3] for sample in trace.samples]
+                f_bounds = [sample[4] for sample in trace.samples]
+            
+            axes[0].plot(times, open_sizes, label=name)
+            axes[1].plot(times, closed_sizes, label=name)
+            if any(f is not None for f in f_bounds):
+                axes[2].step(times, f_bounds, where='post', label=name)
+        
+        axes[0].set_title('Open List (Frontier) Size')
+        axes[0].set_ylabel('States')
+        axes[1].set_title('Closed Set Size')
+        axes[1].set_ylabel('States')
+        axes[2].set_title('f-Bound')
+        axes[2].set_ylabel('f = g + h')
+        for ax in axes:
+            ax.set_xlabel('Time (seconds)')
+            ax.grid(True, alpha=0.3)
+            ax.legend()
+        
+        self._finish_figure(plt, save_path)
+        
+        return save_path
+    
+    def plot_quality_tradeoff(self, all_results, save_path='report/quality_tradeoff.png'):
+        """
+        Scatter latency against solution quality for every solved cell
+        :param all_results: Dict of algorithm -> case -> result (with 'suboptimality')
+        """
+        plt = self._pyplot()
+        fig, ax = plt.subplots(figsize=(10, 6))
+        
+        for algo_name, algo_results in all_results.items():
+            points = [(r['time_taken'], r['suboptimality']) for r in algo_results.values()
+                      if r.get('solution_found') and 'suboptimality' in r and r.get('time_taken')]
+            if points:
+                ax.scatter([t for t, _ in points], [q for _, q in points], label=algo_name, alpha=0.8)
+        
+        ax.axhline(1.0, color='grey', linestyle='--', linewidth=1)
+        ax.set_xscale('log')
+        ax.set_title('Latency vs Solution Quality')
+        ax.set_xlabel('Time (seconds, log scale)')
+        ax.set_ylabel('Path Length / Optimal')
+        ax.grid(True, alpha=0.3)
+        ax.legend(fontsize='small')
+        
+        self._finish_figure(plt, save_path)
+        
+        return save_path
+    
+    def add_depth_sample(self, algorithm_name, depth, result):
+        """
+        Record one solved run under its instance's optimal solution depth for scaling analysis
+        :return: True when the sample was kept (solved, with nodes and time recorded)
+        """
+        nodes = result.get('nodes_expanded')
+        time_taken = result.get('time_taken')
+        if not result.get('solution_found') or not isinstance(nodes, int) or not time_taken:
+            return False
+        memory = result.get('peak_memory_bytes', result.get('peak_rss_delta_bytes')) or 0
+        bucket = self.depth_samples.setdefault(algorithm_name, {}).setdefault(depth, [])
+        bucket.append({'nodes': nodes, 'time': time_taken, 'memory': memory})
+        return True
+    
+    def load_depth_samples(self, store, run_id=None, algorithm=None):
+        """
+        Add every solved stored row with a known optimal length as a depth sample
+        :return: Number of samples added
+        """
+        added = 0
+        for row in store.rows(run_id=run_id, algorithm=algorithm):
+            if row['optimal_length'] is None:
+                continue
+            added += self.add_depth_sample(row['algorithm'], row['optimal_length'], {
+                'solution_found': bool(row['solution_found']),
+                'nodes_expanded': row['nodes_expanded'],
+                'time_taken': row['time_taken'],
+                'peak_memory_bytes': row['peak_memory_bytes']
+            })
+        return added
+    
+    def scaling_curves(self, percentiles=(10, 50, 90)):
+        """
+        Per-solver cost curves against optimal depth
+        Each metric gets its percentiles per depth and an exponential fit scale * growth^depth
+        over all samples. The growth of the nodes fit is the solver's effective branching
+        factor across depths; 'ebf' also gives the classic per-depth b* of the median node count.
+        :return: Dict of algorithm -> {'depths', 'samples', metric -> {'p10', ...}, 'fits', 'ebf'}
+        """
+        curves = {}
+        for algorithm, by_depth in self.depth_samples.items():
+            depths = sorted(d for d in by_depth if by_depth[d])
+            curve = {'depths': depths, 'samples': [len(by_depth[d]) for d in depths], 'fits': {}}
+            for metric in SCALING_METRICS:
+                curve[metric] = {f'p{pct}': [_percentile([s[metric] for s in by_depth[d]], pct)
+                                             for d in depths]
+                                 for pct in percentiles}
+                fit = fit_exponential([d for d in depths for _ in by_depth[d]],
+                                      [s[metric] for d in depths for s in by_depth[d]])
+                curve['fits'][metric] = {'scale': fit[0], 'growth': fit[1]} if fit else None
+            curve['ebf'] = [effective_branching_factor(_percentile([s['nodes'] for s in by_depth[d]], 50), d)
+                            for d in depths]
+            curves[algorithm] = curve
+        return curves
+    
+    def export_scaling_curves(self, path='report/scaling_curves.json', percentiles=(10, 50, 90)):
+        """Write the scaling curves and fits as JSON (readable by predict_capacity)"""
+        curves = self.scaling_curves(percentiles)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                       'percentiles': list(percentiles), 'curves': curves}, f, indent=2)
+        return path
+    
+    def plot_scaling_curves(self, save_path='report/scaling_curves.png', band=(10, 90)):
+        """
+        Nodes, time and memory against optimal depth on log scale: the median per solver,
+        a shaded percentile band and the dashed exponential fit
+        """
+        low, high = band
+        curves = self.scaling_curves((low, 50, high))
+        plt = self._pyplot()
+        fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+        labels = {'nodes': 'Nodes Expanded', 'time': 'Time (seconds)', 'memory': 'Peak Memory (bytes)'}
+        
+        for algorithm, curve in curves.items():
+            depths = curve['depths']
+            for ax, metric in zip(axes, SCALING_METRICS):
+                line, = ax.plot(depths, curve[metric]['p50'], marker='o', label=algorithm)
+                ax.fill_between(depths, curve[metric][f'p{low}'], curve[metric][f'p{high}'],
+                                color=line.get_color(), alpha=0.2)
+                fit = curve['fits'][metric]
+                if fit:
+                    ax.plot(depths, [fit['scale'] * fit['growth'] ** d for d in depths],
+                            linestyle='--', linewidth=1, color=line.get_color())
+        
+        for ax, metric in zip(axes, SCALING_METRICS):
+            ax.set_yscale('log')
+            ax.set_title(f'{labels[metric]} vs Optimal Depth (p{low}-p{high} band)')
+            ax.set_xlabel('Optimal Solution Depth (moves)')
+            ax.set_ylabel(f'{labels[metric]}, log scale')
+            ax.grid(True, alpha=0.3)
+        axes[0].legend(fontsize='small')
+        
+        self._finish_figure(plt, save_path)
+        
+        return save_path
+    
+    def generate_report_text(self, selector=None):
+        """
+        Generate detailed text report
+        :param selector: Optional trained portfolio.selector.SolverSelector to summarise
+        """
         report = []
         report.append("=" * 70)
         report.append("8-PUZZLE AI ALGORITHMS PERFORMANCE REPORT")
@@ -166,19 +496,35 @@ class PerformanceAnalyzer:
             report.append(f"Most Efficient (Nodes): {most_efficient['Algorithm']} ({most_efficient['Nodes Expanded']:,} nodes)")
             report.append(f"Shortest Path: {shortest_path['Algorithm']} ({shortest_path['Path Length']} moves)")
             
-            if fastest['Algorithm'] == 'A* (Manhattan)':
-                report.append("\nOverall Recommendation: A* with Manhattan Distance")
-                report.append("  - Guaranteed optimal solution")
-                report.append("  - Fast execution time")
-                report.append("  - Memory efficient")
+            from utils.registry import OPTIMAL_SOLVERS
+            optimal = [r for r in successful if r['Algorithm'] in OPTIMAL_SOLVERS]
+            if optimal:
+                best = min(optimal, key=lambda x: x['Time (s)'])
+                report.append(f"\nOverall Recommendation: {best['Algorithm']}")
+                report.append("  - Fastest solver here with a guaranteed optimal solution")
+                if best['Algorithm'] != fastest['Algorithm']:
+                    report.append(f"  - {fastest['Algorithm']} was faster but does not guarantee shortest paths")
+        
+        if selector is not None:
+            evaluation = selector.metadata.get('evaluation', {})
+            report.append("\nLEARNED SELECTOR")
+            report.append("-" * 40)
+            report.append(f"Modelled Solvers: {len(selector.solvers)}")
+            if evaluation.get('instances'):
+                report.append(f"Held-out Instances: {evaluation['instances']}")
+                report.append(f"Oracle Agreement: {evaluation['oracle_agreement']:.1%}")
+                if evaluation.get('mean_regret') is not None:
+                    report.append(f"Mean Time Regret: {evaluation['mean_regret']:.2f}x oracle")
+                if evaluation.get('baseline_mean_regret') is not None:
+                    report.append(f"Always {evaluation['baseline']}: {evaluation['baseline_mean_regret']:.2f}x oracle")
         
         report.append("\n" + "=" * 70)
         
         return '\n'.join(report)
     
-    def save_report(self, output_file='report/final_report.txt'):
+    def save_report(self, output_file='report/final_report.txt', selector=None):
         """Save complete report to file"""
-        report_text = self.generate_report_text()
+        report_text = self.generate_report_text(selector)
         
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write(report_text)
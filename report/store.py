@@ -0,0 +1,158 @@
+"""
+Append-only SQLite store of solver results
+
+Every analysis run appends its rows under a new run id, so history is kept
+across runs and aggregates are computed by SQLite instead of in memory.
+"""
+
+import sqlite3
+import subprocess
+import uuid
+from datetime import datetime
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    commit_hash TEXT,
+    created_at TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    instance TEXT NOT NULL,
+    solution_found INTEGER NOT NULL,
+    time_taken REAL,
+    nodes_expanded INTEGER,
+    peak_memory_bytes INTEGER,
+    path_length INTEGER,
+    optimal_length INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results (run_id);
+CREATE INDEX IF NOT EXISTS idx_results_commit ON results (commit_hash);
+CREATE INDEX IF NOT EXISTS idx_results_algorithm ON results (algorithm, instance);
+CREATE INDEX IF NOT EXISTS idx_results_instance ON results (instance);
+"""
+
+COLUMNS = ('run_id', 'commit_hash', 'created_at', 'algorithm', 'instance', 'solution_found',
+           'time_taken', 'nodes_expanded', 'peak_memory_bytes', 'path_length', 'optimal_length')
+
+def current_commit():
+    """Short hash of the checked-out git commit, or None outside a repository"""
+    try:
+        completed = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                                   capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip() or None
+
+def _int_or_none(value):
+    return value if isinstance(value, int) and not isinstance(value, bool) else None
+
+class ResultsStore:
+    """
+    Batched writer and streaming reader for the results database
+
+    Usage:
+        with ResultsStore() as store:
+            store.add("A* (Manhattan)", "hard", result, optimal_length=4)
+    """
+
+    def __init__(self, path='report/results.db', batch_size=500, run_id=None, commit_hash=None):
+        self.path = path
+        self.batch_size = batch_size
+        self.run_id = run_id or f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        self.commit_hash = commit_hash if commit_hash is not None else current_commit()
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+        self._pending = []
+
+    def add(self, algorithm, instance, result, optimal_length=None):
+        """Queue one solver result; rows are written in batches"""
+        self._pending.append((
+            self.run_id,
+            self.commit_hash,
+            datetime.now().isoformat(timespec='seconds'),
+            algorithm,
+            instance,
+            1 if result.get('solution_found', False) else 0,
+            result.get('time_taken'),
+            _int_or_none(result.get('nodes_expanded')),
+            _int_or_none(result.get('peak_memory_bytes')),
+            _int_or_none(result.get('path_length')),
+            optimal_length
+        ))
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write queued rows in a single transaction"""
+        if not self._pending:
+            return
+        placeholders = ', '.join('?' for _ in COLUMNS)
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT INTO results ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+                self._pending
+            )
+        self._pending = []
+
+    def _stream(self, sql, params=()):
+        cursor = self.connection.execute(sql, params)
+        names = [d[0] for d in cursor.description]
+        for row in cursor:
+            yield dict(zip(names, row))
+
+    def rows(self, run_id=None, algorithm=None):
+        """Stream raw rows, optionally filtered by run and algorithm"""
+        self.flush()
+        clauses, params = [], []
+        if run_id is not None:
+            clauses.append("run_id = ?")
+            params.append(run_id)
+        if algorithm is not None:
+            clauses.append("algorithm = ?")
+            params.append(algorithm)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._stream(f"SELECT * FROM results {where} ORDER BY id", params)
+
+    def runs(self):
+        """Stream one summary row per run, oldest first"""
+        self.flush()
+        return self._stream(
+            "SELECT run_id, commit_hash, MIN(created_at) AS started, COUNT(*) AS results "
+            "FROM results GROUP BY run_id ORDER BY MIN(id)"
+        )
+
+    def aggregates(self, run_id=None):
+        """Stream per-algorithm aggregates, for one run or the whole history"""
+        self.flush()
+        where = "WHERE run_id = ?" if run_id is not None else ""
+        params = (run_id,) if run_id is not None else ()
+        return self._stream(
+            "SELECT algorithm, COUNT(*) AS runs, SUM(solution_found) AS solved, "
+            "AVG(time_taken) AS avg_time, MIN(time_taken) AS min_time, MAX(time_taken) AS max_time, "
+            "AVG(nodes_expanded) AS avg_nodes, AVG(peak_memory_bytes) AS avg_peak_memory, "
+            "AVG(path_length) AS avg_path_length "
+            f"FROM results {where} GROUP BY algorithm ORDER BY algorithm", params
+        )
+
+    def trend(self, algorithm, instance=None):
+        """Stream one row per run with the algorithm's averages, oldest first"""
+        self.flush()
+        sql = ("SELECT run_id, commit_hash, MIN(created_at) AS started, AVG(time_taken) AS avg_time, "
+               "AVG(nodes_expanded) AS avg_nodes, AVG(peak_memory_bytes) AS avg_peak_memory, "
+               "SUM(solution_found) AS solved, COUNT(*) AS runs FROM results WHERE algorithm = ?")
+        params = [algorithm]
+        if instance is not None:
+            sql += " AND instance = ?"
+            params.append(instance)
+        sql += " GROUP BY run_id ORDER BY MIN(id)"
+        return self._stream(sql, params)
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -3,90 +3,124 @@
 Comprehensive analysis of all algorithms on all test cases
 """
 
+import argparse
 import time
 from datetime import datetime
-from test_cases import TEST_CASES, run_all_tests
-from bfs.bfs import bfs
-from dfs.dfs import dfs
-from ucs.ucs import ucs
-from ids.ids import ids
-from astar.astar import astar_search
-from hill_climbing.hill_climbing import hill_climbing, hill_climbing_with_restart
-from genetic_algorithm.genetic import genetic_algorithm_search
+from test_cases import TEST_CASES
 from report.analysis import PerformanceAnalyzer
+from utils.memory import measure_run
+from utils.moves import add_quality
+from utils.parallel import run_tasks
+from utils.registry import ANALYSIS_SOLVERS, SOLVERS, SolverSet, get_solver
+from report.store import ResultsStore
+from utils.result_cache import ResultCache, cell_key
+
+# All algorithms to test; solver modules are imported on first use
+ALGORITHMS = SolverSet(ANALYSIS_SOLVERS)
+
+DEFAULT_TASK_TIMEOUT = 300  # seconds per algorithm x case cell
+
+def run_cell(algo_name, case_name, memory_mode='full'):
+    """Run one algorithm on one test case (executed in a worker process)"""
+    test_case = TEST_CASES[case_name]
+    result = measure_run(get_solver(algo_name), test_case["start"], test_case["goal"],
+                         memory_mode=memory_mode)
+    return add_quality(result, test_case["optimal_length"])
+
+def run_matrix(algorithm_names, selected_cases, workers=None, task_timeout=DEFAULT_TASK_TIMEOUT,
+               memory_mode='full', cache_path="report/analysis_cache.json", force=False):
+    """
+    Run every algorithm x case cell across a process pool
+    :param workers: Concurrent processes (defaults to CPU count)
+    :param task_timeout: Wall-clock limit per cell; runaway cells are killed and recorded
+    :param cache_path: Result cache file (None disables caching)
+    :param force: Re-run every cell even when a cached result is valid
+    :return: Dict of algorithm -> case -> result, in algorithm and case order
+    """
+    cache = ResultCache(cache_path) if cache_path else None
+    keys = {}
+    cached = {}
+    tasks = []
+    for algo_name in algorithm_names:
+        for case_name in selected_cases:
+            test_case = TEST_CASES[case_name]
+            key = cell_key(algo_name, get_solver(algo_name), case_name,
+                           test_case["start"], test_case["goal"], memory_mode)
+            keys[(algo_name, case_name)] = key
+            hit = cache.get(key) if cache is not None and not force else None
+            if hit is not None:
+                hit["cached"] = True
+                cached[(algo_name, case_name)] = hit
+                print(f"  ↺ {algo_name} on {case_name} (cached, {hit.get('time_taken', 0):.4f}s)")
+            else:
+                tasks.append(((algo_name, case_name), (algo_name, case_name, memory_mode)))
+
+    def report(key, status, value, elapsed):
+        algo_name, case_name = key
+        if status == "ok":
+            mark = '✓' if value.get('solution_found', False) else '✗'
+            print(f"  {mark} {algo_name} on {case_name} ({value['time_taken']:.4f}s)")
+        elif status == "timeout":
+            print(f"  ⏱ {algo_name} on {case_name} killed after {elapsed:.1f}s")
+        else:
+            print(f"  ! {algo_name} on {case_name} failed:\n{value}")
+
+    outcomes = run_tasks(tasks, run_cell, workers, task_timeout, report)
 
-def comprehensive_analysis():
-    """Run comprehensive analysis across all algorithms and test cases"""
+    if cache is not None:
+        for (algo_name, case_name), (status, value, _) in outcomes.items():
+            if status == "ok":
+                cache.put(keys[(algo_name, case_name)], algo_name, case_name, value)
+        cache.save()
+    if cached:
+        print(f"Reused {len(cached)} of {len(keys)} cells from cache (use --force to re-run)")
+
+    all_results = {}
+    for algo_name in algorithm_names:
+        all_results[algo_name] = {}
+        for case_name in selected_cases:
+            if (algo_name, case_name) in cached:
+                all_results[algo_name][case_name] = cached[(algo_name, case_name)]
+                continue
+            status, value, elapsed = outcomes[(algo_name, case_name)]
+            if status == "ok":
+                all_results[algo_name][case_name] = value
+            else:
+                all_results[algo_name][case_name] = {
+                    "solution_found": False,
+                    "nodes_expanded": 'N/A',
+                    "time_taken": elapsed,
+                    "timed_out": status == "timeout",
+                    "error": status == "error"
+                }
+    return all_results
+
+def comprehensive_analysis(selected_cases=None, algorithm_names=None, workers=None,
+                           task_timeout=DEFAULT_TASK_TIMEOUT, force=False):
+    """
+    Run comprehensive analysis across algorithms and test cases
+    :param selected_cases: Test case names (default: all)
+    :param algorithm_names: Registry solver names (default: the ALGORITHMS matrix)
+    """
 
     print("8-Puzzle Algorithm Comprehensive Analysis")
     print("=" * 60)
     print(f"Analysis started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
-    # Test case selection
-    print("\nAvailable test cases:")
-    case_names = list(TEST_CASES.keys())
-    for i, case_name in enumerate(case_names, 1):
-        case_info = TEST_CASES[case_name]
-        print(f"{i}. {case_name} - {case_info['description']}")
-
-    while True:
-        try:
-            user_input = input("\nEnter case numbers (1-4) separated by commas, or press Enter for all cases: ").strip()
-            if not user_input:
-                selected_indices = list(range(len(case_names)))
-                break
-            else:
-                selected_indices = []
-                for num in user_input.split(','):
-                    num = num.strip()
-                    if num.isdigit():
-                        idx = int(num) - 1
-                        if 0 <= idx < len(case_names):
-                            selected_indices.append(idx)
-                        else:
-                            print(f"Invalid case number: {int(num)}. Please enter numbers between 1 and {len(case_names)}.")
-                            selected_indices = []
-                            break
-                    else:
-                        print(f"Invalid input: '{num}'. Please enter numbers only.")
-                        selected_indices = []
-                        break
-                if selected_indices:
-                    break
-        except KeyboardInterrupt:
-            print("\nAnalysis cancelled.")
-            return {}, []
-
-    selected_cases = [case_names[i] for i in selected_indices]
+    selected_cases = list(selected_cases or TEST_CASES)
     print(f"\nSelected test cases: {', '.join(selected_cases)}")
 
-    # Define all algorithms to test
-    algorithms = {
-        "BFS": bfs,
-        "DFS": dfs,
-        "UCS": ucs,
-        "IDS": ids,
-        "A* (Manhattan)": lambda s,g: astar_search(s, g, 'manhattan'),
-        "A* (Misplaced)": lambda s,g: astar_search(s, g, 'misplaced'),
-        "Hill Climbing": hill_climbing,
-        "Hill Climbing (Restart)": hill_climbing_with_restart,
-        "Genetic Algorithm": genetic_algorithm_search
-    }
+    algorithms = SolverSet(algorithm_names) if algorithm_names else ALGORITHMS
     
-    all_results = {}
+    # Run every algorithm x case cell in parallel
+    print(f"\n{'='*40}")
+    print(f"Running {len(algorithms) * len(selected_cases)} tasks")
+    print(f"{'='*40}")
     
-    # Test each algorithm
-    for algo_name, algo_func in algorithms.items():
-        print(f"\n{'='*40}")
-        print(f"Analyzing: {algo_name}")
-        print(f"{'='*40}")
-        
-        start_time = time.time()
-        results = run_all_tests(algo_func, algo_name, selected_cases)
-        total_time = time.time() - start_time
-        
-        all_results[algo_name] = results
-        print(f"Total analysis time for {algo_name}: {total_time:.2f} seconds")
+    start_time = time.time()
+    all_results = run_matrix(list(algorithms), selected_cases, workers, task_timeout, force=force)
+    total_time = time.time() - start_time
+    print(f"Total analysis time: {total_time:.2f} seconds")
     
     # Generate comprehensive report
     print("\n" + "="*80)
@@ -99,18 +133,23 @@ def comprehensive_analysis():
         print(f"\n📊 Test Case: {case_name}")
         print(f"Description: {case_info['description']}")
         print(f"Optimal Solution: {case_info['optimal_length']} moves")
-        print("-"*70)
-        print(f"{'Algorithm':<25} {'Time (s)':<10} {'Nodes':<12} {'Path Len':<10} {'Found':<8}")
-        print("-"*70)
+        print("-"*80)
+        print(f"{'Algorithm':<25} {'Time (s)':<10} {'Nodes':<12} {'Path Len':<10} {'Path/Opt':<10} {'Found':<8}")
+        print("-"*80)
 #Abdelrhman Reda Abdelrhman Torad
         for algo_name in algorithms.keys():
             result = all_results[algo_name].get(case_name, {})
             time_taken = result.get('time_taken', 0)
             nodes = result.get('nodes_expanded', 'N/A')
             path_len = result.get('path_length', 'N/A')
-            found = '✓' if result.get('solution_found', False) else '✗'
+            ratio = f"{result['suboptimality']:.2f}" if 'suboptimality' in result else 'N/A'
+            found = '⏱' if result.get('timed_out', False) else '✓' if result.get('solution_found', False) else '✗'
+            label = f"{algo_name} *" if result.get('cached', False) else algo_name
 
-            print(f"{algo_name:<25} {time_taken:<10.4f} {nodes:<12} {path_len:<10} {found:<8}")
+            print(f"{label:<25} {time_taken:<10.4f} {nodes:<12} {path_len:<10} {ratio:<10} {found:<8}")
+
+        if any(all_results[algo_name].get(case_name, {}).get('cached', False) for algo_name in algorithms):
+            print("* reused from cache (inputs and solver code unchanged)")
 
     # Summary statistics
     print("\n" + "="*80)
@@ -157,12 +196,20 @@ def save_analysis_results(results, selected_cases, filename="report/analysis_res
 
                     if result.get('solution_found'):
                         f.write(f"    Path Length: {result.get('path_length')} moves\n")
+                        if 'suboptimality' in result:
+                            f.write(f"    Path / Optimal: {result['suboptimality']:.2f}\n")
+                        if 'original_path_length' in result:
+                            f.write(f"    Before Path Optimization: {result['original_path_length']} moves\n")
                         nodes = result.get('nodes_expanded', 'N/A')
                         if isinstance(nodes, int):
                             f.write(f"    Nodes Expanded: {nodes:,}\n")
                         else:
                             f.write(f"    Nodes Expanded: {nodes}\n")
                         f.write(f"    Time Taken: {result.get('time_taken', 0):.4f} seconds\n")
+                        if 'peak_memory_bytes' in result:
+                            f.write(f"    Peak Memory: {result['peak_memory_bytes']:,} bytes\n")
+                        if 'bytes_per_node' in result:
+                            f.write(f"    Bytes per Node: {result['bytes_per_node']:,.1f}\n")
 
                     f.write("\n")
 
@@ -222,6 +269,27 @@ def append_recommendations(results, selected_cases, filename):
             f.write(f"Most Efficient (Nodes): {efficient_algo} ({efficient_nodes})\n")
         f.write(f"Shortest Path: {shortest_algo} ({shortest_length} moves)\n")
 
+def save_to_store(results, selected_cases, path="report/results.db"):
+    """
+    Append results to the SQLite history under a new run id
+    Cells reused from the result cache are skipped: they were stored by the run that measured them
+    """
+    stored = 0
+    with ResultsStore(path) as store:
+        for algo_name, algo_results in results.items():
+            for case_name in selected_cases:
+                result = algo_results.get(case_name)
+                if result is not None and not result.get('cached', False):
+                    store.add(algo_name, case_name, result, TEST_CASES[case_name]['optimal_length'])
+                    stored += 1
+        run_id = store.run_id
+
+    if stored:
+        print(f"✓ {stored} results appended to {path} (run {run_id})")
+    else:
+        print(f"✓ Every result was cached; nothing appended to {path}")
+    return run_id
+
 def save_csv_results(results, selected_cases, filename="report/comparison_table.csv"):
     """Save results in CSV format"""
     import csv
@@ -231,7 +299,8 @@ def save_csv_results(results, selected_cases, filename="report/comparison_table.
 
         # Write header
         header = ['Algorithm', 'Test Case', 'Solution Found', 'Time (s)',
-                  'Nodes Expanded', 'Path Length', 'Optimal Length']
+                  'Nodes Expanded', 'Path Length', 'Optimal Length', 'Path/Optimal',
+                  'Peak Memory (bytes)', 'Peak RSS Delta (bytes)', 'Bytes/Node']
         writer.writerow(header)
 
         # Write data
@@ -247,22 +316,46 @@ def save_csv_results(results, selected_cases, filename="report/comparison_table.
                         f"{result.get('time_taken', 0):.4f}",
                         result.get('nodes_expanded', 'N/A'),
                         result.get('path_length', 'N/A'),
-                        case_info['optimal_length']
+                        case_info['optimal_length'],
+                        f"{result['suboptimality']:.3f}" if 'suboptimality' in result else 'N/A',
+                        result.get('peak_memory_bytes', 'N/A'),
+                        result.get('peak_rss_delta_bytes', 'N/A'),
+                        f"{result['bytes_per_node']:.1f}" if 'bytes_per_node' in result else 'N/A'
                     ]
                     writer.writerow(row)
 
     print(f"✓ CSV results saved to {filename}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Comprehensive 8-Puzzle algorithm analysis")
+    parser.add_argument("--cases", nargs="+", choices=list(TEST_CASES), default=None,
+                        help="Test cases to run (default: all)")
+    parser.add_argument("--algorithms", nargs="+", choices=list(SOLVERS), default=None,
+                        help="Registered solvers to run (default: the standard matrix)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Concurrent worker processes (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TASK_TIMEOUT,
+                        help="Wall-clock limit in seconds per algorithm x case cell")
+    parser.add_argument("--store", default="report/results.db",
+                        help="SQLite results history to append to")
+    parser.add_argument("--force", action="store_true",
+                        help="Re-run every cell instead of reusing cached results")
+    parser.add_argument("--headless", action="store_true",
+                        help="Render charts with the Agg backend in background processes")
+    args = parser.parse_args()
+
     print("Starting comprehensive analysis...")
-    all_results, selected_cases = comprehensive_analysis()
+    all_results, selected_cases = comprehensive_analysis(args.cases, args.algorithms, args.workers,
+                                                         args.timeout, args.force)
 
     # Save results
     save_analysis_results(all_results, selected_cases)
     save_csv_results(all_results, selected_cases)
+    save_to_store(all_results, selected_cases, args.store)
 
     # Generate charts
-    analyzer = PerformanceAnalyzer()
+    analyzer = PerformanceAnalyzer(headless=True if args.headless else None)
+    renders = []
 
     # Add results to analyzer for all algorithms and test cases
     for algo_name, algo_results in all_results.items():
@@ -273,8 +366,20 @@ if __name__ == "__main__":
                     analyzer.add_result(algo_name, result)
 
     # Generate comparison chart
-    comparison_path = analyzer.plot_comparison_chart()
-    print(f"✓ Comparison chart saved to {comparison_path}")
+    if analyzer.headless:
+        renders.append(("Comparison chart", 'report/comparison_chart.png',
+                        analyzer.render_in_background('plot_comparison_chart')))
+    else:
+        comparison_path = analyzer.plot_comparison_chart()
+        print(f"✓ Comparison chart saved to {comparison_path}")
+
+    # Latency vs solution quality across every solved cell
+    if analyzer.headless:
+        renders.append(("Quality trade-off chart", 'report/quality_tradeoff.png',
+                        analyzer.render_in_background('plot_quality_tradeoff', all_results)))
+    else:
+        tradeoff_path = analyzer.plot_quality_tradeoff(all_results)
+        print(f"✓ Quality trade-off chart saved to {tradeoff_path}")
 
     # Generate GA fitness chart (only if GA was successful)
     if 'Genetic Algorithm' in all_results:
@@ -283,11 +388,22 @@ if __name__ == "__main__":
             if case_name in ga_results and ga_results[case_name].get('solution_found', False):
                 ga_result = ga_results[case_name]
                 if 'fitness_history' in ga_result:
-                    fitness_path = analyzer.plot_fitness_progress(ga_result)
-                    if fitness_path:
-                        print(f"✓ GA fitness chart saved to {fitness_path}")
+                    if analyzer.headless:
+                        renders.append(("GA fitness chart", 'report/ga_fitness.png',
+                                        analyzer.render_in_background('plot_fitness_progress', ga_result)))
+                    else:
+                        fitness_path = analyzer.plot_fitness_progress(ga_result)
+                        if fitness_path:
+                            print(f"✓ GA fitness chart saved to {fitness_path}")
                     break  # Only plot for first successful GA result
 
+    for label, path, process in renders:
+        process.join()
+        if process.exitcode == 0:
+            print(f"✓ {label} saved to {path}")
+        else:
+            print(f"✗ {label} failed to render (exit code {process.exitcode})")
+
     print("\n" + "="*60)
     print("ANALYSIS COMPLETE")
     print("="*60)
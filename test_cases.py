@@ -2,6 +2,9 @@
 Test cases for 8-Puzzle algorithms
 """
 
+from utils.memory import measure_run
+from utils.solvability import is_solvable as _is_solvable
+
 TEST_CASES = {
     "easy": {
         "start": [[1, 2, 3], [4, 0, 5], [7, 8, 6]],
@@ -24,8 +27,8 @@ TEST_CASES = {
     "very_hard": {
         "start": [[8, 7, 6], [5, 4, 3], [2, 1, 0]],
         "goal": [[1, 2, 3], [4, 5, 6], [7, 8, 0]],
-        "optimal_length": 31,
-        "description": "Hardest case - 31 moves (maximum)"
+        "optimal_length": 30,
+        "description": "Hardest case - 30 moves"
     }
 }
 
@@ -41,7 +44,7 @@ def print_board(board):
                 print(f" {cell} |", end="")
         print("\n+---+---+---+")
 
-def run_all_tests(algorithm_func, algorithm_name, selected_cases=None):
+def run_all_tests(algorithm_func, algorithm_name, selected_cases=None, memory_mode='full'):
     """Run algorithm on selected test cases"""
     if selected_cases is None:
         selected_cases = list(TEST_CASES.keys())
@@ -54,7 +57,8 @@ def run_all_tests(algorithm_func, algorithm_name, selected_cases=None):
             print(f"\nTesting {algorithm_name} on {difficulty} case...")
             print(f"Description: {test_case['description']}")
 
-            result = algorithm_func(test_case["start"], test_case["goal"])
+            result = measure_run(algorithm_func, test_case["start"], test_case["goal"],
+                                 memory_mode=memory_mode)
             results[difficulty] = result
 
             if result.get("solution_found", False):
@@ -65,22 +69,16 @@ def run_all_tests(algorithm_func, algorithm_name, selected_cases=None):
                     print(f"  Nodes expanded: {nodes:,}")
                 else:
                     print(f"  Nodes expanded: {nodes}")
+                if 'peak_memory_bytes' in result:
+                    print(f"  Peak memory: {result['peak_memory_bytes']:,} bytes")
             else:
                 print(f"  ✗ No solution found")
 
     return results
 
-def is_solvable(puzzle):
-    """Check if a puzzle configuration is solvable"""
-    flat = [tile for row in puzzle for tile in row if tile != 0]
-    inversions = 0
-    
-    for i in range(len(flat)):
-        for j in range(i + 1, len(flat)):
-            if flat[i] > flat[j]:
-                inversions += 1
-    
-    return inversions % 2 == 0
+def is_solvable(puzzle, goal=None):
+    """Check if a puzzle configuration is solvable (see utils.solvability)"""
+    return _is_solvable(puzzle, goal)
 
 def get_test_case(name):
     """Get a specific test case by name"""
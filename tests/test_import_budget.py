@@ -0,0 +1,40 @@
+"""
+Regression tests for solver entry-point imports
+
+Importing an entry point must not load the report stack (matplotlib, pandas,
+numpy) and must stay within benchmark.benchmark.IMPORT_BUDGET. Each import
+runs in a fresh interpreter so earlier imports cannot hide a regression.
+
+Run from the repository root: python -m pytest tests
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmark.benchmark import ENTRY_POINTS, IMPORT_BUDGET, measure_import_time  # noqa: E402
+
+HEAVY_MODULES = ("matplotlib", "pandas", "numpy")
+
+def _loaded_heavy_modules(module):
+    """Heavy top-level packages present in sys.modules after a cold `import module`"""
+    code = (f"import sys, {module}; "
+            f"print(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    completed = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                               capture_output=True, text=True, check=True)
+    return completed.stdout.split()
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_entry_point_does_not_load_report_stack(module):
+    assert _loaded_heavy_modules(module) == []
+
+@pytest.mark.parametrize("module", ENTRY_POINTS)
+def test_entry_point_import_within_budget(module, monkeypatch):
+    monkeypatch.chdir(ROOT)
+    seconds = measure_import_time(module)
+    assert seconds <= IMPORT_BUDGET, f"import {module} took {seconds * 1000:.0f} ms"
@@ -1,12 +1,20 @@
 import heapq
 from utils.state import PuzzleState
 from utils.moves import get_possible_moves, get_path
+from utils.tracing import attach_trace
+from utils.solvability import is_solvable, unsolvable_result
 
-def ucs(start_board, goal_board):
+def ucs(start_board, goal_board, tracer=None):
     """
     Uniform Cost Search for 8-Puzzle
+    :param tracer: Optional SearchTracer for event counts and frontier samples
     """
+    if not is_solvable(start_board, goal_board):
+        return unsolvable_result()
+    
     start_state = PuzzleState(start_board)
+    if tracer is not None:
+        tracer.start()
     
     if start_state.board == goal_board:
         return {"path": [], "nodes_expanded": 0}
@@ -23,16 +31,18 @@ def ucs(start_board, goal_board):
         
         # Check if goal is reached
         if current_state.board == goal_board:
-            return {
+            return attach_trace({
                 "path": get_path(current_state),
                 "nodes_expanded": nodes_expanded,
                 "path_length": current_state.g,
                 "solution_found": True
-            }
+            }, tracer)
         
         # Add to explored set
         explored.add(tuple(map(tuple, current_state.board)))
         nodes_expanded += 1
+        if tracer is not None:
+            tracer.on_expand(len(frontier), len(explored), current_cost)
         
         # Generate successors
         for move_name, next_state in get_possible_moves(current_state):
@@ -49,9 +59,17 @@ def ucs(start_board, goal_board):
                             frontier.remove((cost, state))
                             heapq.heapify(frontier)
                             heapq.heappush(frontier, (next_state.g, next_state))
+                            if tracer is not None:
+                                tracer.on_decrease_key()
+                        elif tracer is not None:
+                            tracer.on_duplicate()
                         break
                 
                 if not in_frontier:
                     heapq.heappush(frontier, (next_state.g, next_state))
+                    if tracer is not None:
+                        tracer.on_generate()
+            elif tracer is not None:
+                tracer.on_duplicate()
     
-    return {"solution_found": False, "nodes_expanded": nodes_expanded}
+    return attach_trace({"solution_found": False, "nodes_expanded": nodes_expanded}, tracer)
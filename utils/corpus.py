@@ -0,0 +1,130 @@
+"""
+Compact on-disk corpus of puzzle instances
+
+File layout (little endian):
+    header  24 bytes  magic b"8PZC", version, width, flags, reserved,
+                      instance count (u64), packed goal (u64)
+    states  8 bytes per instance, one 4-bit nibble per cell (row-major, cell 0 lowest)
+    depths  1 byte per instance, only when FLAG_DEPTHS is set (255 = unknown)
+
+Fixed-size records let the file be memory-mapped and indexed without parsing.
+"""
+
+import mmap
+import struct
+
+MAGIC = b"8PZC"
+VERSION = 1
+HEADER = struct.Struct("<4sBBBBQQ")
+RECORD = struct.Struct("<Q")
+RECORD_SIZE = RECORD.size
+FLAG_DEPTHS = 1
+UNKNOWN_DEPTH = 255
+
+def pack_board(board):
+    """
+    Pack a board (up to 4x4) into a 64-bit integer
+    :param board: Board (list of rows)
+    :return: int
+    """
+    value = 0
+    shift = 0
+    for row in board:
+        for cell in row:
+            value |= cell << shift
+            shift += 4
+    return value
+
+def unpack_board(value, width=3):
+    """
+    Unpack a 64-bit integer into a board
+    :param value: Packed board
+    :param width: Board width
+    :return: Board (list of rows)
+    """
+    cells = [(value >> (4 * i)) & 0xF for i in range(width * width)]
+    return [cells[i:i + width] for i in range(0, width * width, width)]
+
+def write_corpus(path, boards, goal_board, depths=None):
+    """
+    Write instances to a corpus file
+    :param path: Output file
+    :param boards: Iterable of boards sharing `goal_board`
+    :param goal_board: Goal board configuration
+    :param depths: Optional optimal depth per board
+    :return: Number of instances written
+    """
+    boards = list(boards)
+    width = len(goal_board)
+    flags = FLAG_DEPTHS if depths is not None else 0
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, width, flags, 0, len(boards), pack_board(goal_board)))
+        f.write(b"".join(RECORD.pack(pack_board(board)) for board in boards))
+        if depths is not None:
+            f.write(bytes(UNKNOWN_DEPTH if d is None else min(d, UNKNOWN_DEPTH) for d in depths))
+
+    return len(boards)
+
+class Corpus:
+    """
+    Memory-mapped, read-only view of a corpus file
+
+    Usage:
+        with Corpus("instances.8pz") as corpus:
+            for start, goal, depth in corpus:
+                ...
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.width, flags, _, self.count, goal = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} puzzle corpus")
+
+        self.goal_board = unpack_board(goal, self.width)
+        states_end = HEADER.size + self.count * RECORD_SIZE
+        # Raw bytes; records are decoded as little endian, not in the machine's byte order
+        self.states = memoryview(self._map)[HEADER.size:states_end]
+        self.depths = (memoryview(self._map)[states_end:states_end + self.count]
+                       if flags & FLAG_DEPTHS else None)
+
+    def __len__(self):
+        return self.count
+
+    def depth(self, index):
+        """Optimal depth of an instance, or None when not recorded"""
+        if self.depths is None or self.depths[index] == UNKNOWN_DEPTH:
+            return None
+        return self.depths[index]
+
+    def __getitem__(self, index):
+        """(start_board, goal_board, depth) of one instance"""
+        if not -self.count <= index < self.count:
+            raise IndexError("corpus index out of range")
+        index %= self.count
+        state, = RECORD.unpack_from(self.states, index * RECORD_SIZE)
+        return unpack_board(state, self.width), self.goal_board, self.depth(index)
+
+    def __iter__(self):
+        for index, (state,) in enumerate(RECORD.iter_unpack(self.states)):
+            yield unpack_board(state, self.width), self.goal_board, self.depth(index)
+
+    def close(self):
+        """Release the memory map and file handle"""
+        for view in (getattr(self, 'states', None), getattr(self, 'depths', None)):
+            if view is not None:
+                view.release()
+        self.states = self.depths = None
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
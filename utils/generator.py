@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Random solvable instance generation for the 8-Puzzle
+"""
+
+import argparse
+import random
+from utils.solvability import is_solvable
+from utils.corpus import write_corpus
+
+GOAL_BOARD = [[1, 2, 3], [4, 5, 6], [7, 8, 0]]
+
+# goal tuple -> list of breadth-first layers, built on first use
+_LAYER_CACHE = {}
+
+def depth_layers(goal_board, max_depth):
+    """
+    Breadth-first layers around the goal
+    :param goal_board: Goal board configuration
+    :param max_depth: Deepest layer to build
+    :return: List where entry d holds every board tuple at optimal depth d
+    """
+    size = len(goal_board)
+    goal = tuple(cell for row in goal_board for cell in row)
+    layers = _LAYER_CACHE.setdefault(goal, [[goal]])
+    if len(layers) > max_depth or not layers[-1]:
+        return layers[:max_depth + 1]
+
+    seen = set()
+    for layer in layers[-2:]:
+        seen.update(layer)
+
+    while len(layers) <= max_depth:
+        next_layer = []
+        for state in layers[-1]:
+            blank = state.index(0)
+            row, col = divmod(blank, size)
+            for dr, dc in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+                r, c = row + dr, col + dc
+                if 0 <= r < size and 0 <= c < size:
+                    board = list(state)
+                    board[blank], board[r * size + c] = board[r * size + c], 0
+                    board = tuple(board)
+                    if board not in seen:
+                        seen.add(board)
+                        next_layer.append(board)
+        # Layer d only neighbours layers d-1 and d+1, so older layers can leave `seen`
+        if len(layers) >= 2:
+            seen.difference_update(layers[-2])
+        if not next_layer:
+            layers.append([])
+            break
+        layers.append(next_layer)
+
+    return [layer for layer in layers[:max_depth + 1] if layer]
+
+def to_board(state, size):
+    """Convert a flat tuple to a list-of-rows board"""
+    return [list(state[i:i + size]) for i in range(0, size * size, size)]
+
+def random_solvable_board(rng=random, goal_board=GOAL_BOARD):
+    """
+    Uniformly random board that can reach the goal
+    :param rng: random.Random instance (or the random module)
+    :param goal_board: Goal board configuration
+    :return: Board (list of rows)
+    """
+    size = len(goal_board)
+    tiles = [cell for row in goal_board for cell in row]
+
+    while True:
+        rng.shuffle(tiles)
+        board = to_board(tiles, size)
+        if is_solvable(board, goal_board):
+            return board
+
+def boards_at_depth(depth, count, rng=random, goal_board=GOAL_BOARD):
+    """
+    Boards whose optimal solution length is exactly `depth`
+    :param depth: Optimal solution length
+    :param count: Number of distinct boards wanted
+    :param rng: random.Random instance (or the random module)
+    :return: List of boards (fewer than `count` if the layer is smaller)
+    """
+    layers = depth_layers(goal_board, depth)
+    if depth >= len(layers):
+        return []
+    layer = layers[depth]
+    return [to_board(state, len(goal_board)) for state in rng.sample(layer, min(count, len(layer)))]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a packed 8-Puzzle instance corpus")
+    parser.add_argument("output", help="Corpus file to write")
+    parser.add_argument("--count", type=int, default=1000, help="Instances (per depth with --depths)")
+    parser.add_argument("--depths", nargs="+", type=int, default=None,
+                        help="Exact optimal depths; uniformly random boards when omitted")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    boards, depths = [], []
+
+    if args.depths:
+        for depth in args.depths:
+            layer_boards = boards_at_depth(depth, args.count, rng)
+            boards.extend(layer_boards)
+            depths.extend([depth] * len(layer_boards))
+    else:
+        boards = [random_solvable_board(rng) for _ in range(args.count)]
+        depths = None
+
+    write_corpus(args.output, boards, GOAL_BOARD, depths)
+    print(f"✓ {len(boards):,} instances written to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -37,53 +37,85 @@ def misplaced_tiles(state, goal_board):
                 count += 1
     return count
 
+def _tiles_leaving_line(targets):
+    """
+    Fewest tiles that must leave a line so the rest are in goal order
+    :param targets: Goal positions, along the line, of the tiles that belong in it
+    :return: len(targets) minus the longest increasing subsequence
+    """
+    longest = [1] * len(targets)
+    for k in range(len(targets)):
+        for l in range(k):
+            if targets[l] < targets[k]:
+                longest[k] = max(longest[k], longest[l] + 1)
+    return len(targets) - max(longest, default=0)
+
 def linear_conflict(state, goal_board):
     """
     Calculate linear conflict heuristic (Manhattan + conflicts)
+    Each tile that must leave its goal row or column to let the others pass
+    costs at least 2 extra moves, so the estimate stays admissible
     """
     # Start with Manhattan distance
     distance = manhattan_distance(state, goal_board)
     
+    goal_positions = {}
+    for i in range(3):
+        for j in range(3):
+            goal_positions[goal_board[i][j]] = (i, j)
+    
     # Add linear conflicts in rows
     for i in range(3):
-        row_tiles = []
+        row_targets = []
         for j in range(3):
             tile = state.board[i][j]
-            if tile != 0:
-                goal_i, goal_j = None, None
-                for x in range(3):
-                    for y in range(3):
-                        if goal_board[x][y] == tile:
-                            goal_i, goal_j = x, y
-                            break
-                if goal_i == i:  # Tile belongs in this row
-                    row_tiles.append((tile, goal_j))
-        
-        # Check for conflicts
-        for k in range(len(row_tiles)):
-            for l in range(k + 1, len(row_tiles)):
-                if row_tiles[k][1] > row_tiles[l][1]:
-                    distance += 2  # Each conflict adds 2
+            if tile != 0 and goal_positions[tile][0] == i:  # Tile belongs in this row
+                row_targets.append(goal_positions[tile][1])
+        distance += 2 * _tiles_leaving_line(row_targets)
     
     # Add linear conflicts in columns
     for j in range(3):
-        col_tiles = []
+        col_targets = []
         for i in range(3):
             tile = state.board[i][j]
-            if tile != 0:
-                goal_i, goal_j = None, None
-                for x in range(3):
-                    for y in range(3):
-                        if goal_board[x][y] == tile:
-                            goal_i, goal_j = x, y
-                            break
-                if goal_j == j:  # Tile belongs in this column
-                    col_tiles.append((tile, goal_i))
-        
-        # Check for conflicts
-        for k in range(len(col_tiles)):
-            for l in range(k + 1, len(col_tiles)):
-                if col_tiles[k][1] > col_tiles[l][1]:
-                    distance += 2
+            if tile != 0 and goal_positions[tile][1] == j:  # Tile belongs in this column
+                col_targets.append(goal_positions[tile][0])
+        distance += 2 * _tiles_leaving_line(col_targets)
     
     return distance
+
+# goal tuple -> WalkingDistance instance (tables are loaded on first use)
+_WALKING_DISTANCE = {}
+
+def walking_distance(state, goal_board):
+    """
+    Calculate walking distance heuristic (vertical + horizontal, from precomputed tables)
+    :param state: Current PuzzleState
+    :param goal_board: Goal board configuration
+    :return: Walking distance
+    """
+    key = tuple(map(tuple, goal_board))
+    heuristic = _WALKING_DISTANCE.get(key)
+    if heuristic is None:
+        from utils.walking_distance import WalkingDistance
+        heuristic = _WALKING_DISTANCE[key] = WalkingDistance(goal_board)
+    return heuristic(state.board)
+
+HEURISTICS = {
+    'manhattan': manhattan_distance,
+    'misplaced': misplaced_tiles,
+    'linear_conflict': linear_conflict,
+    'walking_distance': walking_distance
+}
+
+def get_heuristic(name, goal_board):
+    """
+    Bind a named heuristic to a goal board
+    :param name: Key of HEURISTICS
+    :param goal_board: Goal board configuration
+    :return: Function of a PuzzleState
+    """
+    if name not in HEURISTICS:
+        raise ValueError(f"Unknown heuristic '{name}' (choose from {', '.join(HEURISTICS)})")
+    func = HEURISTICS[name]
+    return lambda state: func(state, goal_board)
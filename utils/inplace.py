@@ -0,0 +1,83 @@
+"""
+In-place make/unmake move engine for depth-first solvers
+
+A single flat board is mutated by apply() and restored by undo(), so a
+depth-first search needs no per-successor PuzzleState or board copy. The move
+that would reverse the previous one is never generated.
+"""
+
+MOVE_NAMES = ('Up', 'Down', 'Left', 'Right')
+INVERSE = (1, 0, 3, 2)
+_DELTAS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_NEIGHBOR_TABLES = {}
+
+def neighbor_table(width):
+    """
+    Legal blank moves per blank index, in Up/Down/Left/Right order
+    :return: Tuple indexed by blank position of tuples (move_index, target_index)
+    """
+    table = _NEIGHBOR_TABLES.get(width)
+    if table is None:
+        rows = []
+        for blank in range(width * width):
+            i, j = divmod(blank, width)
+            rows.append(tuple((m, (i + di) * width + (j + dj))
+                              for m, (di, dj) in enumerate(_DELTAS)
+                              if 0 <= i + di < width and 0 <= j + dj < width))
+        table = _NEIGHBOR_TABLES[width] = tuple(rows)
+    return table
+
+class MutableBoard:
+    """Flat, mutable puzzle board with a move stack"""
+
+    def __init__(self, board):
+        self.width = len(board)
+        self.cells = [cell for row in board for cell in row]
+        self.blank = self.cells.index(0)
+        self.moves = []  # stack of (move_index, previous blank index)
+        self.table = neighbor_table(self.width)
+
+    def successors(self):
+        """Legal (move_index, target) pairs, excluding the inverse of the last move"""
+        if not self.moves:
+            return self.table[self.blank]
+        inverse = INVERSE[self.moves[-1][0]]
+        return [move for move in self.table[self.blank] if move[0] != inverse]
+
+    def apply(self, move_index, target):
+        """Slide the tile at `target` into the blank"""
+        cells = self.cells
+        cells[self.blank] = cells[target]
+        cells[target] = 0
+        self.moves.append((move_index, self.blank))
+        self.blank = target
+
+    def undo(self):
+        """Revert the most recent apply()"""
+        _, previous = self.moves.pop()
+        cells = self.cells
+        cells[self.blank] = cells[previous]
+        cells[previous] = 0
+        self.blank = previous
+
+    def key(self):
+        """Hashable snapshot of the board"""
+        return tuple(self.cells)
+
+    def depth(self):
+        return len(self.moves)
+
+    def path(self, start_board):
+        """
+        Moves taken so far in get_path() format
+        :return: List of (move_name, board_after_move) tuples
+        """
+        replay = MutableBoard(start_board)
+        path = []
+        for move_index, _ in self.moves:
+            target = next(t for m, t in replay.table[replay.blank] if m == move_index)
+            replay.apply(move_index, target)
+            cells = replay.cells
+            path.append((MOVE_NAMES[move_index],
+                         [cells[i:i + self.width] for i in range(0, len(cells), self.width)]))
+        return path
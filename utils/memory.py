@@ -0,0 +1,79 @@
+"""
+Peak-memory accounting for solver runs
+
+Modes:
+    'full' - tracemalloc peak plus peak RSS delta; the solver runs twice, untraced for
+             time_taken and then traced for the peak, because tracing slows Python code
+             about 3x
+    'rss'  - peak RSS delta only, near-zero overhead for production runs
+    'off'  - no memory measurement
+"""
+
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MEMORY_MODES = ('full', 'rss', 'off')
+
+def peak_rss_bytes():
+    """Peak resident set size of this process so far (None if unavailable)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+def measure_run(func, *args, memory_mode='full', **kwargs):
+    """
+    Run a solver and add timing and memory metrics to its result dict
+    :param func: Solver function returning a result dict
+    :param memory_mode: 'full', 'rss' or 'off'
+    :return: The solver result with time_taken (always from an untraced run),
+             peak_memory_bytes, peak_rss_delta_bytes and bytes_per_node added
+    """
+    if memory_mode not in MEMORY_MODES:
+        raise ValueError(f"memory_mode must be one of {MEMORY_MODES}")
+
+    rss_before = peak_rss_bytes() if memory_mode != 'off' else None
+    tracemalloc = random = None
+    if memory_mode == 'full':
+        # deferred: tracemalloc pulls in fnmatch/re/pickle, a large share of cold start
+        import random
+        import tracemalloc
+        random_state = random.getstate()
+
+    start_time = time.perf_counter()
+    result = func(*args, **kwargs)
+    result["time_taken"] = time.perf_counter() - start_time
+
+    if rss_before is not None:
+        # ru_maxrss only grows, so this is how far the run pushed the process peak
+        result["peak_rss_delta_bytes"] = peak_rss_bytes() - rss_before
+
+    if tracemalloc is not None:
+        if tracemalloc.is_tracing():
+            # An outer trace (e.g. a profiler) slowed the timed run; say so instead of
+            # reporting the time as clean, and leave the peak to the outer tracer
+            result["time_traced"] = True
+        else:
+            # Replay with the same random state so stochastic solvers repeat the timed run
+            after_state = random.getstate()
+            random.setstate(random_state)
+            tracemalloc.start()
+            try:
+                func(*args, **kwargs)
+                _, result["peak_memory_bytes"] = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+                random.setstate(after_state)
+
+    nodes = result.get("nodes_expanded")
+    peak = result.get("peak_memory_bytes", result.get("peak_rss_delta_bytes"))
+    if isinstance(nodes, int) and nodes > 0 and peak is not None:
+        result["bytes_per_node"] = peak / nodes
+
+    return result
@@ -88,3 +88,16 @@ def apply_move(board, move):
         new_board[i][j], new_board[i][j+1] = new_board[i][j+1], new_board[i][j]
     
     return new_board
+
+def add_quality(result, optimal_length):
+    """
+    Record path length relative to the optimal length, when it is known
+    :param result: Solver result dictionary
+    :param optimal_length: Optimal solution length, or None
+    :return: The same dictionary
+    """
+    if optimal_length is not None:
+        result["optimal_length"] = optimal_length
+        if result.get("solution_found"):
+            result["suboptimality"] = result["path_length"] / optimal_length if optimal_length else 1.0
+    return result
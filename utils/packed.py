@@ -0,0 +1,34 @@
+"""
+Helpers for boards packed into 64-bit integers (utils.corpus.pack_board)
+
+Cell i of the board occupies bits 4i..4i+3, so sliding the tile at `target`
+into the blank at `blank` is the arithmetic
+    state + (tile << 4 * blank) - (tile << 4 * target)
+"""
+
+def blank_index(state):
+    """Cell index of the blank in a packed state"""
+    position = 0
+    while (state >> (4 * position)) & 0xF:
+        position += 1
+    return position
+
+def manhattan_table(goal_board):
+    """
+    Manhattan distance per tile and cell
+    :return: dist[tile][position], the distance of `tile` at `position` from its goal cell
+    """
+    width = len(goal_board)
+    goal_flat = [tile for row in goal_board for tile in row]
+    table = [[0] * (width * width) for _ in range(width * width)]
+    for goal_index, tile in enumerate(goal_flat):
+        if tile == 0:
+            continue
+        for position in range(width * width):
+            table[tile][position] = (abs(position // width - goal_index // width) +
+                                     abs(position % width - goal_index % width))
+    return table
+
+def packed_manhattan(state, cells, dist):
+    """Manhattan distance of a packed state from a manhattan_table()"""
+    return sum(dist[(state >> (4 * i)) & 0xF][i] for i in range(cells))
@@ -0,0 +1,92 @@
+"""
+Process-per-task scheduler with wall-clock timeouts
+
+Each task runs in its own process so a runaway task can be terminated
+without taking a pool worker (or the whole run) down with it.
+"""
+
+import multiprocessing as mp
+import os
+import time
+import traceback
+from multiprocessing.connection import wait
+
+def _task_entry(worker, args, conn):
+    """Child process body: run the task and send back its outcome"""
+    try:
+        conn.send(("ok", worker(*args)))
+    except BaseException:
+        conn.send(("error", traceback.format_exc()))
+    finally:
+        conn.close()
+
+def run_tasks(tasks, worker, workers=None, timeout=None, on_result=None):
+    """
+    Run tasks across processes, collecting results as they complete
+    :param tasks: List of (key, args) pairs; `worker(*args)` must be picklable
+    :param worker: Module-level function returning a picklable result
+    :param workers: Maximum concurrent processes (defaults to CPU count)
+    :param timeout: Per-task wall-clock limit in seconds (None for no limit)
+    :param on_result: Optional callback(key, status, value, elapsed) called on completion,
+                      where status is 'ok', 'error' or 'timeout'; returning True cancels
+                      every task still running or pending (recorded as 'cancelled')
+    :return: Dict of key -> (status, value, elapsed)
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    ctx = mp.get_context()
+    pending = list(tasks)
+    pending.reverse()
+    running = {}  # receiving connection -> (key, process, start time)
+    outcomes = {}
+
+    def finish(conn, status, value):
+        key, process, started = running.pop(conn)
+        elapsed = time.perf_counter() - started
+        if status in ("timeout", "cancelled"):
+            process.terminate()
+        process.join()
+        conn.close()
+        outcomes[key] = (status, value, elapsed)
+        if on_result is not None and status != "cancelled":
+            return on_result(key, status, value, elapsed)
+        return False
+
+    def cancel_all():
+        for conn in list(running):
+            finish(conn, "cancelled", None)
+        while pending:
+            key, _ = pending.pop()
+            outcomes[key] = ("cancelled", None, 0.0)
+
+    while pending or running:
+        while pending and len(running) < workers:
+            key, args = pending.pop()
+            receiver, sender = ctx.Pipe(duplex=False)
+            process = ctx.Process(target=_task_entry, args=(worker, args, sender), daemon=True)
+            process.start()
+            sender.close()
+            running[receiver] = (key, process, time.perf_counter())
+
+        if timeout is None:
+            wait_for = None
+        else:
+            now = time.perf_counter()
+            wait_for = max(0.0, min(started + timeout - now for _, _, started in running.values()))
+
+        for conn in wait(list(running), timeout=wait_for):
+            try:
+                status, value = conn.recv()
+            except EOFError:
+                status, value = "error", "worker exited without a result"
+            if finish(conn, status, value):
+                cancel_all()
+                return outcomes
+
+        if timeout is not None:
+            now = time.perf_counter()
+            for conn in [c for c, (_, _, started) in running.items() if now - started >= timeout]:
+                if finish(conn, "timeout", None):
+                    cancel_all()
+                    return outcomes
+
+    return outcomes
@@ -0,0 +1,172 @@
+"""
+Solution path post-optimizer
+
+Shortens the paths of non-optimal solvers (dfs, hill_climbing, the genetic
+algorithm) in three stages:
+    1. drop no-op moves (the blank pushed against a wall)
+    2. cut cycles: when a board repeats, every move since its first visit goes,
+       which also removes moves that are immediately inverted
+    3. shortcut windows: each segment of up to `window` moves is replaced by an
+       optimal one found with a depth-bounded bidirectional BFS
+"""
+
+from utils.corpus import pack_board, unpack_board
+from utils.inplace import MOVE_NAMES, INVERSE, neighbor_table
+from utils.packed import blank_index
+
+def _moves_of(path):
+    """Move names of a path in any solver's format: names or (move, board) tuples"""
+    return [step[0] if isinstance(step, (tuple, list)) else step for step in path]
+
+def _neighbors(state, table):
+    blank = blank_index(state)
+    for move, target in table[blank]:
+        tile = (state >> (4 * target)) & 0xF
+        yield move, state + (tile << (4 * blank)) - (tile << (4 * target))
+
+def shortest_between(source, target, max_depth, table):
+    """
+    Optimal move sequence between two packed states, if one of at most `max_depth` moves exists
+    Bidirectional breadth-first search, expanding the smaller frontier first
+    :return: List of (move index, state after move), or None
+    """
+    if source == target:
+        return []
+
+    forward = {source: None}   # state -> (previous state, move)
+    backward = {target: None}  # state -> (next state, move from state to next)
+    depth_to_target = {target: 0}
+    forward_layer, backward_layer = [source], [target]
+    forward_depth = backward_depth = 0
+
+    while forward_layer and backward_layer and forward_depth + backward_depth < max_depth:
+        if len(forward_layer) <= len(backward_layer):
+            next_layer = []
+            for state in forward_layer:
+                for move, child in _neighbors(state, table):
+                    if child not in forward:
+                        forward[child] = (state, move)
+                        next_layer.append(child)
+            forward_layer = next_layer
+            forward_depth += 1
+            meetings = [s for s in forward_layer if s in backward]
+        else:
+            next_layer = []
+            for state in backward_layer:
+                for move, child in _neighbors(state, table):
+                    if child not in backward:
+                        backward[child] = (state, INVERSE[move])
+                        depth_to_target[child] = backward_depth + 1
+                        next_layer.append(child)
+            backward_layer = next_layer
+            backward_depth += 1
+            meetings = [s for s in backward_layer if s in forward]
+
+        if meetings:
+            # Every meeting in a forward layer is equally deep on that side; pick the shortest overall
+            meeting = min(meetings, key=lambda s: depth_to_target[s])
+            head = []
+            state = meeting
+            while forward[state] is not None:
+                previous, move = forward[state]
+                head.append((move, state))
+                state = previous
+            head.reverse()
+            tail = []
+            state = meeting
+            while backward[state] is not None:
+                following, move = backward[state]
+                tail.append((move, following))
+                state = following
+            return head + tail
+    return None
+
+def optimize_path(start_board, path, window=20):
+    """
+    Shorten a solution path
+    :param start_board: Starting board configuration
+    :param path: Path as move names or (move, board) tuples
+    :param window: Longest segment re-solved optimally (larger is slower and better)
+    :return: Dict with path ((move, board_after) tuples), original_length, optimized_length,
+             no_ops_removed, cycle_moves_removed and shortcut_moves_saved
+    """
+    width = len(start_board)
+    table = neighbor_table(width)
+    moves = _moves_of(path)
+
+    # 1. Replay, skipping moves the blank cannot make
+    states = [pack_board(start_board)]
+    applied = []
+    for name in moves:
+        move = MOVE_NAMES.index(name)
+        child = next((s for m, s in _neighbors(states[-1], table) if m == move), None)
+        if child is not None:
+            applied.append(move)
+            states.append(child)
+    no_ops = len(moves) - len(applied)
+
+    # 2. Cut cycles with a state -> index map
+    kept_states = [states[0]]
+    kept_moves = []
+    index_of = {states[0]: 0}
+    for move, state in zip(applied, states[1:]):
+        if state in index_of:
+            cut = index_of[state]
+            for dropped in kept_states[cut + 1:]:
+                del index_of[dropped]
+            del kept_states[cut + 1:]
+            del kept_moves[cut:]
+        else:
+            index_of[state] = len(kept_states)
+            kept_states.append(state)
+            kept_moves.append(move)
+    cycle_moves = len(applied) - len(kept_moves)
+
+    # 3. Replace each window with an optimal segment when that is shorter; a shortcut
+    #    can bring new shortcuts within one window, so sweep until nothing improves
+    saved = 0
+    improved = True
+    while improved:
+        improved = False
+        i = 0
+        while i < len(kept_moves):
+            j = min(i + window, len(kept_moves))
+            segment = shortest_between(kept_states[i], kept_states[j], j - i - 1, table)
+            if segment is not None:
+                saved += (j - i) - len(segment)
+                kept_moves[i:j] = [move for move, _ in segment]
+                kept_states[i + 1:j + 1] = [state for _, state in segment]
+                improved = True
+            i += 1
+
+    return {
+        "path": [(MOVE_NAMES[move], unpack_board(state, width))
+                 for move, state in zip(kept_moves, kept_states[1:])],
+        "original_length": len(moves),
+        "optimized_length": len(kept_moves),
+        "no_ops_removed": no_ops,
+        "cycle_moves_removed": cycle_moves,
+        "shortcut_moves_saved": saved
+    }
+
+def optimize_result(result, start_board, window=20):
+    """
+    Post-optimize a solver result in place
+    Replaces path and path_length and records original_path_length and path_optimization
+    :return: The same dictionary
+    """
+    if not result.get("solution_found") or "path" not in result:
+        return result
+    optimized = optimize_path(start_board, result["path"], window)
+    result["original_path_length"] = result.get("path_length", optimized["original_length"])
+    result["path"] = optimized.pop("path")
+    result["path_length"] = optimized["optimized_length"]
+    result["path_optimization"] = optimized
+    return result
+
+def optimized_solve(solver, start_board, goal_board, window=20, **kwargs):
+    """
+    Run a solver and post-optimize its path
+    Use with functools.partial, e.g. partial(optimized_solve, dfs), to get a solver function
+    """
+    return optimize_result(solver(start_board, goal_board, **kwargs), start_board, window)
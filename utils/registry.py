@@ -0,0 +1,155 @@
+"""
+Solver registry
+
+One table of every solver: display name -> entry point (module and function),
+default options and whether its paths are guaranteed optimal. Modules are
+imported only when a solver is first requested, so a script that runs one
+algorithm pays only for that algorithm's imports.
+
+Solvers are returned as functools.partial objects rather than lambdas so they
+can be sent to worker processes and fingerprinted by utils.result_cache.
+"""
+
+import importlib
+from collections.abc import Mapping
+from functools import partial
+
+# name -> entry point; 'wraps' names another solver passed as the first argument
+SOLVERS = {
+    "BFS": {"module": "bfs.bfs", "function": "bfs", "optimal": True},
+    "DFS": {"module": "dfs.dfs", "function": "dfs"},
+    "DFS (depth 40)": {"module": "dfs.dfs", "function": "dfs", "options": {"max_depth": 40}},
+    "UCS": {"module": "ucs.ucs", "function": "ucs", "optimal": True},
+    "IDS": {"module": "ids.ids", "function": "ids"},
+    "A* (Manhattan)": {"module": "astar.astar", "function": "astar_search",
+                       "options": {"heuristic": "manhattan"}, "optimal": True},
+    "A* (Misplaced)": {"module": "astar.astar", "function": "astar_search",
+                       "options": {"heuristic": "misplaced"}, "optimal": True},
+    "A* (Linear Conflict)": {"module": "astar.astar", "function": "astar_search",
+                             "options": {"heuristic": "linear_conflict"}, "optimal": True},
+    "A* (Walking Distance)": {"module": "astar.astar", "function": "astar_search",
+                              "options": {"heuristic": "walking_distance"}, "optimal": True},
+    "A* (EPEA*)": {"module": "astar.astar", "function": "astar_search",
+                   "options": {"heuristic": "manhattan", "partial_expansion": True}, "optimal": True},
+    "Frontier Search": {"module": "astar.frontier_search", "function": "frontier_search",
+                        "optimal": True},
+    "HDA*": {"module": "astar.hda_star", "function": "hda_star_search", "optimal": True},
+    "External BFS": {"module": "bfs.external_bfs", "function": "external_bfs", "optimal": True},
+    "Greedy Best-First": {"module": "greedy.greedy", "function": "greedy_best_first_search"},
+    "Beam Search (w=50)": {"module": "greedy.greedy", "function": "beam_search",
+                           "options": {"beam_width": 50}},
+    "Hill Climbing": {"module": "hill_climbing.hill_climbing", "function": "hill_climbing"},
+    "Hill Climbing (Restart)": {"module": "hill_climbing.hill_climbing",
+                                "function": "hill_climbing_with_restart"},
+    "Genetic Algorithm": {"module": "genetic_algorithm.genetic",
+                          "function": "genetic_algorithm_search"},
+    "DFS (Optimized Path)": {"module": "utils.path_optimizer", "function": "optimized_solve",
+                             "wraps": "DFS"},
+    "GA (Optimized Path)": {"module": "utils.path_optimizer", "function": "optimized_solve",
+                            "wraps": "Genetic Algorithm"}
+}
+
+# Solvers run by run_analysis.py, in table order
+ANALYSIS_SOLVERS = [
+    "BFS", "DFS", "UCS", "IDS", "A* (Manhattan)", "A* (Misplaced)", "Greedy Best-First",
+    "Beam Search (w=50)", "Hill Climbing", "Hill Climbing (Restart)", "Genetic Algorithm",
+    "DFS (Optimized Path)", "GA (Optimized Path)"
+]
+
+# Solvers timed by benchmark/benchmark.py
+BENCHMARK_SOLVERS = [
+    "BFS", "DFS", "UCS", "IDS", "A* (Manhattan)", "A* (Misplaced)", "A* (Walking Distance)",
+    "Hill Climbing", "Hill Climbing (Restart)", "Genetic Algorithm"
+]
+
+OPTIMAL_SOLVERS = frozenset(name for name, spec in SOLVERS.items() if spec.get("optimal"))
+
+def _spec(name):
+    try:
+        return SOLVERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown solver '{name}'. Available: {', '.join(SOLVERS)}") from None
+
+def default_options(name):
+    """Default keyword options of a registered solver"""
+    return dict(_spec(name).get("options", {}))
+
+def get_solver(name, **options):
+    """
+    Import a registered solver on first use
+    :param name: Registry name, e.g. 'A* (Manhattan)'
+    :param options: Keyword options overriding the registered defaults
+    :return: Callable solver(start_board, goal_board) (a functools.partial)
+    """
+    spec = _spec(name)
+    func = getattr(importlib.import_module(spec["module"]), spec["function"])
+    args = (get_solver(spec["wraps"]),) if "wraps" in spec else ()
+    return partial(func, *args, **{**spec.get("options", {}), **options})
+
+def accepted_options(name):
+    """
+    Keyword options a registered solver accepts
+    Options of a wrapping solver's **kwargs are those of the solver it wraps
+    :return: Set of option names (start_board, goal_board and the wrapped solver excluded)
+    """
+    import inspect
+
+    spec = _spec(name)
+    func = getattr(importlib.import_module(spec["module"]), spec["function"])
+    params = list(inspect.signature(func).parameters.values())
+    skip = 3 if "wraps" in spec else 2
+    options = {p.name for p in params[skip:]
+               if p.kind in (p.POSITIONAL_OR_KEYWORD, p.KEYWORD_ONLY)}
+    if "wraps" in spec and any(p.kind is p.VAR_KEYWORD for p in params):
+        options |= accepted_options(spec["wraps"])
+    return options
+
+def check_options(name, options):
+    """Raise ValueError if a registered solver does not accept every option in `options`"""
+    unknown = sorted(set(options) - accepted_options(name))
+    if unknown:
+        raise ValueError(f"{name} does not accept option(s) {', '.join(unknown)}; "
+                         f"accepted: {', '.join(sorted(accepted_options(name))) or 'none'}")
+
+def parse_options(pairs):
+    """
+    Parse command-line 'key=value' options
+    Values are Python literals where possible (40, 0.5, True, 'x'), otherwise strings
+    :return: Dict of option -> value
+    """
+    if not pairs:
+        return {}
+    import ast
+
+    options = {}
+    for pair in pairs:
+        key, sep, value = pair.partition("=")
+        if not sep or not key:
+            raise ValueError(f"Option '{pair}' is not of the form key=value")
+        try:
+            options[key] = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            options[key] = value
+    return options
+
+class SolverSet(Mapping):
+    """Read-only mapping of name -> solver that imports each solver on first access"""
+
+    def __init__(self, names=None):
+        self.names = list(names if names is not None else SOLVERS)
+        for name in self.names:
+            _spec(name)
+        self._loaded = {}
+
+    def __getitem__(self, name):
+        if name not in self.names:
+            raise KeyError(name)
+        if name not in self._loaded:
+            self._loaded[name] = get_solver(name)
+        return self._loaded[name]
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __len__(self):
+        return len(self.names)
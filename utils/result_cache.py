@@ -0,0 +1,113 @@
+"""
+On-disk cache of analysis cells keyed by their inputs and solver code
+
+A cell is reused only when the algorithm, instance, parameters and the source
+of both the solver's module and every file under utils/ are unchanged.
+"""
+
+import functools
+import hashlib
+import importlib.util
+import json
+import os
+
+UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+@functools.lru_cache(maxsize=None)
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def code_fingerprint(*module_names):
+    """
+    Hash of the solver modules' source plus every utils/*.py file
+    :param module_names: Dotted module names, e.g. 'astar.astar'
+    :return: Hex digest
+    """
+    digest = hashlib.sha256()
+    for module_name in sorted(set(module_names)):
+        spec = importlib.util.find_spec(module_name)
+        if spec is not None and spec.origin and os.path.isfile(spec.origin):
+            digest.update(module_name.encode())
+            digest.update(_file_digest(spec.origin).encode())
+    for name in sorted(os.listdir(UTILS_DIR)):
+        if name.endswith('.py'):
+            digest.update(name.encode())
+            digest.update(_file_digest(os.path.join(UTILS_DIR, name)).encode())
+    return digest.hexdigest()
+
+def describe_solver(func):
+    """
+    Stable description of a solver function or functools.partial
+    Callable arguments (a solver wrapped by another, e.g. optimized_solve) are
+    described recursively rather than by their repr, which embeds a memory address.
+    :return: (module names the solver depends on, parameters)
+    """
+    params = {}
+    args = []
+    while isinstance(func, functools.partial):
+        params = {**func.keywords, **params}
+        args = list(func.args) + args
+        func = func.func
+
+    modules = [func.__module__]
+    params["function"] = f"{func.__module__}.{func.__qualname__}"
+    described = []
+    for arg in args:
+        if callable(arg):
+            arg_modules, arg_params = describe_solver(arg)
+            modules.extend(arg_modules)
+            described.append(arg_params)
+        else:
+            described.append(arg)
+    if described:
+        params["args"] = described
+    return modules, params
+
+def cell_key(algorithm, func, instance_name, start_board, goal_board, extra=None):
+    """Cache key of one algorithm x instance cell"""
+    module_names, params = describe_solver(func)
+    payload = json.dumps({
+        "algorithm": algorithm,
+        "instance": instance_name,
+        "start": start_board,
+        "goal": goal_board,
+        "params": params,
+        "extra": extra,
+        "code": code_fingerprint(*module_names)
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+class ResultCache:
+    """JSON file of cell key -> solver result"""
+
+    def __init__(self, path='report/analysis_cache.json'):
+        self.path = path
+        self.entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                self.entries = {}
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        return dict(entry["result"]) if entry else None
+
+    def put(self, key, algorithm, instance_name, result):
+        # Drop entries for the same cell made with older code or inputs
+        for stale in [k for k, e in self.entries.items()
+                      if e["algorithm"] == algorithm and e["instance"] == instance_name]:
+            del self.entries[stale]
+        self.entries[key] = {"algorithm": algorithm, "instance": instance_name, "result": result}
+
+    def save(self):
+        """Write the cache atomically"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f)
+        os.replace(temp_path, self.path)
@@ -0,0 +1,81 @@
+"""
+Solvability check shared by every solver and batch entry point
+
+A board can reach a goal iff the permutation taking one to the other has the
+right parity:
+    odd widths:  inversions of the tiles (in goal order) are even
+    even widths: inversions plus the blank's row distance to its goal row are even
+"""
+
+# Below this many tiles the quadratic count beats the merge sort's overhead
+_SMALL = 32
+
+def count_inversions(sequence):
+    """
+    Number of pairs i < j with sequence[i] > sequence[j]
+    O(n log n) merge-sort count (quadratic loop for short sequences)
+    """
+    n = len(sequence)
+    if n < _SMALL:
+        return sum(1 for i in range(n) for j in range(i + 1, n) if sequence[i] > sequence[j])
+
+    values = list(sequence)
+    buffer = [0] * n
+    inversions = 0
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if values[i] <= values[j]:
+                    buffer[k] = values[i]
+                    i += 1
+                else:
+                    buffer[k] = values[j]
+                    inversions += mid - i
+                    j += 1
+                k += 1
+            buffer[k:k + mid - i] = values[i:mid]
+            k += mid - i
+            buffer[k:k + hi - j] = values[j:hi]
+        values, buffer = buffer, values
+        width *= 2
+    return inversions
+
+def default_goal(width):
+    """Tiles 1..n-1 in row-major order with the blank last"""
+    cells = list(range(1, width * width)) + [0]
+    return [cells[i:i + width] for i in range(0, width * width, width)]
+
+def is_solvable(board, goal_board=None):
+    """
+    Check whether `board` can reach `goal_board`
+    :param board: Board (list of rows), any square width
+    :param goal_board: Goal board configuration (default: 1..n-1 with the blank last)
+    :return: True if solvable
+    """
+    width = len(board)
+    if goal_board is None:
+        goal_board = default_goal(width)
+
+    flat = [tile for row in board for tile in row]
+    goal_flat = [tile for row in goal_board for tile in row]
+    if len(goal_board) != width or sorted(flat) != sorted(goal_flat) or 0 not in flat:
+        return False
+
+    # Rank every tile by its position in the goal, then count inversions of the board's order
+    rank = {tile: index for index, tile in enumerate(t for t in goal_flat if t != 0)}
+    inversions = count_inversions([rank[tile] for tile in flat if tile != 0])
+
+    if width % 2 == 1:
+        return inversions % 2 == 0
+
+    blank_row = flat.index(0) // width
+    goal_blank_row = goal_flat.index(0) // width
+    return (inversions + abs(blank_row - goal_blank_row)) % 2 == 0
+
+def unsolvable_result():
+    """Result dict returned by solvers that reject an unsolvable start board"""
+    return {"solution_found": False, "nodes_expanded": 0, "unsolvable": True}
@@ -0,0 +1,112 @@
+"""
+Opt-in search event tracing for the 8-Puzzle solvers
+
+Every solver takes an optional `tracer` argument. When it is None (the default)
+the only cost is one `is not None` check per expansion.
+"""
+
+import time
+
+class SearchTracer:
+    """
+    Counts search events and samples the frontier over time
+    :param sample_interval: Record a time-series sample every N expansions
+    """
+
+    def __init__(self, sample_interval=100, name="search"):
+        self.sample_interval = sample_interval
+        self.name = name
+        self.nodes_generated = 0
+        self.nodes_expanded = 0
+        self.duplicates = 0
+        self.decrease_keys = 0
+        self.peak_open = 0
+        self.peak_closed = 0
+        self.samples = []  # (seconds since start, expanded, open size, closed size, f bound)
+        self.start_time = None
+        self.end_time = None
+
+    def start(self):
+        """Mark the beginning of a search"""
+        self.start_time = time.perf_counter()
+
+    def finish(self):
+        """Mark the end of a search and take a final sample"""
+        self.end_time = time.perf_counter()
+        if self.samples:
+            last = self.samples[-1]
+            self.samples.append((self.end_time - self.start_time, self.nodes_expanded,
+                                 last[2], last[3], last[4]))
+
+    def on_expand(self, open_size, closed_size, f_bound=None):
+        """Record one expansion and the frontier size at that moment"""
+        self.nodes_expanded += 1
+        if open_size > self.peak_open:
+            self.peak_open = open_size
+        if closed_size > self.peak_closed:
+            self.peak_closed = closed_size
+        if self.nodes_expanded % self.sample_interval == 1 or self.sample_interval == 1:
+            self.samples.append((time.perf_counter() - self.start_time, self.nodes_expanded,
+                                 open_size, closed_size, f_bound))
+
+    def on_generate(self, count=1):
+        self.nodes_generated += count
+
+    def on_duplicate(self, count=1):
+        self.duplicates += count
+
+    def on_decrease_key(self):
+        self.decrease_keys += 1
+
+    def summary(self):
+        """Counters as a plain dictionary"""
+        end = self.end_time if self.end_time is not None else time.perf_counter()
+        return {
+            "nodes_generated": self.nodes_generated,
+            "nodes_expanded": self.nodes_expanded,
+            "duplicates": self.duplicates,
+            "decrease_keys": self.decrease_keys,
+            "peak_open": self.peak_open,
+            "peak_closed": self.peak_closed,
+            "samples": len(self.samples),
+            "duration": end - self.start_time if self.start_time is not None else 0.0
+        }
+
+    def to_chrome_trace(self):
+        """
+        Chrome trace-event format (load in chrome://tracing or Perfetto)
+        :return: Dictionary ready for json.dump
+        """
+        events = [{"name": "process_name", "ph": "M", "pid": 1, "tid": 1,
+                   "args": {"name": self.name}}]
+
+        summary = self.summary()
+        events.append({"name": self.name, "cat": "search", "ph": "X", "pid": 1, "tid": 1,
+                       "ts": 0, "dur": summary["duration"] * 1e6, "args": summary})
+
+        for seconds, expanded, open_size, closed_size, f_bound in self.samples:
+            ts = seconds * 1e6
+            events.append({"name": "frontier", "ph": "C", "pid": 1, "tid": 1, "ts": ts,
+                           "args": {"open": open_size, "closed": closed_size}})
+            events.append({"name": "expanded", "ph": "C", "pid": 1, "tid": 1, "ts": ts,
+                           "args": {"expanded": expanded}})
+            if f_bound is not None:
+                events.append({"name": "f_bound", "ph": "C", "pid": 1, "tid": 1, "ts": ts,
+                               "args": {"f": f_bound}})
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def save_chrome_trace(self, path):
+        """Write the Chrome trace-event JSON to a file"""
+        import json
+
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f)
+        return path
+
+def attach_trace(result, tracer):
+    """Finish a tracer (if any) and add its summary to a solver result"""
+    if tracer is not None:
+        tracer.finish()
+        result["trace"] = tracer.summary()
+    return result
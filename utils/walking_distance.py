@@ -0,0 +1,121 @@
+"""
+Walking-distance tables
+
+The vertical walking distance abstracts a board to a width x width matrix
+counts[r][g] (tiles in row r whose goal row is g) plus the blank's row; only
+vertical moves change it. A BFS from the goal abstraction over this space gives
+the exact number of vertical moves needed to sort every tile into its goal
+row, accounting for tiles that block each other. The horizontal table is the
+same with columns. Both are admissible and their sum dominates Manhattan.
+
+Tables depend only on the board width and the blank's goal row (or column),
+so they are generated once and cached on disk as JSON.
+"""
+
+import json
+import os
+from collections import deque
+
+TABLE_DIR = os.environ.get("PUZZLE_TABLE_DIR",
+                           os.path.join(os.path.dirname(os.path.abspath(__file__)), "tables"))
+
+_TABLES = {}
+
+def _encode(counts, blank_line):
+    return "".join(map(str, counts)) + str(blank_line)
+
+def build_table(width, blank_goal_line):
+    """
+    BFS over the abstract row-distribution space
+    :param width: Board width
+    :param blank_goal_line: Row (or column) of the blank in the goal board
+    :return: Dict of encoded abstraction -> walking distance
+    """
+    # Flattened counts matrix: index r * width + g
+    goal = [0] * (width * width)
+    for line in range(width):
+        goal[line * width + line] = width - (1 if line == blank_goal_line else 0)
+
+    start = (tuple(goal), blank_goal_line)
+    table = {_encode(*start): 0}
+    frontier = deque([start])
+    while frontier:
+        counts, blank = frontier.popleft()
+        distance = table[_encode(counts, blank)]
+        for neighbor in (blank - 1, blank + 1):
+            if not 0 <= neighbor < width:
+                continue
+            # Move any tile of the neighbouring line (grouped by goal line) into the blank's line
+            for goal_line in range(width):
+                if counts[neighbor * width + goal_line] == 0:
+                    continue
+                moved = list(counts)
+                moved[neighbor * width + goal_line] -= 1
+                moved[blank * width + goal_line] += 1
+                moved = tuple(moved)
+                key = _encode(moved, neighbor)
+                if key not in table:
+                    table[key] = distance + 1
+                    frontier.append((moved, neighbor))
+    return table
+
+def load_table(width, blank_goal_line):
+    """
+    Walking-distance table, from memory, the on-disk cache, or a fresh BFS
+    :return: Dict of encoded abstraction -> walking distance
+    """
+    cache_key = (width, blank_goal_line)
+    table = _TABLES.get(cache_key)
+    if table is not None:
+        return table
+
+    path = os.path.join(TABLE_DIR, f"walking_distance_{width}x{width}_{blank_goal_line}.json")
+    try:
+        with open(path, encoding='utf-8') as f:
+            table = json.load(f)
+    except (OSError, ValueError):
+        table = build_table(width, blank_goal_line)
+        try:
+            os.makedirs(TABLE_DIR, exist_ok=True)
+            temp_path = f"{path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(table, f, separators=(',', ':'))
+            os.replace(temp_path, path)
+        except OSError:
+            pass  # read-only checkout: keep the in-memory table
+
+    _TABLES[cache_key] = table
+    return table
+
+class WalkingDistance:
+    """Walking-distance heuristic bound to one goal board"""
+
+    def __init__(self, goal_board):
+        self.width = width = len(goal_board)
+        self.goal_row = {}
+        self.goal_col = {}
+        for i, row in enumerate(goal_board):
+            for j, tile in enumerate(row):
+                self.goal_row[tile] = i
+                self.goal_col[tile] = j
+        self.vertical = load_table(width, self.goal_row[0])
+        self.horizontal = load_table(width, self.goal_col[0])
+
+    def __call__(self, board):
+        """
+        Walking distance of a board (list of rows)
+        :return: Vertical plus horizontal walking distance
+        """
+        width = self.width
+        rows = [0] * (width * width)
+        cols = [0] * (width * width)
+        blank_row = blank_col = 0
+        for i, row in enumerate(board):
+            for j, tile in enumerate(row):
+                if tile == 0:
+                    blank_row, blank_col = i, j
+                else:
+                    rows[i * width + self.goal_row[tile]] += 1
+                    cols[j * width + self.goal_col[tile]] += 1
+        return (self.vertical[_encode(rows, blank_row)] +
+                self.horizontal[_encode(cols, blank_col)])